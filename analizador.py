@@ -2,65 +2,759 @@
 Módulo Analizador de Funciones Matemáticas
 Proporciona funcionalidades para analizar funciones matemáticas:
 - Dominio
-- Recorrido  
+- Recorrido
 - Intersecciones con los ejes
 - Evaluación de puntos
 """
 
 import sympy as sp
-from sympy import symbols, solve, diff, limit, oo, S
-from sympy.calculus.util import continuous_domain
+from sympy import symbols, solve, diff
 import re
 import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import numpy as np
+
+from asintotas import calcular_asintotas, recorrido_monotono
+from cache_analisis import clave_expresion
+from canonico import TABLA
+from dominio import describir_dominio, dominio_rapido
+from metricas import METRICAS, ejecutar_perfilado, estadisticas_lru
+from muestreo import MENSAJES_ERROR, evaluar_con_errores, muestrear_adaptativo, raices_reales
+from parseador import parsear
+from planificador import (ESTRATEGIA_EXACTA, ESTRATEGIA_NUMERICA, ESTRATEGIA_SIMBOLICA,
+                          PerfilExpresion, forzadas_de_entorno, leer_forzadas, planificar)
+from raices import buscar_raices
+from recorrido import describir_recorrido
+from trabajadores import ESTADO_OK
+
+# Etapas del análisis que se calculan bajo demanda
+ETAPAS = ('dominio', 'recorrido', 'intersecciones', 'derivada')
+
+# Etapas simbólicas costosas que se ejecutan bajo presupuesto si hay trabajadores
+ETAPAS_CON_PRESUPUESTO = ('dominio', 'recorrido', 'intersecciones')
+
+# Etapas que no dependen de cómo se escribió la función: las formas equivalentes
+# las comparten (la derivada no, su texto sigue a la expresión escrita)
+ETAPAS_COMPARTIDAS = ('dominio', 'recorrido', 'intersecciones')
+
+# Ventana donde se buscan raíces numéricas (la misma que se grafica)
+VENTANA_NUMERICA = (-10, 10)
+METODO_SIMBOLICO = "simbólico (solve)"
+METODO_NUMERICO = "numérico en [-10, 10] (Brent)"
+METODO_EXACTO = "exacto (raíces reales del polinomio)"
+
+# Puntos de la malla de las estimaciones numéricas de dominio y recorrido
+PUNTOS_ESTIMACION = 4001
+
+# Un valor junto a un polo que supera tantas veces la escala típica se toma como ±∞
+FACTOR_NO_ACOTADO = 50
+
+# Secciones del desarrollo computacional, en el orden en que se muestran
+SECCIONES_DESARROLLO = ('encabezado',) + ETAPAS
+
+# Resultados de funciones recientes que se conservan en memoria
+MAX_RESULTADOS_RECIENTES = 32
+
+# Marca de etapa aún no calculada
+_PENDIENTE = object()
+
+
+# ln como palabra suelta (no dentro de otro nombre)
+_LN = re.compile(r'\bln\b')
+
+
+def normalizar_expresion(expresion):
+    """
+    Reemplaza las notaciones comunes (^, ², ³, ln) por la sintaxis de SymPy.
+    
+    Solo se usa para el texto que se muestra (títulos y desarrollo); la
+    conversión la hace el parseador, que entiende la notación original.
+    
+    Args:
+        expresion (str): Expresión matemática como string
+    
+    Returns:
+        str: expresión con la sintaxis de SymPy
+    """
+    expresion = expresion.strip()
+    expresion = expresion.replace('^', '**')
+    expresion = expresion.replace('²', '**2')
+    expresion = expresion.replace('³', '**3')
+    return _LN.sub('log', expresion)
+
+
+@lru_cache(maxsize=256)
+def convertir_expresion(expresion):
+    """
+    Convierte el texto de una expresión en SymPy, recordando las ya convertidas.
+    
+    Al escribir, la misma entrada se convierte muchas veces (vista previa,
+    análisis, evaluación); la caché devuelve siempre el mismo objeto,
+    internado. La expresión conserva la forma en que se escribió: la forma
+    canónica solo se usa para las claves de caché (clave_expresion), así que
+    "(x+1)^2" y "x²+2x+1" comparten clave pero se muestran cada una a su modo.
+    
+    Args:
+        expresion (str): expresión tal como la escribió el usuario
+    
+    Returns:
+        sympy.Expr: expresión SymPy internada
+    
+    Raises:
+        ErrorSintaxis: si la expresión no es válida, con la posición del error
+    """
+    return TABLA.internar(parsear(expresion.strip()))
+
+
+METRICAS.registrar_fuente("parseo", estadisticas_lru(convertir_expresion))
+
+
+def limpiar_caches():
+    """Vacía la caché de expresiones convertidas."""
+    convertir_expresion.cache_clear()
+
+
+def _calcular_dominio(funcion_sympy, x):
+    """Calcula la descripción del dominio de una expresión."""
+    try:
+        return describir_dominio(funcion_sympy, x)
+    except Exception as e:
+        return f"Error al calcular el dominio: {e}"
+
+
+def _calcular_recorrido(funcion_sympy, x):
+    """Calcula la descripción del recorrido de una expresión."""
+    try:
+        # Polinomios y funciones racionales: puntos críticos exactos, sin límites
+        texto = describir_recorrido(funcion_sympy, x)
+        if texto is not None:
+            return texto
+        
+        # Funciones monótonas en cada tramo del dominio: límites en los bordes de cada tramo
+        conjunto = recorrido_monotono(funcion_sympy, x)
+        if conjunto is not None:
+            return conjunto.formatear()
+        
+        # Con extremos interiores, polos o huecos los límites no acotan el recorrido
+        return _recorrido_numerico(funcion_sympy, x)
+    
+    except Exception as e:
+        return f"Error al calcular el recorrido: {e}"
+
+
+def _es_algebraica(funcion_sympy, x):
+    """Indica si la expresión solo usa operaciones algebraicas (racionales y radicales)."""
+    for nodo in sp.preorder_traversal(funcion_sympy):
+        if not nodo.has(x) or isinstance(nodo, (sp.Add, sp.Mul)):
+            continue
+        if isinstance(nodo, sp.Pow) and nodo.exp.is_Rational:
+            continue
+        if nodo == x:
+            continue
+        return False
+    return True
+
+
+def _interseccion_y(funcion_sympy, x):
+    """Calcula f(0) si es real y finito, o None."""
+    try:
+        y_val = raices_reales(funcion_sympy).subs(x, 0)
+        # Verificar si el resultado es real y finito
+        if y_val.is_real and y_val.is_finite:
+            return float(y_val)
+        return None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _raices_simbolicas(funcion_sympy, x):
+    """Resuelve f(x) = 0 con solve y devuelve las soluciones reales como floats."""
+    intersecciones_x = []
+    soluciones = solve(funcion_sympy, x)
+    
+    if soluciones:
+        for sol in soluciones:
+            try:
+                # Verificar múltiples condiciones para asegurar que es real
+                if (hasattr(sol, 'is_real') and sol.is_real and
+                    hasattr(sol, 'is_finite') and sol.is_finite):
+                    # Intentar convertir a float de manera segura
+                    float_val = complex(sol)
+                    if abs(float_val.imag) < 1e-10:  # Prácticamente real
+                        intersecciones_x.append(float(float_val.real))
+            except (TypeError, ValueError, AttributeError, OverflowError):
+                # Si no se puede convertir, simplemente ignorar esta solución
+                continue
+    return intersecciones_x
+
+
+def _intersecciones_numericas(funcion_sympy, x):
+    """Calcula las intersecciones buscando raíces numéricas en la ventana del gráfico."""
+    raices = [raiz + 0.0 for raiz in buscar_raices(funcion_sympy, VENTANA_NUMERICA, variable=x)]
+    return raices, _interseccion_y(funcion_sympy, x), METODO_NUMERICO
+
+
+def _calcular_intersecciones(funcion_sympy, x):
+    """
+    Calcula las intersecciones de una expresión con los ejes X e Y.
+    
+    Las expresiones algebraicas se resuelven con solve. Las trascendentes
+    (trigonométricas, exponenciales, logarítmicas...) tienen infinitas raíces
+    o ninguna fórmula cerrada, así que se buscan numéricamente en la ventana
+    del gráfico; también se usa la vía numérica si solve falla o si hay
+    raíces de índice impar, que solve toma como raíz principal y no ve los
+    ceros con base negativa.
+    
+    Returns:
+        tuple: (intersecciones_x, interseccion_y, metodo)
+    """
+    try:
+        if _es_algebraica(funcion_sympy, x) and raices_reales(funcion_sympy) == funcion_sympy:
+            try:
+                return _raices_simbolicas(funcion_sympy, x), _interseccion_y(funcion_sympy, x), METODO_SIMBOLICO
+            except Exception as solve_error:
+                print(f"Error al resolver ecuación: {solve_error}")
+        
+        return _intersecciones_numericas(funcion_sympy, x)
+    
+    except Exception as e:
+        print(f"Error general en cálculo de intersecciones: {e}")
+        return [], None, METODO_NUMERICO
+
+
+def _calcular_derivada(funcion_sympy, x):
+    """Calcula la derivada de una expresión, o None si no es posible."""
+    try:
+        return diff(funcion_sympy, x)
+    except Exception:
+        return None
+
+
+def _dominio_exacto(funcion_sympy, x):
+    """Dominio de una composición de funciones definidas en todo ℝ (sin cálculo simbólico)."""
+    if not PerfilExpresion(funcion_sympy, x).es_entera:
+        return _calcular_dominio(funcion_sympy, x)
+    return "ℝ (Todos los números reales)"
+
+
+def _intersecciones_exactas(funcion_sympy, x):
+    """Raíces reales exactas de un polinomio con coeficientes racionales."""
+    try:
+        polinomio = sp.Poly(funcion_sympy, x)
+    except sp.PolynomialError:
+        return _calcular_intersecciones(funcion_sympy, x)
+    if not all(c.is_Rational for c in polinomio.coeffs()):
+        return _calcular_intersecciones(funcion_sympy, x)
+    
+    # real_roots aísla las raíces (con multiplicidad) sin pasar por radicales complejos
+    intersecciones_x = []
+    for raiz in polinomio.real_roots():
+        valor = float(raiz)
+        if valor not in intersecciones_x:
+            intersecciones_x.append(valor)
+    return intersecciones_x, _interseccion_y(funcion_sympy, x), METODO_EXACTO
+
+
+def _texto_borde(valor):
+    """Formatea un extremo estimado numéricamente."""
+    return f"{valor:.4g}"
+
+
+def _dominio_numerico(funcion_sympy, x):
+    """Estima el dominio evaluando una malla fina en la ventana del gráfico."""
+    # Aunque la expresión sea grande, los caminos rápidos del dominio son exactos y baratos
+    conjunto = dominio_rapido(funcion_sympy, x)
+    if conjunto is not None:
+        return conjunto.formatear()
+    
+    a, b = VENTANA_NUMERICA
+    xs = np.linspace(a, b, PUNTOS_ESTIMACION)
+    ys, _ = evaluar_con_errores(funcion_sympy, xs, x)
+    validos = np.isfinite(ys)
+    paso = (b - a) / (PUNTOS_ESTIMACION - 1)
+    aviso = f"(estimación numérica en [{a}, {b}], bordes con error ±{paso:.2g})"
+    if validos.all():
+        return f"Sin puntos excluidos en [{a}, {b}] {aviso}"
+    if not validos.any():
+        return f"Sin puntos válidos en [{a}, {b}] {aviso}"
+    
+    # Tramos consecutivos de puntos válidos
+    cambios = np.diff(np.concatenate(([0], validos.astype(np.int8), [0])))
+    inicios = np.flatnonzero(cambios == 1)
+    finales = np.flatnonzero(cambios == -1) - 1
+    tramos = [f"[{_texto_borde(xs[i])}, {_texto_borde(xs[j])}]" for i, j in zip(inicios, finales)]
+    return f"≈ {' ∪ '.join(tramos)} {aviso}"
+
+
+def _refinar_extremo(funcion_sympy, x, xs, ys, signo=1):
+    """
+    Mejora el extremo de una muestra con la parábola por el punto y sus vecinos.
+    
+    Args:
+        signo (int): 1 para el mínimo, -1 para el máximo
+    
+    Returns:
+        float: valor de f en el vértice de la parábola (NaN si no aplica)
+    """
+    ys = signo * ys
+    k = int(np.nanargmin(ys))
+    if k == 0 or k == len(ys) - 1 or not np.isfinite(ys[k - 1:k + 2]).all():
+        return math.nan
+    a2, a1, _ = np.polyfit(xs[k - 1:k + 2], ys[k - 1:k + 2], 2)
+    if a2 <= 0:
+        return math.nan
+    vertice = -a1 / (2 * a2)
+    if not xs[k - 1] <= vertice <= xs[k + 1]:
+        return math.nan
+    valor, _ = evaluar_con_errores(funcion_sympy, np.array([vertice]), x)
+    return float(valor[0])
+
+
+def _recorrido_numerico(funcion_sympy, x):
+    """Estima el recorrido con los valores observados en la ventana del gráfico."""
+    a, b = VENTANA_NUMERICA
+    xs, ys = muestrear_adaptativo(funcion_sympy, VENTANA_NUMERICA, n_maximo=PUNTOS_ESTIMACION,
+                                  variable=x)
+    finitos = ys[np.isfinite(ys)]
+    aviso = f"(estimación numérica: valores observados con x en [{a}, {b}])"
+    if finitos.size == 0:
+        return f"No se pudo estimar {aviso}"
+    minimo = min(float(finitos.min()), _refinar_extremo(funcion_sympy, x, xs, ys))
+    maximo = max(float(finitos.max()), _refinar_extremo(funcion_sympy, x, xs, ys, -1))
+    
+    # Junto a un corte (polo) con valores muy grandes la función no está acotada; la
+    # mediana no se infla aunque el muestreo adaptativo se concentre cerca de los polos
+    escala = float(np.median(np.abs(finitos))) or 1.0
+    cortes = np.flatnonzero(np.isnan(ys))
+    vecinos = ys[np.clip(np.concatenate([cortes - 1, cortes + 1]), 0, len(ys) - 1)]
+    vecinos = vecinos[np.isfinite(vecinos)]
+    inferior = "-∞" if np.any(vecinos < -FACTOR_NO_ACOTADO * escala) else _texto_borde(minimo)
+    superior = "∞" if np.any(vecinos > FACTOR_NO_ACOTADO * escala) else _texto_borde(maximo)
+    if minimo == maximo:
+        return f"≈ {{{_texto_borde(minimo)}}} {aviso}"
+    apertura = "(" if inferior == "-∞" else "["
+    cierre = ")" if superior == "∞" else "]"
+    return f"≈ {apertura}{inferior}, {superior}{cierre} {aviso}"
+
+
+# Cálculo de cada etapa según la estrategia del planificador
+_CALCULOS = {
+    'dominio': {
+        ESTRATEGIA_EXACTA: _dominio_exacto,
+        ESTRATEGIA_SIMBOLICA: _calcular_dominio,
+        ESTRATEGIA_NUMERICA: _dominio_numerico,
+    },
+    'recorrido': {
+        ESTRATEGIA_EXACTA: _calcular_recorrido,
+        ESTRATEGIA_SIMBOLICA: _calcular_recorrido,
+        ESTRATEGIA_NUMERICA: _recorrido_numerico,
+    },
+    'intersecciones': {
+        ESTRATEGIA_EXACTA: _intersecciones_exactas,
+        ESTRATEGIA_SIMBOLICA: _calcular_intersecciones,
+        ESTRATEGIA_NUMERICA: _intersecciones_numericas,
+    },
+    'derivada': {
+        ESTRATEGIA_SIMBOLICA: _calcular_derivada,
+    },
+}
+
+
+def _valor_degradado(etapa, detalle, funcion_sympy, x):
+    """Valor que se informa para una etapa que no terminó dentro del presupuesto."""
+    if etapa == 'intersecciones':
+        # La búsqueda numérica es rápida y acotada: sirve de respaldo
+        try:
+            return _intersecciones_numericas(funcion_sympy, x)
+        except Exception:
+            return [], None, METODO_NUMERICO
+    if etapa == 'derivada':
+        return None
+    return f"No se pudo determinar ({detalle})"
+
+
+def _describir_asintotas(funcion_sympy, x):
+    """Describe las asíntotas de una expresión, o None si no se pudieron buscar."""
+    asintotas = calcular_asintotas(funcion_sympy, x)
+    return None if asintotas is None else asintotas.describir()
+
+
+def _texto_asintotas(resultado):
+    """
+    Describe las asíntotas para los pasos del recorrido.
+    
+    Con pool de trabajadores la búsqueda corre allí, donde limit de SymPy tiene
+    presupuesto; en un hilo de la interfaz no se podría interrumpir.
+    
+    Returns:
+        str: descripción, o None si no se pudieron buscar
+    """
+    if resultado._trabajadores is None:
+        return _describir_asintotas(resultado.funcion_sympy, resultado.x)
+    ejecucion = resultado._trabajadores.ejecutar(_describir_asintotas, resultado.funcion_sympy,
+                                                 resultado.x)
+    if ejecucion.ok:
+        return ejecucion.valor
+    return f"no determinadas ({ejecucion.detalle})"
+
+
+def _pasos_seccion(resultado, seccion):
+    """
+    Genera los pasos del desarrollo computacional de una etapa.
+    
+    Args:
+        resultado (ResultadoAnalisis): resultado del análisis
+        seccion (str): etapa ('dominio', 'recorrido', 'intersecciones' o 'derivada')
+    
+    Returns:
+        list: pasos de la sección
+    """
+    pasos = []
+    if seccion == 'dominio':
+        pasos.append("1. CÁLCULO DEL DOMINIO:")
+        pasos.append(f"Dominio: {resultado.dominio}")
+        pasos.append("")
+    
+    elif seccion == 'recorrido':
+        pasos.append("2. CÁLCULO DEL RECORRIDO:")
+        pasos.append(f"Recorrido: {resultado.recorrido}")
+        asintotas = _texto_asintotas(resultado)
+        if asintotas is not None:
+            pasos.append(f"Asíntotas: {asintotas}")
+        pasos.append("")
+    
+    elif seccion == 'intersecciones':
+        pasos.append("3. INTERSECCIONES CON LOS EJES:")
+        int_x, int_y = resultado.intersecciones
+        
+        # Formatear intersecciones X
+        if isinstance(int_x, list) and int_x:
+            intersecciones_x_str = ", ".join([f"({x}, 0)" for x in int_x])
+            pasos.append(f"Con eje X: {intersecciones_x_str}")
+        elif isinstance(int_x, list) and not int_x:
+            pasos.append("Con eje X: No hay intersecciones reales")
+        else:
+            pasos.append(f"Con eje X: {int_x}")
+        if isinstance(int_x, list):
+            pasos.append(f"Método (eje X): {resultado.metodo_intersecciones}")
+        
+        # Formatear intersección Y
+        if int_y is not None:
+            pasos.append(f"Con eje Y: (0, {int_y})")
+        else:
+            pasos.append("Con eje Y: No se pudo calcular")
+        pasos.append("")
+    
+    elif seccion == 'derivada':
+        # Derivada (si es posible)
+        derivada = resultado.derivada
+        if derivada is not None:
+            pasos.append("4. DERIVADA:")
+            pasos.append(f"f'(x) = {derivada}")
+        else:
+            pasos.append("4. DERIVADA: No se pudo calcular")
+    
+    return pasos
+
+
+class ResultadoAnalisis:
+    """
+    Resultado del análisis de una función.
+    
+    Sus atributos no se pueden reasignar: solo se completan las etapas.
+    Cada etapa (dominio, recorrido, intersecciones, derivada) se calcula
+    una sola vez, la primera vez que se consulta; si varios hilos la piden a
+    la vez, esperan al primer cálculo y comparten su valor. Si se entrega una caché
+    persistente, las etapas ya guardadas se toman de ella y las nuevas se
+    guardan al calcularse. Si se entrega un pool de trabajadores, las etapas
+    simbólicas costosas corren en él bajo presupuesto de tiempo y memoria;
+    las que lo exceden quedan con estado "tiempo_agotado" o "degradado".
+    
+    Al crearse se planifica la estrategia de cada etapa (exacta, simbólica
+    o numérica) según el costo estimado de la expresión.
+    """
+    
+    __slots__ = ('funcion', 'funcion_sympy', 'x', 'plan', '_cache', '_clave', '_trabajadores',
+                 '_estados', '_candados', '_candado_cache',
+                 '_dominio', '_recorrido', '_intersecciones', '_derivada')
+    
+    def __init__(self, funcion, funcion_sympy, x, cache=None, trabajadores=None, forzadas=None,
+                 previo=None):
+        object.__setattr__(self, 'funcion', funcion)
+        object.__setattr__(self, 'funcion_sympy', funcion_sympy)
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'plan', planificar(funcion_sympy, x, forzadas, etiqueta=funcion))
+        object.__setattr__(self, '_cache', cache)
+        object.__setattr__(self, '_clave', None)
+        object.__setattr__(self, '_trabajadores', trabajadores)
+        object.__setattr__(self, '_estados', {})
+        object.__setattr__(self, '_candados', {etapa: threading.Lock() for etapa in ETAPAS})
+        object.__setattr__(self, '_candado_cache', threading.Lock())
+        for etapa in ETAPAS:
+            object.__setattr__(self, '_' + etapa, _PENDIENTE)
+        
+        if cache is not None:
+            clave = clave_expresion(funcion_sympy)
+            object.__setattr__(self, '_clave', clave)
+            for etapa, valor in cache.obtener(clave).items():
+                # Una estrategia forzada debe calcularse aunque haya un valor guardado
+                if etapa in ETAPAS_COMPARTIDAS and etapa not in self.plan.forzadas:
+                    object.__setattr__(self, '_' + etapa, valor)
+                    self._estados[etapa] = ESTADO_OK
+        
+        # Una forma equivalente ya analizada aporta sus etapas compartidas
+        if previo is not None:
+            for etapa in ETAPAS_COMPARTIDAS:
+                if (previo._estados.get(etapa) == ESTADO_OK and etapa not in self._estados
+                        and etapa not in self.plan.forzadas):
+                    object.__setattr__(self, '_' + etapa, getattr(previo, '_' + etapa))
+                    self._estados[etapa] = ESTADO_OK
+    
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("ResultadoAnalisis es inmutable")
+    
+    def __delattr__(self, nombre):
+        raise AttributeError("ResultadoAnalisis es inmutable")
+    
+    def _etapa(self, etapa):
+        """Devuelve el valor de una etapa, calculándolo solo la primera vez."""
+        valor = getattr(self, '_' + etapa)
+        METRICAS.registrar_acierto("etapas", valor is not _PENDIENTE)
+        if valor is not _PENDIENTE:
+            return valor
+        # Los hilos que piden la misma etapa a la vez esperan el primer cálculo
+        with self._candados[etapa]:
+            valor = getattr(self, '_' + etapa)
+            if valor is _PENDIENTE:
+                valor = self._calcular_etapa(etapa)
+        return valor
+    
+    def _calcular_etapa(self, etapa):
+        """Calcula una etapa según su estrategia (se llama con el candado de la etapa tomado)."""
+        estrategia = self.plan.estrategia(etapa)
+        calculo = _CALCULOS[etapa][estrategia]
+        # Con perfiles activados el cálculo corre bajo cProfile (también en el trabajador)
+        perfilar = METRICAS.perfilando
+        tarea, argumentos = ((ejecutar_perfilado, (calculo, self.funcion_sympy, self.x)) if perfilar
+                             else (calculo, (self.funcion_sympy, self.x)))
+        inicio = time.perf_counter()
+        # Solo la vía simbólica general puede no terminar: las demás no usan el pool
+        if (self._trabajadores is not None and etapa in ETAPAS_CON_PRESUPUESTO
+                and estrategia == ESTRATEGIA_SIMBOLICA):
+            ejecucion = self._trabajadores.ejecutar(tarea, *argumentos)
+            estado = ejecucion.estado
+            if ejecucion.ok:
+                valor = ejecucion.valor
+            else:
+                perfilar = False
+                valor = _valor_degradado(etapa, ejecucion.detalle, self.funcion_sympy, self.x)
+        else:
+            estado = ESTADO_OK
+            valor = tarea(*argumentos)
+        if perfilar:
+            valor, duracion, perfil = valor
+            METRICAS.guardar_perfil(f"{etapa}: f(x) = {self.funcion}", duracion, perfil)
+        METRICAS.registrar_tiempo('etapa.' + etapa, time.perf_counter() - inicio,
+                                  funcion=self.funcion, estado=estado, estrategia=estrategia)
+        if estado != ESTADO_OK:
+            METRICAS.contar('etapas.' + estado)
+        # El estado antes que el valor: quien ve el valor ya encuentra su estado
+        self._estados[etapa] = estado
+        object.__setattr__(self, '_' + etapa, valor)
+        # Solo se guardan etapas compartidas, completas y no estimadas; las degradadas
+        # se reintentan luego
+        if (self._cache is not None and etapa in ETAPAS_COMPARTIDAS and estado == ESTADO_OK
+                and estrategia != ESTRATEGIA_NUMERICA):
+            # Un guardado a la vez: cada uno escribe todas las etapas calculadas
+            with self._candado_cache:
+                self._cache.guardar(self._clave, self.etapas_calculadas())
+        return valor
+    
+    def etapas_calculadas(self):
+        """
+        Devuelve las etapas que ya tienen un valor completo y exacto.
+        
+        Las estimaciones numéricas no se incluyen: son baratas de repetir y
+        no deben ocupar el lugar de un resultado exacto en la caché.
+        
+        Returns:
+            dict: nombre de etapa -> valor
+        """
+        calculadas = {}
+        for etapa in ETAPAS:
+            valor = getattr(self, '_' + etapa)
+            if (valor is not _PENDIENTE and self._estados.get(etapa) == ESTADO_OK
+                    and self.plan.estrategia(etapa) != ESTRATEGIA_NUMERICA):
+                calculadas[etapa] = valor
+        return calculadas
+    
+    @property
+    def estados(self):
+        """dict: Estado ("ok", "tiempo_agotado", "degradado", "error") de cada etapa calculada."""
+        return dict(self._estados)
+    
+    @property
+    def completo(self):
+        """bool: True si todas las etapas calculadas terminaron dentro del presupuesto."""
+        return all(estado == ESTADO_OK for estado in self._estados.values())
+    
+    @property
+    def dominio(self):
+        """str: Descripción del dominio."""
+        return self._etapa('dominio')
+    
+    @property
+    def recorrido(self):
+        """str: Descripción del recorrido."""
+        return self._etapa('recorrido')
+    
+    @property
+    def intersecciones(self):
+        """tuple: (intersecciones_x, interseccion_y)."""
+        return tuple(self._etapa('intersecciones')[:2])
+    
+    @property
+    def metodo_intersecciones(self):
+        """str: Método con que se obtuvieron las intersecciones con el eje X."""
+        valor = self._etapa('intersecciones')
+        return valor[2] if len(valor) > 2 else METODO_SIMBOLICO
+    
+    @property
+    def derivada(self):
+        """sympy.Expr: Derivada de la función, o None si no se pudo calcular."""
+        return self._etapa('derivada')
+
 
 class AnalizadorFunciones:
     """Clase principal para el análisis de funciones matemáticas."""
     
-    def __init__(self):
+    def __init__(self, cache=None, trabajadores=None, estrategias=None):
+        """
+        Args:
+            cache (CacheAnalisis): caché persistente opcional de resultados
+            trabajadores (PoolTrabajadores): pool opcional para ejecutar las
+                etapas simbólicas bajo presupuesto de tiempo y memoria
+            estrategias (str): estrategias forzadas, p. ej. "recorrido=numerica";
+                se suman a las de EID_ESTRATEGIAS y tienen prioridad sobre ellas
+        """
         self.x = symbols('x')
         self.funcion = None
         self.funcion_sympy = None
-        
+        self.resultado = None
+        self.error_parseo = None  # ErrorSintaxis del último parseo fallido
+        self._resultados = OrderedDict()  # clave canónica -> ResultadoAnalisis (LRU)
+        self._candado = threading.Lock()  # protege resultado y _resultados entre hilos
+        self.cache = cache
+        if cache is not None:
+            METRICAS.registrar_fuente("cache_analisis", cache.estadisticas)
+        self.trabajadores = trabajadores
+        self.estrategias = {**forzadas_de_entorno(), **leer_forzadas(estrategias)}
+    
+    @METRICAS.medido("parseo")
     def parsear_funcion(self, expresion):
         """
         Convierte una expresión matemática en formato texto a una expresión SymPy.
         
+        Solo parsea (con caché) y fija la función actual; el resultado del
+        análisis, que planifica y consulta la caché persistente, se crea
+        después con analizar() o resultado_de(), fuera del hilo de la interfaz.
+        
         Args:
             expresion (str): Expresión matemática como string
-            
+        
         Returns:
             bool: True si se parseó correctamente, False en caso contrario
         """
         try:
-            # Limpiar la expresión
-            expresion = expresion.strip()
-            
-            # Reemplazar notaciones comunes
-            expresion = expresion.replace('^', '**')
-            expresion = expresion.replace('²', '**2')
-            expresion = expresion.replace('³', '**3')
-            
-            # Manejar funciones trigonométricas
-            expresion = re.sub(r'sin\b', 'sin', expresion)
-            expresion = re.sub(r'cos\b', 'cos', expresion)
-            expresion = re.sub(r'tan\b', 'tan', expresion)
-            expresion = re.sub(r'log\b', 'log', expresion)
-            expresion = re.sub(r'ln\b', 'log', expresion)
-            expresion = re.sub(r'sqrt\b', 'sqrt', expresion)
-            
-            # Crear la expresión SymPy
-            self.funcion_sympy = sp.sympify(expresion)
+            # Crear la expresión SymPy (con caché: reescribir la misma entrada es inmediato)
+            funcion_sympy = convertir_expresion(expresion)
+            expresion = normalizar_expresion(expresion)
+            self.error_parseo = None
+            self.funcion_sympy = funcion_sympy
             self.funcion = expresion
             
             return True
-            
+        
         except Exception as e:
-            # Solo mostrar errores en modo debug, no durante tests
-            import sys
-            if hasattr(sys, '_getframe') and 'test' not in sys._getframe(1).f_code.co_filename.lower():
-                print(f"Error al parsear la función: {e}")
+            # Quien llama informa el error (con su posición) desde error_parseo
+            self.error_parseo = e
             return False
     
+    def analizar(self):
+        """
+        Devuelve el resultado del análisis de la función actual.
+        
+        El resultado se crea una vez por función y calcula cada etapa
+        bajo demanda, de modo que las consultas repetidas no recalculan nada.
+        
+        Returns:
+            ResultadoAnalisis: resultado del análisis, o None si no hay función
+        """
+        with self._candado:
+            funcion, funcion_sympy = self.funcion, self.funcion_sympy
+            if funcion_sympy is None:
+                return None
+            # La misma función (la expresión está internada: es el mismo objeto)
+            # conserva su resultado y las etapas ya calculadas
+            if self.resultado is None or self.resultado.funcion_sympy is not funcion_sympy:
+                self.resultado = self._obtener_resultado(funcion, funcion_sympy)
+            return self.resultado
+    
+    def resultado_de(self, expresion, funcion_sympy):
+        """
+        Devuelve el resultado del análisis de una función sin cambiar la actual.
+        
+        Crearlo planifica las etapas y consulta la caché persistente, así que
+        la interfaz lo llama desde sus hilos de trabajo. Es el mismo objeto que
+        devolverá analizar() para esa función.
+        
+        Args:
+            expresion (str): texto normalizado de la función
+            funcion_sympy (sympy.Expr): función en formato SymPy
+        
+        Returns:
+            ResultadoAnalisis: resultado de la función
+        """
+        with self._candado:
+            if self.resultado is not None and self.resultado.funcion_sympy is funcion_sympy:
+                return self.resultado
+            return self._obtener_resultado(expresion, funcion_sympy)
+    
+    def _obtener_resultado(self, expresion, funcion_sympy):
+        """
+        Busca el resultado de una función entre los recientes, o lo crea
+        (se llama con el candado tomado).
+        
+        Los resultados se indexan por la clave canónica: volver a una función
+        ya analizada reutiliza su resultado aunque no haya caché persistente,
+        y una forma equivalente escrita de otra manera crea uno nuevo (con su
+        propio texto y derivada) que hereda las etapas compartidas.
+        
+        Args:
+            expresion (str): texto de la función
+            funcion_sympy (sympy.Expr): función en formato SymPy
+        
+        Returns:
+            ResultadoAnalisis: resultado de la función
+        """
+        clave = clave_expresion(funcion_sympy)
+        resultado = self._resultados.pop(clave, None)
+        METRICAS.registrar_acierto("resultados", resultado is not None)
+        if resultado is None or resultado.funcion_sympy is not funcion_sympy:
+            resultado = ResultadoAnalisis(expresion, funcion_sympy, self.x,
+                                          self.cache, self.trabajadores, self.estrategias,
+                                          previo=resultado)
+        self._resultados[clave] = resultado
+        if len(self._resultados) > MAX_RESULTADOS_RECIENTES:
+            self._resultados.popitem(last=False)
+        return resultado
+    
+    @METRICAS.medido("calcular_dominio")
     def calcular_dominio(self):
         """
         Calcula el dominio de la función.
@@ -70,49 +764,10 @@ class AnalizadorFunciones:
         """
         if self.funcion_sympy is None:
             return "No hay función definida"
-            
-        try:
-            # Obtener el dominio continuo
-            dominio = continuous_domain(self.funcion_sympy, self.x, S.Reals)
-            
-            if dominio == S.Reals:
-                return "ℝ (Todos los números reales)"
-            else:
-                # Convertir notación técnica a formato legible
-                dominio_str = str(dominio)
-                
-                # Reemplazar notaciones técnicas por versiones legibles
-                if "Union" in dominio_str and "Interval.open" in dominio_str:
-                    if "(-oo, 0)" in dominio_str and "(0, oo)" in dominio_str:
-                        return "ℝ \\ {0} (Todos los reales excepto cero)"
-                    elif "(-oo," in dominio_str:
-                        # Extraer el punto de exclusión
-                        import re
-                        match = re.search(r'Interval\.open\((-?\d+(?:\.\d+)?), oo\)', dominio_str)
-                        if match:
-                            punto = match.group(1)
-                            return f"({punto}, ∞) (Mayores que {punto})"
-                
-                if "Interval(0, oo)" in dominio_str:
-                    return "[0, ∞) (Cero y números positivos)"
-                elif "Interval.open(0, oo)" in dominio_str:
-                    return "(0, ∞) (Solo números positivos)"
-                elif "Interval(-oo, " in dominio_str:
-                    # Extraer límite superior
-                    import re
-                    match = re.search(r'Interval\(-oo, (-?\d+(?:\.\d+)?)\)', dominio_str)
-                    if match:
-                        limite = match.group(1)
-                        return f"(-∞, {limite}] (Menores o iguales que {limite})"
-                
-                # Si no se puede simplificar, mostrar versión más limpia
-                dominio_limpio = dominio_str.replace("Interval.open", "").replace("Interval", "")
-                dominio_limpio = dominio_limpio.replace("Union", "∪").replace("-oo", "-∞").replace("oo", "∞")
-                return f"{dominio_limpio}"
-                
-        except Exception as e:
-            return f"Error al calcular el dominio: {e}"
+        
+        return self.analizar().dominio
     
+    @METRICAS.medido("calcular_recorrido")
     def calcular_recorrido(self):
         """
         Calcula el recorrido de la función.
@@ -122,45 +777,10 @@ class AnalizadorFunciones:
         """
         if self.funcion_sympy is None:
             return "No hay función definida"
-            
-        try:
-            # Para funciones polinómicas simples
-            if self.funcion_sympy.is_polynomial():
-                grado = sp.degree(self.funcion_sympy, self.x)
-                if grado == 0:  # Función constante
-                    return f"{{{self.funcion_sympy}}} (Función constante)"
-                elif grado == 1:  # Función lineal
-                    return "ℝ (Todos los números reales)"
-                elif grado == 2:  # Función cuadrática
-                    # Calcular el vértice
-                    derivada = diff(self.funcion_sympy, self.x)
-                    x_vertice = solve(derivada, self.x)[0]
-                    y_vertice = self.funcion_sympy.subs(self.x, x_vertice)
-                    
-                    # Determinar si abre hacia arriba o abajo
-                    coef_principal = self.funcion_sympy.coeff(self.x**2)
-                    if coef_principal > 0:
-                        return f"[{y_vertice}, ∞) (Desde el vértice hacia arriba)"
-                    else:
-                        return f"(-∞, {y_vertice}] (Desde el vértice hacia abajo)"
-                else:
-                    return "ℝ (Todos los números reales)"
-            
-            # Para otras funciones, intentar calcular límites
-            try:
-                lim_inf = limit(self.funcion_sympy, self.x, -oo)
-                lim_sup = limit(self.funcion_sympy, self.x, oo)
-                
-                if lim_inf == lim_sup and lim_inf.is_finite:
-                    return f"Recorrido: {{{lim_inf}}}"
-                else:
-                    return f"Recorrido: ({lim_inf}, {lim_sup})"
-            except:
-                return "Recorrido: No se pudo determinar automáticamente"
-                
-        except Exception as e:
-            return f"Error al calcular el recorrido: {e}"
+        
+        return self.analizar().recorrido
     
+    @METRICAS.medido("calcular_intersecciones")
     def calcular_intersecciones(self):
         """
         Calcula las intersecciones de la función con los ejes X e Y.
@@ -170,62 +790,26 @@ class AnalizadorFunciones:
         """
         if self.funcion_sympy is None:
             return "No hay función definida", "No hay función definida"
-            
-        try:
-            # Intersección con eje Y (x=0)
-            try:
-                y_val = self.funcion_sympy.subs(self.x, 0)
-                # Verificar si el resultado es real y finito
-                if y_val.is_real and y_val.is_finite:
-                    interseccion_y = float(y_val)
-                else:
-                    interseccion_y = None
-            except (TypeError, ValueError, AttributeError):
-                interseccion_y = None
-            
-            # Intersecciones con eje X (y=0)
-            intersecciones_x = []
-            try:
-                soluciones = solve(self.funcion_sympy, self.x)
-                
-                if soluciones:
-                    for sol in soluciones:
-                        try:
-                            # Verificar múltiples condiciones para asegurar que es real
-                            if (hasattr(sol, 'is_real') and sol.is_real and 
-                                hasattr(sol, 'is_finite') and sol.is_finite):
-                                # Intentar convertir a float de manera segura
-                                float_val = complex(sol)
-                                if abs(float_val.imag) < 1e-10:  # Prácticamente real
-                                    intersecciones_x.append(float(float_val.real))
-                        except (TypeError, ValueError, AttributeError, OverflowError):
-                            # Si no se puede convertir, simplemente ignorar esta solución
-                            continue
-            except Exception as solve_error:
-                print(f"Error al resolver ecuación: {solve_error}")
-            
-            return intersecciones_x, interseccion_y
-            
-        except Exception as e:
-            print(f"Error general en cálculo de intersecciones: {e}")
-            return [], None
+        
+        return self.analizar().intersecciones
     
+    @METRICAS.medido("evaluar_punto")
     def evaluar_punto(self, x_valor):
         """
         Evalúa la función en un punto específico.
         
         Args:
             x_valor (float): Valor de x a evaluar
-            
+        
         Returns:
             tuple: (resultado, pasos)
         """
         if self.funcion_sympy is None:
             return None, "No hay función definida"
-            
+        
         try:
             # Calcular el resultado
-            resultado = self.funcion_sympy.subs(self.x, x_valor)
+            resultado = raices_reales(self.funcion_sympy).subs(self.x, x_valor)
             
             # Generar pasos de la evaluación
             pasos = []
@@ -235,10 +819,46 @@ class AnalizadorFunciones:
             pasos.append(f"f({x_valor}) = {resultado}")
             
             return float(resultado), pasos
-            
+        
         except Exception as e:
             return None, f"Error al evaluar: {e}"
     
+    @METRICAS.medido("evaluar_puntos")
+    def evaluar_puntos(self, x_valores, pasos_en=None):
+        """
+        Evalúa la función en muchos puntos con una sola llamada vectorizada.
+        
+        Usa la forma compilada (y guardada) de la función actual, de modo que
+        evaluar miles de valores cuesta lo mismo que unos pocos.
+        
+        Args:
+            x_valores (sequence | numpy.ndarray): valores de x a evaluar
+            pasos_en (iterable): índices de los puntos para los que se generan
+                los pasos de la evaluación (por defecto ninguno)
+        
+        Returns:
+            tuple: (resultados, errores, pasos)
+                resultados (numpy.ndarray): f(x) con NaN donde no hay valor
+                errores (dict): índice -> mensaje de error del punto
+                pasos (dict): índice -> lista de pasos del punto
+        """
+        xs = np.asarray(x_valores, dtype=float)
+        if self.funcion_sympy is None:
+            return np.full(xs.shape, np.nan), {}, {}
+        
+        resultados, codigos = evaluar_con_errores(self.funcion_sympy, xs, self.x)
+        
+        errores = {}
+        for indice in np.flatnonzero(codigos):
+            errores[int(indice)] = MENSAJES_ERROR[int(codigos.flat[indice])]
+        
+        pasos = {}
+        for indice in (pasos_en or ()):
+            indice = int(indice)
+            pasos[indice] = self.evaluar_punto(float(xs.flat[indice]))[1]
+        
+        return resultados, errores, pasos
+    
     def obtener_desarrollo_computacional(self):
         """
         Genera el desarrollo computacional paso a paso.
@@ -248,48 +868,58 @@ class AnalizadorFunciones:
         """
         if self.funcion_sympy is None:
             return ["No hay función definida"]
-            
+        
+        secciones = dict(self.iterar_desarrollo_computacional(en_paralelo=False))
         pasos = []
-        pasos.append("=== DESARROLLO COMPUTACIONAL ===")
-        pasos.append(f"Función: f(x) = {self.funcion}")
-        pasos.append("")
+        for seccion in SECCIONES_DESARROLLO:
+            pasos.extend(secciones[seccion])
+        return pasos
+    
+    def iterar_desarrollo_computacional(self, en_paralelo=None, resultado=None):
+        """
+        Genera el desarrollo computacional sección por sección, a medida que se calcula.
         
-        # Dominio
-        pasos.append("1. CÁLCULO DEL DOMINIO:")
-        pasos.append(f"Dominio: {self.calcular_dominio()}")
-        pasos.append("")
+        Primero entrega el encabezado y luego cada etapa (dominio, recorrido,
+        intersecciones, derivada). Las etapas ya calculadas salen de inmediato;
+        con trabajadores, las demás se calculan a la vez y se entregan en el
+        orden en que terminan, de modo que la primera llega tras la etapa más rápida.
         
-        # Recorrido
-        pasos.append("2. CÁLCULO DEL RECORRIDO:")
-        pasos.append(f"Recorrido: {self.calcular_recorrido()}")
-        pasos.append("")
+        Args:
+            en_paralelo (bool): calcular las etapas a la vez; None lo hace solo
+                si hay trabajadores (el cálculo ocurre en otros procesos)
+            resultado (ResultadoAnalisis): resultado a desarrollar; por omisión,
+                el de la función actual
         
-        # Intersecciones
-        pasos.append("3. INTERSECCIONES CON LOS EJES:")
-        int_x, int_y = self.calcular_intersecciones()
+        Yields:
+            tuple: (seccion, pasos) con seccion en SECCIONES_DESARROLLO
+        """
+        if resultado is None:
+            resultado = self.analizar()
+        if resultado is None:
+            yield 'encabezado', ["No hay función definida"]
+            return
         
-        # Formatear intersecciones X
-        if isinstance(int_x, list) and int_x:
-            intersecciones_x_str = ", ".join([f"({x}, 0)" for x in int_x])
-            pasos.append(f"Con eje X: {intersecciones_x_str}")
-        elif isinstance(int_x, list) and not int_x:
-            pasos.append("Con eje X: No hay intersecciones reales")
-        else:
-            pasos.append(f"Con eje X: {int_x}")
+        yield 'encabezado', ["=== DESARROLLO COMPUTACIONAL ===", f"Función: f(x) = {resultado.funcion}",
+                             f"Estrategias: {resultado.plan.resumen()}", ""]
         
-        # Formatear intersección Y
-        if int_y is not None:
-            pasos.append(f"Con eje Y: (0, {int_y})")
-        else:
-            pasos.append("Con eje Y: No se pudo calcular")
-        pasos.append("")
+        pendientes = [etapa for etapa in ETAPAS if etapa not in resultado.estados]
+        for etapa in ETAPAS:
+            if etapa not in pendientes:
+                yield etapa, _pasos_seccion(resultado, etapa)
         
-        # Derivada (si es posible)
-        try:
-            derivada = diff(self.funcion_sympy, self.x)
-            pasos.append("4. DERIVADA:")
-            pasos.append(f"f'(x) = {derivada}")
-        except:
-            pasos.append("4. DERIVADA: No se pudo calcular")
+        if en_paralelo is None:
+            en_paralelo = self.trabajadores is not None
+        if not en_paralelo or len(pendientes) < 2:
+            for etapa in pendientes:
+                yield etapa, _pasos_seccion(resultado, etapa)
+            return
         
-        return pasos
+        hilos = ThreadPoolExecutor(max_workers=len(pendientes), thread_name_prefix="desarrollo")
+        try:
+            futuros = {hilos.submit(getattr, resultado, etapa): etapa for etapa in pendientes}
+            for futuro in as_completed(futuros):
+                futuro.result()
+                yield futuros[futuro], _pasos_seccion(resultado, futuros[futuro])
+        finally:
+            # Si quien consume deja de iterar, las etapas en curso terminan solas
+            hilos.shutdown(wait=False, cancel_futures=True)
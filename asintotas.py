@@ -0,0 +1,980 @@
+"""
+Módulo de Asíntotas y Límites Rápidos
+Obtiene el comportamiento de una función en ±∞ y junto a sus polos sin pasar por limit:
+- Término principal c·e^(t·y)·y^g·log(y)^l de cada subexpresión cuando y → ∞,
+  combinado por orden de dominancia (exponencial > potencia > logaritmo > constante)
+- Funciones racionales por el cociente de sus términos principales
+- Oscilaciones acotadas (sin, cos) que quedan dominadas o dan AccumBounds
+- Límites laterales en un punto con el cambio x = punto ± 1/y
+- Asíntotas verticales en los bordes finitos del dominio, horizontales y oblicuas
+- Recorrido de funciones monótonas en cada tramo del dominio, por sus bordes
+- limit de SymPy solo como último recurso, con presupuesto de tiempo
+"""
+
+import math
+import signal
+import threading
+from functools import lru_cache
+
+import numpy as np
+import sympy as sp
+
+from dominio import ConjuntoReal, Intervalo, dominio_rapido, texto_exacto, texto_periodico
+from metricas import METRICAS, estadisticas_lru
+from muestreo import EVALUACION_INFINITA, EVALUACION_OK, evaluar_con_errores, raices_reales
+from recorrido import analizar_racional, partes_racionales
+
+X = sp.Symbol('x')
+
+# Variable auxiliar que tiende a +∞; sin supuestos, porque construir expresiones
+# con un símbolo positivo es varias veces más lento
+_Y = sp.Dummy('y')
+
+# Presupuesto de tiempo (segundos) de cada llamada a limit de respaldo
+PRESUPUESTO_LIMITE = 2.0
+
+# Abscisas (en valor absoluto) donde se comprueba que la función tiene valores
+# hacia ±∞ cuando no se conoce su dominio; no enteras, donde x**x sí es real
+_PRUEBAS_EXTREMO = np.array([10.4817, 1048.17, 104817.0])
+
+# Polos periódicos que se enumeran como máximo dentro de una ventana del gráfico
+MAX_POLOS_VENTANA = 400
+
+# Funciones monótonas crecientes: llevan los extremos de una oscilación a los extremos
+_MONOTONAS = {
+    'exp': sp.exp,
+    'log': sp.log,
+    'atan': sp.atan,
+    'tanh': sp.tanh,
+}
+
+# Funciones crecientes (1) o decrecientes (-1) en todo su dominio real
+_SENTIDO_FUNCIONES = {
+    'exp': 1,
+    'log': 1,
+    'atan': 1,
+    'tanh': 1,
+    'sinh': 1,
+    'asinh': 1,
+    'asin': 1,
+    'acos': -1,
+}
+
+# Límite de cada función cuando su argumento tiende a +∞ y a -∞
+_LIMITES_EN_INFINITO = {
+    'atan': (sp.pi / 2, -sp.pi / 2),
+    'tanh': (sp.S.One, -sp.S.One),
+}
+
+
+class Principal:
+    """
+    Término principal c·e^(tasa·y)·y^grado·log(y)^potencia_log cuando y → +∞.
+
+    Las componentes pueden ser ±oo: tasa = oo representa un crecimiento más
+    rápido que cualquier exponencial (e^(y²)) y grado = -oo un decaimiento
+    más rápido que cualquier potencia (e^(-√y)).
+    """
+
+    __slots__ = ('coef', 'tasa', 'grado', 'potencia_log')
+
+    def __init__(self, coef, tasa=sp.S.Zero, grado=sp.S.Zero, potencia_log=sp.S.Zero):
+        self.coef = sp.sympify(coef)
+        self.tasa = sp.sympify(tasa)
+        self.grado = sp.sympify(grado)
+        self.potencia_log = sp.sympify(potencia_log)
+
+    def clave(self):
+        """Orden de crecimiento, para comparar por dominancia."""
+        return (self.tasa, self.grado, self.potencia_log)
+
+    def tendencia(self):
+        """1 si crece sin cota, 0 si tiende a una constante, -1 si tiende a 0."""
+        return _signo_clave(self.clave())
+
+    def limite(self):
+        """Límite cuando y → +∞."""
+        tendencia = self.tendencia()
+        if tendencia > 0:
+            return sp.oo if self.coef.is_positive else -sp.oo
+        return self.coef if tendencia == 0 else sp.S.Zero
+
+    def __mul__(self, otro):
+        componentes = [a + b for a, b in zip(self.clave(), otro.clave())]
+        if any(c is sp.nan for c in componentes):
+            return None
+        return Principal(self.coef * otro.coef, *componentes)
+
+    def potencia(self, exponente):
+        """Término principal de self**exponente (exponente constante), o None."""
+        if not exponente.is_Integer and not self.coef.is_positive:
+            return None
+        return Principal(self.coef ** exponente, *(c * exponente for c in self.clave()))
+
+
+class Oscilante:
+    """Función acotada que oscila sin límite entre inf y sup."""
+
+    __slots__ = ('inf', 'sup')
+
+    def __init__(self, inf, sup):
+        self.inf = sp.sympify(inf)
+        self.sup = sp.sympify(sup)
+
+    def limite(self):
+        return sp.AccumBounds(self.inf, self.sup)
+
+
+# Tiende a 0 con velocidad desconocida (p. ej. sin(y)/y)
+EVANESCENTE = object()
+
+
+def _signo_clave(clave):
+    """Signo lexicográfico de un orden de crecimiento."""
+    for componente in clave:
+        if componente.is_extended_positive:
+            return 1
+        if componente.is_extended_negative:
+            return -1
+    return 0
+
+
+def _es_constante_real(expr):
+    """Indica si la expresión es una constante real finita."""
+    return expr.is_extended_real is True and expr.is_finite is True and not expr.has(sp.AccumBounds)
+
+
+def principal(expr, y=_Y):
+    """
+    Calcula el comportamiento de una expresión cuando y → +∞.
+
+    Args:
+        expr (sympy.Expr): expresión en y
+        y (sympy.Symbol): variable que tiende a +∞
+
+    Returns:
+        Principal, Oscilante o EVANESCENTE; None si la expresión no encaja en
+        los casos conocidos (o hay una cancelación entre términos principales)
+    """
+    if not expr.has(y):
+        return Principal(expr) if _es_constante_real(expr) and expr != 0 else None
+    if expr == y:
+        return Principal(sp.S.One, grado=sp.S.One)
+    if expr.is_Add or expr.is_Mul or expr.is_Pow:
+        if expr.is_rational_function(y):
+            return _principal_racional(expr, y)
+        if expr.is_Add:
+            return _principal_suma(expr, y)
+        if expr.is_Mul:
+            return _principal_producto(expr, y)
+        return _principal_potencia(expr, y)
+    return _principal_funcion(expr, y)
+
+
+def _principal_racional(expr, y):
+    """Cociente de los términos principales de numerador y denominador."""
+    numerador, denominador = sp.fraction(sp.together(expr))
+    try:
+        p_numerador = sp.Poly(numerador, y)
+        p_denominador = sp.Poly(denominador, y)
+    except sp.PolynomialError:
+        return None
+    if p_numerador.is_zero:
+        return None
+    coef = sp.radsimp(p_numerador.LC() / p_denominador.LC())
+    if not _es_constante_real(coef):
+        return None
+    return Principal(coef, grado=p_numerador.degree() - p_denominador.degree())
+
+
+def _principal_suma(expr, y):
+    """El término de mayor orden domina; las oscilaciones acotadas solo importan si nada crece."""
+    terminos, oscilantes, evanescente = [], [], False
+    for arg in expr.args:
+        parte = principal(arg, y)
+        if parte is None:
+            return None
+        if parte is EVANESCENTE:
+            evanescente = True
+        elif isinstance(parte, Oscilante):
+            oscilantes.append(parte)
+        else:
+            terminos.append(parte)
+
+    dominante = None
+    if terminos:
+        mayor = max((t.clave() for t in terminos), key=_ClaveOrden)
+        coef = sp.radsimp(sum((t.coef for t in terminos if t.clave() == mayor), sp.S.Zero))
+        if coef == 0:
+            return None
+        dominante = Principal(coef, *mayor)
+        if dominante.tendencia() > 0 or (dominante.tendencia() == 0 and not oscilantes):
+            return dominante
+
+    if oscilantes:
+        base = dominante.coef if dominante is not None and dominante.tendencia() == 0 else sp.S.Zero
+        return Oscilante(base + sum((o.inf for o in oscilantes), sp.S.Zero),
+                         base + sum((o.sup for o in oscilantes), sp.S.Zero))
+    # Solo términos que tienden a 0: el principal decide, salvo que alguno tenga velocidad desconocida
+    return EVANESCENTE if evanescente else dominante
+
+
+def _principal_producto(expr, y):
+    """Producto de términos principales; una oscilación acotada por algo que tiende a 0 tiende a 0."""
+    producto = Principal(sp.S.One)
+    oscilantes, evanescente = [], False
+    for arg in expr.args:
+        parte = principal(arg, y)
+        if parte is None:
+            return None
+        if parte is EVANESCENTE:
+            evanescente = True
+        elif isinstance(parte, Oscilante):
+            oscilantes.append(parte)
+        else:
+            producto = producto * parte
+            if producto is None:
+                return None
+
+    tendencia = producto.tendencia()
+    if evanescente:
+        # Lo que tiende a 0 por algo acotado (aunque oscile) tiende a 0
+        return EVANESCENTE if tendencia <= 0 else None
+    if not oscilantes:
+        return producto
+    if tendencia > 0:
+        return None
+    if tendencia < 0:
+        return EVANESCENTE
+    inf, sup = sp.S.One, sp.S.One
+    for oscilante in oscilantes:
+        extremos = [inf * oscilante.inf, inf * oscilante.sup, sup * oscilante.inf, sup * oscilante.sup]
+        inf, sup = sp.Min(*extremos), sp.Max(*extremos)
+    extremos = (producto.coef * inf, producto.coef * sup)
+    return Oscilante(sp.Min(*extremos), sp.Max(*extremos))
+
+
+def _principal_potencia(expr, y):
+    """Potencia con exponente constante, o base**g(y) reescrita como exponencial."""
+    base, exponente = expr.args
+    if exponente.has(y):
+        if not base.has(y) and not base.is_positive:
+            return None
+        return _principal_exponencial(exponente * sp.log(base), y)
+
+    parte = principal(base, y)
+    if parte is None:
+        return None
+    if parte is EVANESCENTE:
+        return EVANESCENTE if exponente.is_positive else None
+    if isinstance(parte, Oscilante):
+        if not (exponente.is_Integer and exponente > 0):
+            return None
+        valores = [parte.inf ** exponente, parte.sup ** exponente]
+        inf = sp.S.Zero if exponente.is_even and parte.inf <= 0 <= parte.sup else sp.Min(*valores)
+        return Oscilante(inf, sp.Max(*valores))
+    return parte.potencia(exponente)
+
+
+def _principal_exponencial(argumento, y):
+    """Término principal de exp(argumento)."""
+    parte = principal(argumento, y)
+    if parte is None:
+        return None
+    if parte is EVANESCENTE:
+        return Principal(sp.S.One)
+    if isinstance(parte, Oscilante):
+        return Oscilante(sp.exp(parte.inf), sp.exp(parte.sup))
+    tendencia = parte.tendencia()
+    if tendencia < 0:
+        return Principal(sp.S.One)
+    if tendencia == 0:
+        return Principal(sp.exp(parte.coef))
+
+    signo = 1 if parte.coef.is_positive else -1
+    if parte.tasa != 0 or parte.grado > 1 or (parte.grado == 1 and parte.potencia_log > 0):
+        # Más rápido que lineal: domina (o se anula frente) a toda exponencial
+        return Principal(sp.S.One, tasa=signo * sp.oo)
+    if parte.grado == 1 and parte.potencia_log == 0:
+        # exp(a·y + r) con r acotado: e^(lim r)·e^(a·y)
+        resto = _resto_acotado(argumento - parte.coef * y, y)
+        return None if resto is None else Principal(sp.exp(resto), tasa=parte.coef)
+    if parte.grado == 0 and parte.potencia_log == 1:
+        # exp(c·log y + r) = y^c·e^r
+        resto = _resto_acotado(argumento - parte.coef * sp.log(y), y)
+        return None if resto is None else Principal(sp.exp(resto), grado=parte.coef)
+    # Entre potencias y exponenciales: e^(√y) o e^(log(y)²)
+    return Principal(sp.S.One, grado=signo * sp.oo)
+
+
+def _resto_acotado(resto, y):
+    """Límite de un resto que debe quedar acotado, o None."""
+    resto = sp.expand(resto)
+    if resto == 0:
+        return sp.S.Zero
+    parte = principal(resto, y)
+    if parte is EVANESCENTE:
+        return sp.S.Zero
+    if not isinstance(parte, Principal) or parte.tendencia() > 0:
+        return None
+    return parte.limite()
+
+
+def _principal_funcion(expr, y):
+    """Término principal de una función de un argumento."""
+    nombre = type(expr).__name__
+    if len(expr.args) != 1:
+        return None
+    argumento = expr.args[0]
+    if nombre in ('sinh', 'cosh'):
+        return principal(expr.rewrite(sp.exp), y)
+    if nombre == 'exp':
+        return _principal_exponencial(argumento, y)
+
+    parte = principal(argumento, y)
+    if parte is None:
+        return None
+    if isinstance(parte, Oscilante):
+        if nombre in _MONOTONAS and (nombre != 'log' or parte.inf.is_positive):
+            funcion = _MONOTONAS[nombre]
+            return Oscilante(funcion(parte.inf), funcion(parte.sup))
+        if nombre in ('sin', 'cos'):
+            return Oscilante(-1, 1)
+        if nombre == 'Abs':
+            return Oscilante(sp.S.Zero if parte.inf <= 0 <= parte.sup else
+                             sp.Min(abs(parte.inf), abs(parte.sup)),
+                             sp.Max(abs(parte.inf), abs(parte.sup)))
+        return None
+    if parte is EVANESCENTE:
+        return _funcion_en_punto(expr.func, sp.S.Zero, argumento, y, sin_desplazamiento=True)
+
+    tendencia = parte.tendencia()
+    if nombre == 'Abs':
+        return Principal(abs(parte.coef), *parte.clave())
+    if nombre == 'sign':
+        return Principal(sp.sign(parte.coef))
+    if nombre == 'log':
+        if not parte.coef.is_positive:
+            return None
+        if tendencia == 0:
+            return _funcion_en_punto(sp.log, parte.coef, argumento, y)
+        # log(c·e^(t·y)·y^g·log(y)^l) ≈ t·y, g·log(y) o l·log(log(y)); el último no se representa
+        if parte.tasa != 0:
+            return None if parte.tasa.is_infinite else Principal(parte.tasa, grado=sp.S.One)
+        if parte.grado != 0:
+            return None if parte.grado.is_infinite else Principal(parte.grado, potencia_log=sp.S.One)
+        return None
+
+    if tendencia > 0:
+        if nombre in ('sin', 'cos'):
+            return Oscilante(-1, 1)
+        if nombre in _LIMITES_EN_INFINITO:
+            mas, menos = _LIMITES_EN_INFINITO[nombre]
+            return Principal(mas if parte.coef.is_positive else menos)
+        if nombre in ('floor', 'ceiling'):
+            return parte
+        return None
+    if nombre in ('floor', 'ceiling'):
+        # Discontinuas en los enteros: el límite depende del lado
+        return None
+    punto = parte.coef if tendencia == 0 else sp.S.Zero
+    return _funcion_en_punto(expr.func, punto, argumento, y, sin_desplazamiento=tendencia < 0)
+
+
+def _funcion_en_punto(funcion, punto, argumento, y, sin_desplazamiento=False):
+    """
+    Término principal de funcion(argumento) cuando el argumento tiende a un punto.
+
+    Si la función vale 0 o tiene un polo en el punto, se usa su derivada (o la
+    de su recíproca) y el término principal del desplazamiento argumento - punto.
+    """
+    valor = funcion(punto)
+    if _es_constante_real(valor) and valor != 0:
+        return Principal(valor)
+    if valor == 0:
+        invertir = False
+    elif valor.has(sp.zoo) or valor.is_infinite:
+        invertir = True
+    else:
+        return None
+    pendiente = _pendiente(funcion, punto, invertir)
+    if pendiente is None:
+        return None
+
+    desplazamiento = argumento if sin_desplazamiento else sp.expand(argumento - punto)
+    parte = principal(desplazamiento, y)
+    if not isinstance(parte, Principal) or parte.tendencia() >= 0:
+        return None
+    lineal = Principal(pendiente) * parte
+    if not invertir:
+        return lineal
+    return Principal(1 / lineal.coef, *(-c for c in lineal.clave()))
+
+
+@lru_cache(maxsize=256)
+def _pendiente(funcion, punto, invertir):
+    """Derivada de la función (o de su recíproca) en el punto, si es real y no nula."""
+    s = sp.Dummy('s')
+    derivada = sp.diff(1 / funcion(s) if invertir else funcion(s), s)
+    pendiente = derivada.subs(s, punto)
+    if not _es_constante_real(pendiente):
+        # En un polo la derivada sin simplificar queda como zoo/zoo
+        pendiente = sp.simplify(derivada).subs(s, punto)
+    pendiente = sp.simplify(pendiente)
+    if not _es_constante_real(pendiente) or pendiente == 0:
+        return None
+    return pendiente
+
+
+class _ClaveOrden:
+    """Envoltorio para ordenar claves de crecimiento con max()."""
+
+    __slots__ = ('clave',)
+
+    def __init__(self, clave):
+        self.clave = clave
+
+    def __lt__(self, otro):
+        return _signo_clave(tuple(a - b for a, b in zip(self.clave, otro.clave))) < 0
+
+
+class _TiempoAgotado(Exception):
+    """El presupuesto de limit se agotó."""
+
+
+class _Provisional(Exception):
+    """
+    Un límite de respaldo se omitió o se quedó sin tiempo.
+
+    Se lanza a través de las funciones con caché para que lru_cache no guarde
+    el resultado: en otro hilo o con más margen el límite puede obtenerse.
+    """
+
+    def __init__(self, valor=None):
+        """
+        Args:
+            valor: resultado parcial que se devuelve sin guardarse en caché
+        """
+        super().__init__()
+        self.valor = valor
+
+
+def _limite_con_presupuesto(expr, x, punto, direccion="+-"):
+    """
+    Último recurso: limit de SymPy con presupuesto de tiempo.
+
+    Solo se intenta en el hilo principal (lote, procesos trabajadores), donde
+    una alarma lo interrumpe al agotar el presupuesto; en otros hilos limit no
+    se puede interrumpir y se omite.
+
+    Returns:
+        sympy.Expr: el límite, o None si limit falla o no da un valor real
+
+    Raises:
+        _Provisional: si el límite se omitió o se agotó el presupuesto
+    """
+    en_hilo_principal = threading.current_thread() is threading.main_thread()
+    con_alarma = en_hilo_principal and hasattr(signal, "setitimer")
+    if not con_alarma:
+        METRICAS.contar("limites.omitidos")
+        raise _Provisional()
+
+    def agotar(senal, marco):
+        raise _TiempoAgotado()
+
+    anterior = signal.signal(signal.SIGALRM, agotar)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, PRESUPUESTO_LIMITE)
+        with METRICAS.medir("limites.sympy"):
+            if direccion == "+-":
+                valor = sp.limit(expr, x, punto)
+            else:
+                valor = sp.limit(expr, x, punto, direccion)
+    except _TiempoAgotado:
+        METRICAS.contar("limites.agotados")
+        raise _Provisional()
+    except Exception as e:
+        print(f"Error al calcular el límite: {e}")
+        return None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+    # Se descartan los límites no reales o sin evaluar (oo*I, Limit, oo*sign(...))
+    if isinstance(valor, sp.AccumBounds) or _es_constante_real(valor) or _es_infinito(valor):
+        return valor
+    return None
+
+
+def _limite_rapido(expr, y):
+    """Límite de una expresión en y cuando y → +∞ por términos principales, o None."""
+    try:
+        parte = principal(expr, y)
+    except (TypeError, ValueError, AttributeError, RecursionError):
+        return None
+    if parte is None:
+        return None
+    if parte is EVANESCENTE:
+        return sp.S.Zero
+    return parte.limite()
+
+
+def limite_infinito(funcion_sympy, x=X, signo=1, respaldo=True):
+    """
+    Límite de la función cuando x → +∞ (signo 1) o x → -∞ (signo -1).
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+        signo (int): 1 o -1
+        respaldo (bool): usar limit con presupuesto si no hay camino rápido
+
+    Returns:
+        sympy.Expr: el límite (número, ±oo o AccumBounds), o None
+    """
+    try:
+        return _limite_infinito(funcion_sympy, x, signo, respaldo)
+    except _Provisional:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _limite_infinito(funcion_sympy, x, signo, respaldo):
+    """Límite en ±∞ con caché; lanza _Provisional si el respaldo no llegó a calcularse."""
+    valor = _limite_rapido(funcion_sympy.subs(x, signo * _Y), _Y)
+    if valor is not None:
+        METRICAS.contar("limites.rapidos")
+        return valor
+    if not respaldo:
+        return None
+    return _limite_con_presupuesto(funcion_sympy, x, sp.oo if signo > 0 else -sp.oo)
+
+
+def limite_lateral(funcion_sympy, x, punto, lado, respaldo=True):
+    """
+    Límite lateral en un punto, con el cambio x = punto + lado/y (y → +∞).
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+        punto (sympy.Expr): punto finito
+        lado (int): 1 por la derecha, -1 por la izquierda
+        respaldo (bool): usar limit con presupuesto si no hay camino rápido
+
+    Returns:
+        sympy.Expr: el límite, o None
+    """
+    try:
+        return _limite_lateral(funcion_sympy, x, punto, lado, respaldo)
+    except _Provisional:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _limite_lateral(funcion_sympy, x, punto, lado, respaldo):
+    """Límite lateral con caché; lanza _Provisional si el respaldo no llegó a calcularse."""
+    valor = _limite_rapido(funcion_sympy.subs(x, punto + lado / _Y), _Y)
+    if valor is not None:
+        METRICAS.contar("limites.rapidos")
+        return valor
+    if not respaldo:
+        return None
+    return _limite_con_presupuesto(funcion_sympy, x, punto, "+" if lado > 0 else "-")
+
+
+def _es_infinito(valor):
+    return valor is sp.oo or valor is sp.S.NegativeInfinity
+
+
+class Asintotas:
+    """Asíntotas verticales, horizontales y oblicuas de una función."""
+
+    __slots__ = ('verticales', 'periodicas', 'horizontales', 'oblicuas', 'completas',
+                 'extremos_completos')
+
+    def __init__(self, verticales=(), periodicas=(), horizontales=None, oblicuas=None,
+                 completas=True, extremos_completos=True):
+        """
+        Args:
+            verticales (tuple): valores exactos x = a de las asíntotas verticales
+            periodicas (tuple): pares (inicio, periodo) de familias x = inicio + k·periodo
+            horizontales (dict): signo (1 o -1) -> valor y = b
+            oblicuas (dict): signo (1 o -1) -> (pendiente, ordenada) de y = m·x + b
+            completas (bool): si las verticales son todas las que tiene la función
+            extremos_completos (bool): si se determinó el comportamiento en
+                cada extremo infinito del dominio
+        """
+        self.verticales = tuple(verticales)
+        self.periodicas = tuple(periodicas)
+        self.horizontales = horizontales or {}
+        self.oblicuas = oblicuas or {}
+        self.completas = completas
+        self.extremos_completos = extremos_completos
+
+    def polos_en(self, a, b):
+        """
+        Abscisas de las asíntotas verticales dentro de la ventana [a, b].
+
+        Returns:
+            list: floats ordenados
+        """
+        polos = [float(v) for v in self.verticales if a <= float(v) <= b]
+        for inicio, periodo in self.periodicas:
+            inicio, periodo = float(inicio), float(periodo)
+            k = math.ceil((a - inicio) / periodo)
+            while inicio + k * periodo <= b and len(polos) < MAX_POLOS_VENTANA:
+                polos.append(inicio + k * periodo)
+                k += 1
+        return sorted(polos)
+
+    def describir(self):
+        """
+        Describe las asíntotas en una línea.
+
+        Solo dice "No tiene" si la búsqueda fue completa; si no, indica qué
+        quedó sin determinar.
+
+        Returns:
+            str: p. ej. "vertical x = 1 · horizontal y = 1 (x → ±∞)"
+        """
+        partes = [f"vertical x = {_texto(v)}" for v in self.verticales]
+        partes.extend(f"verticales x = {texto_periodico(i, p)} (k ∈ ℤ)"
+                      for i, p in self.periodicas)
+        for tipo, asintotas, formato in (
+                ("horizontal", self.horizontales, lambda b: f"y = {_texto(b)}"),
+                ("oblicua", self.oblicuas, lambda mb: f"y = {_texto(mb[0] * X + mb[1])}")):
+            if 1 in asintotas and -1 in asintotas and asintotas[1] == asintotas[-1]:
+                partes.append(f"{tipo} {formato(asintotas[1])} (x → ±∞)")
+                continue
+            for signo, nombre in ((-1, "-∞"), (1, "+∞")):
+                if signo in asintotas:
+                    partes.append(f"{tipo} {formato(asintotas[signo])} (x → {nombre})")
+        if not self.completas:
+            otras = "otras " if self.verticales or self.periodicas else ""
+            partes.append(f"{otras}verticales no determinadas automáticamente")
+        if not self.extremos_completos:
+            partes.append("comportamiento en ±∞ no determinado automáticamente")
+        return " · ".join(partes) if partes else "No tiene"
+
+
+def _texto(valor):
+    """Texto de un valor exacto, en decimal si es una raíz sin fórmula cerrada."""
+    if valor.has(sp.CRootOf) or valor.is_Float:
+        return f"{float(valor):.4g}"
+    return texto_exacto(valor)
+
+
+def _asintotas_racionales(funcion_sympy, x):
+    """Asíntotas de una función racional: polos del denominador reducido y división de polinomios."""
+    partes = partes_racionales(funcion_sympy, x)
+    if partes is None:
+        return None
+    analisis = analizar_racional(*partes)
+    horizontales, oblicuas = {}, {}
+    exceso = analisis.numerador.degree() - analisis.denominador.degree()
+    if exceso <= 0:
+        valor = analisis.limite_infinito(1)
+        horizontales = {1: valor, -1: valor}
+    elif exceso == 1:
+        cociente, _ = analisis.numerador.div(analisis.denominador)
+        pendiente, ordenada = cociente.all_coeffs()
+        oblicuas = {1: (pendiente, ordenada), -1: (pendiente, ordenada)}
+    return Asintotas(analisis.polos, (), horizontales, oblicuas)
+
+
+def _diverge(funcion_sympy, x, punto, lados, respaldo):
+    """
+    Indica si la función diverge junto a un punto por alguno de los lados.
+
+    Returns:
+        bool: True o False, o None si algún límite lateral no se pudo obtener
+
+    Raises:
+        _Provisional: si un límite de respaldo se omitió o se quedó sin tiempo
+    """
+    limites = [_limite_lateral(funcion_sympy, x, punto, lado, respaldo) for lado in lados]
+    if any(_es_infinito(limite) for limite in limites):
+        return True
+    return None if any(limite is None for limite in limites) else False
+
+
+def _asintotas_generales(funcion_sympy, x, respaldo):
+    """
+    Asíntotas de una función cualquiera por términos principales.
+
+    Raises:
+        _Provisional: con las asíntotas halladas, si algún límite de respaldo
+            se omitió o se quedó sin tiempo
+    """
+    dominio = dominio_rapido(funcion_sympy, x)
+    verticales, periodicas = [], []
+    provisional = False
+    # Sin dominio conocido no hay candidatas: puede haber polos sin detectar
+    completas = dominio is not None
+    if dominio is not None:
+        # Candidatas: los bordes finitos del dominio; es asíntota si algún lado diverge
+        bordes = {}
+        for intervalo in dominio.intervalos:
+            if intervalo.a != -math.inf:
+                bordes.setdefault(intervalo.a, [intervalo.inf, []])[1].append(1)
+            if intervalo.b != math.inf:
+                bordes.setdefault(intervalo.b, [intervalo.sup, []])[1].append(-1)
+        for _, (borde, lados) in sorted(bordes.items()):
+            try:
+                diverge = _diverge(funcion_sympy, x, borde, lados, respaldo)
+            except _Provisional:
+                provisional, diverge = True, None
+            if diverge:
+                verticales.append(borde)
+            completas = completas and diverge is not None
+        for inicio, periodo in dominio.periodicos:
+            try:
+                diverge = _diverge(funcion_sympy, x, inicio, (1, -1), respaldo)
+            except _Provisional:
+                provisional, diverge = True, None
+            if diverge:
+                periodicas.append((inicio, periodo))
+            completas = completas and diverge is not None
+
+    horizontales, oblicuas = {}, {}
+    extremos_completos = True
+    for signo in (1, -1):
+        if not _llega_a(funcion_sympy, x, dominio, signo):
+            continue
+        try:
+            limite = _limite_infinito(funcion_sympy, x, signo, respaldo)
+        except _Provisional:
+            provisional, limite = True, None
+        if limite is None:
+            extremos_completos = False
+            continue
+        if limite.is_finite and _es_constante_real(limite):
+            horizontales[signo] = limite
+        elif _es_infinito(limite):
+            pendiente = limite_infinito(sp.expand(funcion_sympy / x), x, signo, False)
+            if pendiente is None or not _es_constante_real(pendiente) or pendiente == 0:
+                continue
+            ordenada = limite_infinito(sp.expand(funcion_sympy - pendiente * x), x, signo, False)
+            if ordenada is not None and _es_constante_real(ordenada):
+                oblicuas[signo] = (pendiente, ordenada)
+    asintotas = Asintotas(verticales, periodicas, horizontales, oblicuas, completas,
+                          extremos_completos)
+    if provisional:
+        raise _Provisional(asintotas)
+    return asintotas
+
+
+def _llega_a(funcion_sympy, x, dominio, signo):
+    """
+    Indica si el dominio se extiende hasta +∞ (signo 1) o -∞ (signo -1).
+
+    Sin dominio conocido se comprueba que la función tenga valores reales
+    en algunas abscisas lejanas de ese lado (x**x no los tiene hacia -∞).
+    """
+    if dominio is None:
+        _, codigos = evaluar_con_errores(funcion_sympy, signo * _PRUEBAS_EXTREMO, x)
+        return bool(np.all((codigos == EVALUACION_OK) | (codigos == EVALUACION_INFINITA)))
+    if not dominio.intervalos:
+        return False
+    if signo > 0:
+        return dominio.intervalos[-1].b == math.inf
+    return dominio.intervalos[0].a == -math.inf
+
+
+def calcular_asintotas(funcion_sympy, x=X, respaldo=True):
+    """
+    Calcula las asíntotas de una función.
+
+    Un resultado al que le faltó algún límite de respaldo (omitido fuera del
+    hilo principal o sin tiempo) se devuelve pero no se guarda en caché.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+        respaldo (bool): permitir limit con presupuesto donde no hay camino
+            rápido; sin él, el cálculo es siempre rápido (para el graficador)
+
+    Returns:
+        Asintotas: asíntotas encontradas, o None si no se pudieron analizar
+    """
+    try:
+        return _calcular_asintotas(funcion_sympy, x, respaldo)
+    except _Provisional as provisional:
+        return provisional.valor
+
+
+@lru_cache(maxsize=256)
+def _calcular_asintotas(funcion_sympy, x, respaldo):
+    """Asíntotas con caché; lanza _Provisional con el resultado parcial."""
+    try:
+        with METRICAS.medir("asintotas"):
+            asintotas = _asintotas_racionales(funcion_sympy, x)
+            if asintotas is None:
+                asintotas = _asintotas_generales(funcion_sympy, x, respaldo)
+            return asintotas
+    except _Provisional:
+        raise
+    except Exception as e:
+        print(f"Error al calcular asíntotas: {e}")
+        return None
+
+
+METRICAS.registrar_fuente("limites", estadisticas_lru(_limite_infinito))
+METRICAS.registrar_fuente("asintotas", estadisticas_lru(_calcular_asintotas))
+
+
+def limpiar_caches():
+    """Vacía las cachés de límites, asíntotas y derivadas en los polos."""
+    _limite_infinito.cache_clear()
+    _limite_lateral.cache_clear()
+    _calcular_asintotas.cache_clear()
+    _pendiente.cache_clear()
+
+
+def _sentido(expr, x, prueba):
+    """
+    Sentido de variación de una expresión en un tramo continuo de su dominio.
+
+    Se deduce de la estructura, sin derivar: sumas de términos con el mismo
+    sentido, producto por una constante y composición con potencias y con
+    funciones monótonas. El signo de las bases con exponente negativo se mira
+    en un punto interior del tramo (el dominio excluye sus ceros).
+
+    Args:
+        expr (sympy.Expr): expresión en x
+        x (sympy.Symbol): variable independiente
+        prueba (sympy.Rational): punto interior del tramo
+
+    Returns:
+        int: 1 creciente, -1 decreciente, 0 constante; None si no se puede asegurar
+    """
+    if not expr.has(x):
+        return 0
+    if expr == x:
+        return 1
+
+    if expr.is_Add:
+        sentidos = set()
+        for arg in expr.args:
+            sentidos.add(_sentido(arg, x, prueba))
+        sentidos.discard(0)
+        if None in sentidos or len(sentidos) > 1:
+            return None
+        return sentidos.pop() if sentidos else 0
+
+    if expr.is_Mul:
+        constante, variable = expr.as_independent(x, as_Add=False)
+        sentido = None if variable.is_Mul else _sentido(variable, x, prueba)
+        if sentido is None:
+            return None
+        if constante.is_extended_positive:
+            return sentido
+        return -sentido if constante.is_extended_negative else None
+
+    if expr.is_Pow:
+        base, exponente = expr.args
+        if exponente.has(x):
+            # a**g(x) con base constante positiva: sigue a g si a > 1
+            if base.has(x) or not base.is_positive or base == 1:
+                return None
+            sentido = _sentido(exponente, x, prueba)
+            if sentido is None:
+                return None
+            return sentido if (base - 1).is_positive else -sentido
+        sentido = _sentido(base, x, prueba)
+        if sentido is None or not exponente.is_extended_real:
+            return None
+        if exponente.is_Integer or (exponente.is_Rational and exponente.q % 2 == 1):
+            # Potencias enteras y raíces de índice impar: cuenta la paridad del numerador
+            impar = exponente.p % 2
+            if exponente > 0:
+                # Las potencias pares no son monótonas si la base cambia de signo
+                return sentido if impar else None
+            valor = base.subs(x, prueba)
+            if valor.is_extended_positive:
+                return -sentido
+            if valor.is_extended_negative:
+                return -sentido if impar else sentido
+            return None
+        # Raíces de índice par: la base no es negativa en el dominio
+        return sentido if exponente.is_extended_positive else -sentido
+
+    creciente = _SENTIDO_FUNCIONES.get(type(expr).__name__)
+    if creciente is None or len(expr.args) != 1:
+        return None
+    sentido = _sentido(expr.args[0], x, prueba)
+    return None if sentido is None else creciente * sentido
+
+
+def _valor_en_borde(funcion_sympy, x, extremo, abierto, lado):
+    """Valor de la función en un extremo cerrado, o su límite hacia el interior en uno abierto."""
+    if not abierto:
+        valor = funcion_sympy.subs(x, extremo)
+    elif _es_infinito(extremo):
+        valor = limite_infinito(funcion_sympy, x, -lado)
+    else:
+        valor = limite_lateral(funcion_sympy, x, extremo, lado)
+    if valor is None or not (_es_infinito(valor) or _es_constante_real(valor)):
+        return None
+    return valor
+
+
+def _recorrido_tramo(funcion_sympy, x, intervalo, reales):
+    """
+    Imagen de un intervalo del dominio si la función es monótona en él, o None.
+
+    Los valores en los bordes se toman de reales, la misma función con las
+    raíces de índice impar reescritas como raíces reales.
+    """
+    if intervalo.es_punto():
+        valor = _valor_en_borde(reales, x, intervalo.inf, False, 1)
+        return None if valor is None else Intervalo(valor, valor, False, False)
+    a, b = intervalo.a, intervalo.b
+    if a == -math.inf:
+        prueba = b - 1 if b != math.inf else 0.0
+    elif b == math.inf:
+        prueba = a + 1
+    else:
+        prueba = (a + b) / 2
+    sentido = _sentido(funcion_sympy, x, sp.Rational(prueba))
+    if sentido is None:
+        return None
+
+    izquierdo = _valor_en_borde(reales, x, intervalo.inf, intervalo.abierto_inf, 1)
+    derecho = _valor_en_borde(reales, x, intervalo.sup, intervalo.abierto_sup, -1)
+    if izquierdo is None or derecho is None:
+        return None
+    if sentido == 0:
+        return Intervalo(izquierdo, izquierdo, False, False)
+    # Estrictamente monótona: un extremo se alcanza solo si el borde es cerrado
+    if sentido > 0:
+        return Intervalo(izquierdo, derecho, intervalo.abierto_inf, intervalo.abierto_sup)
+    return Intervalo(derecho, izquierdo, intervalo.abierto_sup, intervalo.abierto_inf)
+
+
+def recorrido_monotono(funcion_sympy, x=X):
+    """
+    Recorrido de una función monótona en cada tramo de su dominio.
+
+    En cada intervalo del dominio (sin polos ni huecos en su interior) donde
+    la función es monótona, la imagen va del valor o límite en un borde al
+    del otro. Los límites se toman solo hacia los lados que el dominio alcanza.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        ConjuntoReal: recorrido, o None si el dominio no se conoce, tiene
+        exclusiones periódicas o la monotonía no se puede asegurar en un tramo
+    """
+    dominio = dominio_rapido(funcion_sympy, x)
+    if dominio is None or dominio.periodicos or not dominio.intervalos:
+        return None
+    reales = raices_reales(funcion_sympy)
+    tramos = []
+    for intervalo in dominio.intervalos:
+        tramo = _recorrido_tramo(funcion_sympy, x, intervalo, reales)
+        if tramo is None:
+            return None
+        tramos.append(tramo)
+    return ConjuntoReal(tramos)
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark del Analizador
+Mide el costo de cada operación sobre un corpus de expresiones representativas:
+- parsear_funcion, cada calcular_*, evaluar_punto
+- GraficadorFunciones.crear_grafico y el dibujado de la figura (backend Agg)
+
+Cada repetición parte en frío (sin cachés de parseo, compilación, muestras
+ni de SymPy) y se informa la mediana. Los resultados se guardan en JSON y se
+pueden comparar con una línea base: el programa termina con código 1 si
+alguna operación empeora más que el umbral.
+
+Con --parseo se compara en cambio el parseador propio con sympify: tiempos
+con la caché de SymPy caliente (el caso de la escritura en la interfaz) y
+en frío, y que ambos produzcan exactamente la misma expresión.
+
+Uso:
+    python benchmark.py [--repeticiones N] [--filtro CATEGORIA] [--salida RUTA]
+                        [--comparar BASE.json] [--umbral 0.25] [--json]
+    python benchmark.py --parseo [--repeticiones N] [--filtro CATEGORIA]
+"""
+
+import os
+
+# Sin pantalla: matplotlib siempre con Agg
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+# Corpus: empieza por los ejemplos rápidos de la interfaz (crear_controles)
+CORPUS = [
+    ("ejemplos", "x**2 + 2*x + 1"),
+    ("ejemplos", "x**3 - 3*x + 2"),
+    ("ejemplos", "sin(x)"),
+    ("ejemplos", "1/x"),
+    ("ejemplos", "sqrt(x)"),
+    ("ejemplos", "exp(x)"),
+    ("ejemplos", "log(x)"),
+    ("ejemplos", "cos(x)"),
+    ("polinomios", "x**4 - 5*x**2 + 4"),
+    ("polinomios", "2*x**5 - x**3 + 7*x - 3"),
+    ("racionales", "(x + 1)/(x - 1)"),
+    ("racionales", "(x**2 - 4)/(x**2 - 5*x + 6)"),
+    ("racionales", "1/(x**2 + 1)"),
+    ("radicales", "sqrt(4 - x**2)"),
+    ("radicales", "x**(1/3)"),
+    ("radicales", "sqrt(x**2 - 9)/x"),
+    ("trigonometricas", "tan(x)"),
+    ("trigonometricas", "sin(x) + cos(2*x)"),
+    ("exp_log", "exp(-x**2)"),
+    ("exp_log", "log(x**2 - 1)"),
+    ("exp_log", "2**x - 3"),
+    ("composiciones", "sin(1/x)"),
+    ("composiciones", "log(sin(x) + 2)"),
+    ("composiciones", "exp(sin(x)) - x"),
+    ("composiciones", "cos(x) - x"),
+]
+
+OPERACIONES = (
+    "parsear_funcion",
+    "calcular_dominio",
+    "calcular_recorrido",
+    "calcular_intersecciones",
+    "evaluar_punto",
+    "crear_grafico",
+    "dibujar_grafico",
+)
+
+# Por debajo de este tiempo las diferencias son ruido y no cuentan como regresión
+PISO_COMPARACION_S = 0.002
+X_EVALUACION = 2.5
+
+
+def limpiar_caches():
+    """Vacía las cachés en memoria para que cada repetición parta en frío."""
+    from sympy.core.cache import clear_cache
+    import analizador
+    import asintotas
+    import canonico
+    import dominio
+    import muestreo
+    import recorrido
+
+    clear_cache()
+    for modulo in (canonico, analizador, dominio, recorrido, asintotas, muestreo):
+        modulo.limpiar_caches()
+
+
+def medir_expresion(expresion):
+    """
+    Mide una repetición de todas las operaciones sobre una expresión.
+
+    Args:
+        expresion (str): función a analizar
+
+    Returns:
+        dict: operación -> segundos (None si la operación falló)
+    """
+    from analizador import AnalizadorFunciones
+    from graficador import GraficadorFunciones
+
+    limpiar_caches()
+    analizador = AnalizadorFunciones()
+    graficador = GraficadorFunciones()
+    tiempos = {}
+
+    def medir(operacion, funcion):
+        inicio = time.perf_counter()
+        try:
+            valor = funcion()
+        except Exception as e:
+            print(f"Error en {operacion} ({expresion}): {e}", file=sys.stderr)
+            tiempos[operacion] = None
+            return None
+        tiempos[operacion] = time.perf_counter() - inicio
+        return valor
+
+    if not medir("parsear_funcion", lambda: analizador.parsear_funcion(expresion)):
+        return {operacion: None for operacion in OPERACIONES}
+    medir("calcular_dominio", analizador.calcular_dominio)
+    medir("calcular_recorrido", analizador.calcular_recorrido)
+    intersecciones = medir("calcular_intersecciones", analizador.calcular_intersecciones) or ([], None)
+    medir("evaluar_punto", lambda: analizador.evaluar_punto(X_EVALUACION))
+
+    int_x, int_y = intersecciones
+    figura = medir("crear_grafico", lambda: graficador.crear_grafico(
+        analizador.funcion_sympy, intersecciones_x=int_x if isinstance(int_x, list) else [],
+        interseccion_y=int_y, titulo=f"f(x) = {analizador.funcion}"))
+    if figura is not None:
+        medir("dibujar_grafico", figura.canvas.draw)
+    else:
+        tiempos["dibujar_grafico"] = None
+    graficador.cerrar()
+    return tiempos
+
+
+def ejecutar(corpus, repeticiones):
+    """
+    Mide todo el corpus.
+
+    Args:
+        corpus (list): pares (categoría, expresión)
+        repeticiones (int): repeticiones por expresión (se usa la mediana)
+
+    Returns:
+        dict: resultados listos para guardar en JSON
+    """
+    import matplotlib
+    import numpy
+    import sympy
+
+    # Calentamiento: importaciones perezosas, fuentes de matplotlib, etc. no
+    # deben cargarse a la primera expresión medida
+    medir_expresion("x**2 - 1")
+
+    resultados = {}
+    for categoria, expresion in corpus:
+        mediciones = [medir_expresion(expresion) for _ in range(repeticiones)]
+        tiempos = {}
+        for operacion in OPERACIONES:
+            validos = [m[operacion] for m in mediciones if m.get(operacion) is not None]
+            tiempos[operacion] = statistics.median(validos) if validos else None
+        resultados[expresion] = {"categoria": categoria, "tiempos": tiempos}
+
+    totales = {
+        operacion: sum(r["tiempos"][operacion] or 0.0 for r in resultados.values())
+        for operacion in OPERACIONES
+    }
+    return {
+        "entorno": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "sympy": sympy.__version__,
+            "numpy": numpy.__version__,
+            "matplotlib": matplotlib.__version__,
+            "backend": matplotlib.get_backend(),
+        },
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeticiones": repeticiones,
+        "resultados": resultados,
+        "totales": totales,
+    }
+
+
+def comparar_parseo(corpus, repeticiones):
+    """
+    Compara parseador.parsear con sympify sobre el corpus.
+
+    Args:
+        corpus (list): pares (categoría, expresión)
+        repeticiones (int): mediciones por expresión (se usa la mínima)
+
+    Returns:
+        dict: expresión -> tiempos en caliente y en frío de cada parser y si coinciden
+    """
+    import sympy
+    from sympy.core.cache import clear_cache
+    from parseador import parsear
+
+    def medir(funcion, expresion, en_frio):
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            if en_frio:
+                clear_cache()
+            inicio = time.perf_counter()
+            funcion(expresion)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor
+
+    resultados = {}
+    for _, expresion in corpus:
+        propio, referencia = parsear(expresion), sympy.sympify(expresion)
+        resultados[expresion] = {
+            "coincide": sympy.srepr(propio) == sympy.srepr(referencia),
+            "parseador_s": medir(parsear, expresion, False),
+            "sympify_s": medir(sympy.sympify, expresion, False),
+            "parseador_frio_s": medir(parsear, expresion, True),
+            "sympify_frio_s": medir(sympy.sympify, expresion, True),
+        }
+    return resultados
+
+
+def mostrar_tabla_parseo(resultados):
+    """Muestra la comparación del parseador con sympify, en microsegundos."""
+    columnas = ["parseador", "sympify", "aceler.", "frío pars.", "frío symp.", "aceler."]
+    print(f"{'Expresión':<30}" + "".join(f"{c:>12}" for c in columnas))
+    print("-" * (30 + 12 * len(columnas)))
+    for expresion, r in resultados.items():
+        celdas = [r["parseador_s"], r["sympify_s"], None, r["parseador_frio_s"], r["sympify_frio_s"], None]
+        celdas[2] = r["sympify_s"] / r["parseador_s"]
+        celdas[5] = r["sympify_frio_s"] / r["parseador_frio_s"]
+        texto = "".join(f"{c:>11.1f}x" if i in (2, 5) else f"{c * 1e6:>9.0f} µs" for i, c in enumerate(celdas))
+        print(f"{expresion[:29]:<30}" + texto + ("" if r["coincide"] else "  ¡distinta!"))
+    print("-" * (30 + 12 * len(columnas)))
+    for sufijo, nombre in (("_s", "caché de SymPy caliente"), ("_frio_s", "en frío")):
+        propio = sum(r["parseador" + sufijo] for r in resultados.values())
+        referencia = sum(r["sympify" + sufijo] for r in resultados.values())
+        print(f"Total {nombre}: parseador {propio * 1000:.2f} ms, sympify {referencia * 1000:.2f} ms "
+              f"({referencia / propio:.1f}x)")
+
+
+def comparar(actual, base, umbral):
+    """
+    Compara los resultados con una línea base.
+
+    Args:
+        actual (dict): resultados de esta ejecución
+        base (dict): resultados guardados previamente
+        umbral (float): empeoramiento relativo tolerado (0.25 = 25 %)
+
+    Returns:
+        list: regresiones como (expresión, operación, base_s, actual_s)
+    """
+    regresiones = []
+    totales = {}  # solo sobre las expresiones presentes en ambas ejecuciones
+    for expresion, datos in actual["resultados"].items():
+        previos = base.get("resultados", {}).get(expresion)
+        if previos is None:
+            continue
+        for operacion, tiempo in datos["tiempos"].items():
+            anterior = previos["tiempos"].get(operacion)
+            if tiempo is None or anterior is None:
+                continue
+            suma = totales.setdefault(operacion, [0.0, 0.0])
+            suma[0] += anterior
+            suma[1] += tiempo
+            if max(tiempo, anterior) >= PISO_COMPARACION_S and tiempo > anterior * (1 + umbral):
+                regresiones.append((expresion, operacion, anterior, tiempo))
+
+    for operacion, (anterior, total) in totales.items():
+        if total >= PISO_COMPARACION_S and total > anterior * (1 + umbral):
+            regresiones.append(("(total)", operacion, anterior, total))
+    return regresiones
+
+
+def mostrar_tabla(datos):
+    """Muestra los tiempos por expresión y operación, en milisegundos."""
+    abreviaturas = ["parseo", "dominio", "recorrido", "intersec.", "evaluar", "gráfico", "dibujo"]
+    print(f"{'Expresión':<30}" + "".join(f"{a:>11}" for a in abreviaturas))
+    print("-" * (30 + 11 * len(abreviaturas)))
+    for expresion, resultado in datos["resultados"].items():
+        celdas = []
+        for operacion in OPERACIONES:
+            tiempo = resultado["tiempos"][operacion]
+            celdas.append(f"{'error':>11}" if tiempo is None else f"{tiempo * 1000:>8.1f} ms")
+        print(f"{expresion[:29]:<30}" + "".join(celdas))
+    print("-" * (30 + 11 * len(abreviaturas)))
+    print(f"{'Total':<30}" + "".join(f"{datos['totales'][o] * 1000:>8.0f} ms" for o in OPERACIONES))
+
+
+def main(argumentos=None):
+    """Ejecuta el benchmark; devuelve 1 si hay regresiones respecto de la línea base."""
+    parser = argparse.ArgumentParser(description="Benchmark del analizador sobre un corpus de expresiones.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="mediciones por expresión (se usa la mediana)")
+    parser.add_argument("--filtro", help="medir solo una categoría del corpus (p. ej. racionales)")
+    parser.add_argument("--salida", help="guardar los resultados en este archivo JSON")
+    parser.add_argument("--comparar", help="archivo JSON de una ejecución anterior (línea base)")
+    parser.add_argument("--umbral", type=float, default=0.25,
+                        help="empeoramiento relativo tolerado al comparar (por defecto 0.25)")
+    parser.add_argument("--json", action="store_true", help="mostrar los resultados en JSON")
+    parser.add_argument("--parseo", action="store_true", help="comparar el parseador propio con sympify")
+    args = parser.parse_args(argumentos)
+
+    corpus = [(c, e) for c, e in CORPUS if args.filtro in (None, c)]
+    if not corpus:
+        print(f"No hay expresiones en la categoría {args.filtro!r}", file=sys.stderr)
+        return 2
+
+    if args.parseo:
+        resultados = comparar_parseo(corpus, max(5, args.repeticiones))
+        if args.json:
+            print(json.dumps(resultados, indent=2, ensure_ascii=False))
+        else:
+            mostrar_tabla_parseo(resultados)
+        # Una expresión distinta de la de sympify es un error del parseador
+        return 0 if all(r["coincide"] for r in resultados.values()) else 1
+
+    datos = ejecutar(corpus, max(1, args.repeticiones))
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(datos, indent=2, ensure_ascii=False))
+    else:
+        mostrar_tabla(datos)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(datos, base, args.umbral)
+        if regresiones:
+            print(f"\nRegresiones (más de {args.umbral:.0%} respecto de {args.comparar}):", file=sys.stderr)
+            for expresion, operacion, anterior, tiempo in regresiones:
+                print(f"  {expresion}: {operacion} {anterior * 1000:.1f} ms -> {tiempo * 1000:.1f} ms",
+                      file=sys.stderr)
+            return 1
+        print(f"\nSin regresiones respecto de {args.comparar}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Arranque
+Mide cuánto cuesta importar cada módulo de la aplicación, cada uno en un
+intérprete nuevo (sin cachés de importación compartidas), usando -X importtime.
+
+Uso:
+    python benchmark_arranque.py [--repeticiones N] [--json]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODULOS = [
+    "tkinter",
+    "customtkinter",
+    "numpy",
+    "sympy",
+    "matplotlib",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_tkagg",
+    "metricas",
+    "vigilante",
+    "muestreo",
+    "parseador",
+    "canonico",
+    "planificador",
+    "dominio",
+    "recorrido",
+    "asintotas",
+    "analizador",
+    "graficador",
+    "lote",
+    "interface",
+    "main",
+]
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacion(modulo):
+    """
+    Importa un módulo en un intérprete nuevo y mide su costo.
+
+    Args:
+        modulo (str): nombre del módulo
+
+    Returns:
+        dict: tiempo acumulado según -X importtime y tiempo real del proceso,
+            en segundos, o el error si no se pudo importar
+    """
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=DIRECTORIO, capture_output=True, text=True,
+        env=dict(os.environ, MPLBACKEND=os.environ.get("MPLBACKEND", "Agg"))
+    )
+    real = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        ultima = proceso.stderr.strip().splitlines()[-1:] or ["error desconocido"]
+        return {"error": ultima[0]}
+
+    # Formato: "import time: self [us] | cumulative | imported package"
+    acumulado = None
+    for linea in proceso.stderr.splitlines():
+        partes = linea.split("|")
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            acumulado = int(partes[1].strip()) / 1e6
+    return {"importacion": acumulado, "proceso": real}
+
+
+def medir_interprete_vacio():
+    """Mide el tiempo de iniciar un intérprete que no importa nada."""
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=DIRECTORIO, check=True)
+    return time.perf_counter() - inicio
+
+
+def main(argumentos=None):
+    """Ejecuta el benchmark y muestra la tabla de resultados."""
+    parser = argparse.ArgumentParser(description="Costo de importación de cada módulo.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="mediciones por módulo (se usa la mediana)")
+    parser.add_argument("--json", action="store_true", help="mostrar los resultados en JSON")
+    args = parser.parse_args(argumentos)
+
+    base = statistics.median(medir_interprete_vacio() for _ in range(args.repeticiones))
+    resultados = {}
+    for modulo in MODULOS:
+        if importlib.util.find_spec(modulo.split(".")[0]) is None:
+            resultados[modulo] = {"error": "no instalado"}
+            continue
+        mediciones = [medir_importacion(modulo) for _ in range(args.repeticiones)]
+        validas = [m for m in mediciones if "error" not in m]
+        if not validas:
+            resultados[modulo] = mediciones[0]
+            continue
+        resultados[modulo] = {
+            "importacion": statistics.median(m["importacion"] or 0.0 for m in validas),
+            "proceso": statistics.median(m["proceso"] for m in validas) - base,
+        }
+
+    if args.json:
+        print(json.dumps({"interprete_vacio": base, "modulos": resultados}, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"Intérprete vacío: {base * 1000:.0f} ms")
+    print(f"{'Módulo':<36}{'Importación':>14}{'Proceso':>12}")
+    print("-" * 62)
+    for modulo, datos in resultados.items():
+        if "error" in datos:
+            print(f"{modulo:<36}{datos['error']}")
+        else:
+            print(f"{modulo:<36}{datos['importacion'] * 1000:>11.0f} ms{datos['proceso'] * 1000:>9.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Módulo de Caché Persistente de Análisis
+Guarda en un archivo SQLite local los resultados de cada etapa del análisis:
+- Dominio, recorrido e intersecciones (la derivada es barata y sigue al
+  texto escrito, así que no se guarda)
+- Clave: hash canónico de la expresión más las versiones de SymPy y del motor
+- Expulsión LRU con un máximo de entradas; las lecturas no escriben: la
+  hora de uso se acumula en memoria y se escribe en lotes
+- Contadores de aciertos y fallos
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from canonico import clave_canonica
+
+MAX_ENTRADAS_POR_DEFECTO = 5000
+
+# Etapas que se guardan en disco
+ETAPAS_PERSISTENTES = ("dominio", "recorrido", "intersecciones")
+
+# Horas de uso pendientes a partir de las cuales se escriben aunque no haya guardado
+MAX_USOS_PENDIENTES = 256
+
+
+def ruta_cache_por_defecto():
+    """
+    Devuelve la ruta del archivo de caché por defecto.
+
+    Se puede cambiar el directorio con la variable de entorno EID_CACHE_DIR.
+
+    Returns:
+        str: ruta del archivo SQLite
+    """
+    directorio = os.environ.get("EID_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "eid-algebra")
+    return os.path.join(directorio, "analisis.sqlite3")
+
+
+def clave_expresion(funcion_sympy):
+    """
+    Calcula la clave de caché de una expresión.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+
+    Las expresiones equivalentes según canonico.forma_canonica comparten clave.
+
+    Returns:
+        str: hash hexadecimal de la forma canónica y las versiones de SymPy y del motor
+    """
+    return clave_canonica(funcion_sympy)
+
+
+def serializar_etapa(etapa, valor):
+    """Convierte el valor de una etapa en un dato compatible con JSON."""
+    if etapa == "intersecciones":
+        return list(valor)
+    return valor
+
+
+def deserializar_etapa(etapa, dato):
+    """Reconstruye el valor de una etapa a partir de su dato JSON."""
+    if etapa == "intersecciones":
+        return tuple(dato)
+    return dato
+
+
+class CacheAnalisis:
+    """Caché persistente y acotada de resultados de análisis."""
+
+    def __init__(self, ruta=None, max_entradas=MAX_ENTRADAS_POR_DEFECTO):
+        self.ruta = ruta or ruta_cache_por_defecto()
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._lock = threading.Lock()
+        self._conexion = None
+        self._usos = {}  # clave -> hora del último uso aún no escrita
+
+
+        try:
+            if self.ruta != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.ruta)), exist_ok=True)
+            self._conexion = sqlite3.connect(self.ruta, timeout=5, check_same_thread=False)
+            if self.ruta != ":memory:":
+                # WAL: los lectores no bloquean al que escribe (varios procesos del lote)
+                self._conexion.execute("PRAGMA journal_mode=WAL")
+                self._conexion.execute("PRAGMA synchronous=NORMAL")
+            self._conexion.execute(
+                "CREATE TABLE IF NOT EXISTS analisis ("
+                "clave TEXT PRIMARY KEY, datos TEXT NOT NULL, ultimo_uso REAL NOT NULL)")
+            self._conexion.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ultimo_uso ON analisis (ultimo_uso)")
+            self._conexion.commit()
+        except (sqlite3.Error, OSError) as e:
+            # Sin caché el análisis sigue funcionando, solo que más lento
+            print(f"Caché de análisis deshabilitada: {e}")
+            self._conexion = None
+
+    def obtener(self, clave):
+        """
+        Busca las etapas guardadas para una clave.
+
+        La lectura no escribe en el archivo: la hora de uso queda pendiente
+        y se escribe junto con el próximo guardado (o al cerrar).
+
+        Args:
+            clave (str): clave de la expresión
+
+        Returns:
+            dict: etapas guardadas (vacío si no hay entrada)
+        """
+        if self._conexion is None:
+            return {}
+
+        try:
+            with self._lock:
+                fila = self._conexion.execute(
+                    "SELECT datos FROM analisis WHERE clave = ?", (clave,)).fetchone()
+                if fila is None:
+                    self.fallos += 1
+                    return {}
+                self.aciertos += 1
+                self._usos[clave] = time.time()
+                if len(self._usos) >= MAX_USOS_PENDIENTES:
+                    self._escribir_usos()
+                    self._conexion.commit()
+            datos = json.loads(fila[0])
+            return {etapa: deserializar_etapa(etapa, dato) for etapa, dato in datos.items()
+                    if etapa in ETAPAS_PERSISTENTES}
+        except (sqlite3.Error, ValueError, TypeError, SyntaxError):
+            self.fallos += 1
+            return {}
+
+    def guardar(self, clave, etapas):
+        """
+        Guarda (o reemplaza) las etapas de una clave y aplica la expulsión LRU.
+
+        En la misma transacción se escriben las horas de uso pendientes.
+
+        Args:
+            clave (str): clave de la expresión
+            etapas (dict): valores de las etapas calculadas; solo se guardan
+                las de ETAPAS_PERSISTENTES
+        """
+        if self._conexion is None:
+            return
+
+        try:
+            datos = json.dumps({etapa: serializar_etapa(etapa, valor)
+                                for etapa, valor in etapas.items()
+                                if etapa in ETAPAS_PERSISTENTES}, ensure_ascii=False)
+            with self._lock:
+                self._usos.pop(clave, None)
+                self._escribir_usos()
+                self._conexion.execute(
+                    "INSERT OR REPLACE INTO analisis (clave, datos, ultimo_uso) VALUES (?, ?, ?)",
+                    (clave, datos, time.time()))
+                self._conexion.execute(
+                    "DELETE FROM analisis WHERE clave IN ("
+                    "SELECT clave FROM analisis ORDER BY ultimo_uso DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entradas,))
+                self._conexion.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"No se pudo guardar en la caché de análisis: {e}")
+
+    def _escribir_usos(self):
+        """Escribe las horas de uso pendientes, sin confirmar (se llama con el lock tomado)."""
+        if self._usos:
+            self._conexion.executemany(
+                "UPDATE analisis SET ultimo_uso = ? WHERE clave = ?",
+                [(uso, clave) for clave, uso in self._usos.items()])
+            self._usos.clear()
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de uso de la caché.
+
+        Returns:
+            dict: aciertos, fallos, tasa de aciertos y entradas guardadas
+        """
+        entradas = 0
+        if self._conexion is not None:
+            try:
+                with self._lock:
+                    entradas = self._conexion.execute("SELECT COUNT(*) FROM analisis").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        total = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+            "entradas": entradas,
+        }
+
+    def limpiar(self):
+        """Elimina todas las entradas de la caché."""
+        if self._conexion is None:
+            return
+        try:
+            with self._lock:
+                self._usos.clear()
+                self._conexion.execute("DELETE FROM analisis")
+                self._conexion.commit()
+        except sqlite3.Error:
+            pass
+
+    def cerrar(self):
+        """Escribe las horas de uso pendientes y cierra la conexión con el archivo de caché."""
+        if self._conexion is not None:
+            try:
+                with self._lock:
+                    self._escribir_usos()
+                    self._conexion.commit()
+                self._conexion.close()
+            except sqlite3.Error:
+                pass
+            self._conexion = None
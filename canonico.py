@@ -0,0 +1,212 @@
+"""
+Módulo de Forma Canónica de Expresiones
+Hace que las entradas equivalentes compartan el mismo trabajo:
+- Forma normal estable: cada subexpresión polinómica o racional en x se
+  escribe como numerador expandido / denominador expandido (sin simplificar
+  factores comunes, para no cambiar el dominio)
+- Hash-consing: las subexpresiones estructuralmente iguales se internan en
+  una tabla y se representan con un único objeto
+- Hash de contenido de la forma canónica, que usan todas las cachés
+
+Así "x**2 + 2*x + 1", "(x+1)^2" y "x²+2x+1" tienen la misma clave y el mismo
+objeto SymPy, y los resultados de uno sirven para los otros.
+"""
+
+import hashlib
+import threading
+from functools import lru_cache
+
+import sympy as sp
+
+from metricas import METRICAS
+
+X = sp.Symbol('x')
+
+# Versión de la forma canónica: cambiarla invalida las claves guardadas
+VERSION_CANONICA = 1
+
+# Versión del motor de análisis: se incrementa en cada cambio que altere el
+# resultado de una etapa, para que la caché persistente no devuelva resultados
+# viejos (2: estrategias por etapa, 3: dominio por intervalos, 4: recorrido
+# exacto, 5: límites y asíntotas, 6: recorrido de funciones monótonas por tramos,
+# 7: máximo del recorrido numérico, 8: raíces de índice impar con base negativa)
+VERSION_MOTOR = 8
+
+# Grado máximo que se expande; (x+1)**1000 se deja como está
+MAX_GRADO_CANONICO = 12
+
+# Tamaño máximo de la tabla de hash-consing antes de vaciarla
+MAX_INTERNADOS = 50000
+
+
+def _grado_estimado(expr, variable):
+    """Cota superior del grado de una expresión racional, sin expandirla."""
+    if expr.is_Atom:
+        return 1 if expr == variable else 0
+    if expr.is_Pow:
+        exponente = expr.exp
+        if not exponente.is_Integer:
+            return MAX_GRADO_CANONICO + 1
+        return abs(int(exponente)) * _grado_estimado(expr.base, variable)
+    grados = [_grado_estimado(arg, variable) for arg in expr.args]
+    return sum(grados) if expr.is_Mul else max(grados, default=0)
+
+
+def _racional_canonica(expr, variable):
+    """Escribe una expresión racional como numerador/denominador expandidos."""
+    # Camino rápido: polinomios y cocientes de polinomios no necesitan together
+    numerador, denominador = sp.fraction(expr)
+    if not (numerador.is_polynomial(variable) and denominador.is_polynomial(variable)):
+        numerador, denominador = sp.fraction(sp.together(expr))
+    numerador = sp.expand(numerador)
+    denominador = sp.expand(denominador)
+    return numerador if denominador == 1 else numerador / denominador
+
+
+def forma_canonica(expr, variable=X):
+    """
+    Calcula la forma normal de una expresión.
+
+    Las subexpresiones racionales en la variable (de grado acotado) pasan a
+    numerador y denominador expandidos; el resto se recorre sin cambios.
+    Los factores comunes no se cancelan: (x**2 - 4)/(x - 2) conserva el
+    hueco en x = 2.
+
+    Args:
+        expr (sympy.Expr): expresión SymPy
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        sympy.Expr: expresión equivalente en forma canónica
+    """
+    if expr.is_Atom:
+        return expr
+    if (expr.has(variable) and expr.is_rational_function(variable)
+            and _grado_estimado(expr, variable) <= MAX_GRADO_CANONICO):
+        try:
+            return _racional_canonica(expr, variable)
+        except Exception:
+            return expr
+    argumentos = tuple(forma_canonica(arg, variable) for arg in expr.args)
+    if all(nuevo is viejo for nuevo, viejo in zip(argumentos, expr.args)):
+        return expr
+    return expr.func(*argumentos)
+
+
+class TablaInternado:
+    """Tabla de hash-consing: un único objeto por cada subexpresión distinta."""
+
+    def __init__(self, max_entradas=MAX_INTERNADOS):
+        """
+        Args:
+            max_entradas (int): tamaño a partir del cual la tabla se vacía
+        """
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._tabla = {}
+        self._lock = threading.Lock()
+
+    def internar(self, expr):
+        """
+        Devuelve el representante único de la expresión y de sus subexpresiones.
+
+        Args:
+            expr (sympy.Basic): expresión SymPy
+
+        Returns:
+            sympy.Basic: objeto igual a expr, compartido con toda expresión igual
+        """
+        with self._lock:
+            if len(self._tabla) >= self.max_entradas:
+                self._tabla.clear()
+            return self._internar(expr)
+
+    def _internar(self, expr):
+        """Interna de abajo hacia arriba (se llama con el lock tomado)."""
+        existente = self._tabla.get(expr)
+        if existente is not None:
+            self.aciertos += 1
+            return existente
+        self.fallos += 1
+        if expr.args:
+            argumentos = tuple(self._internar(arg) for arg in expr.args)
+            if any(nuevo is not viejo for nuevo, viejo in zip(argumentos, expr.args)):
+                expr = _reconstruir(expr, argumentos)
+        return self._tabla.setdefault(expr, expr)
+
+    def estadisticas(self):
+        """
+        Returns:
+            dict: aciertos, fallos, tasa_aciertos y entradas de la tabla
+        """
+        total = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+            "entradas": len(self._tabla),
+        }
+
+    def limpiar(self):
+        """Vacía la tabla."""
+        with self._lock:
+            self._tabla.clear()
+
+
+def _reconstruir(expr, argumentos):
+    """Arma el mismo nodo con otros argumentos iguales (ya están en forma evaluada)."""
+    try:
+        return expr.func(*argumentos, evaluate=False)
+    except TypeError:
+        return expr.func(*argumentos)
+
+
+# Tabla global de la aplicación
+TABLA = TablaInternado()
+METRICAS.registrar_fuente("internado", TABLA.estadisticas)
+
+
+@lru_cache(maxsize=512)
+def canonizar(expr, variable=X):
+    """
+    Devuelve la forma canónica internada de una expresión.
+
+    Dos expresiones equivalentes según forma_canonica devuelven el mismo
+    objeto, de modo que pueden compararse con "is".
+
+    Args:
+        expr (sympy.Expr): expresión SymPy
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        sympy.Expr: forma canónica internada
+    """
+    return TABLA.internar(forma_canonica(expr, variable))
+
+
+@lru_cache(maxsize=512)
+def clave_canonica(expr, variable=X):
+    """
+    Calcula el hash de contenido de la forma canónica.
+
+    Incluye la versión de SymPy, la de la forma canónica y la del motor de
+    análisis, para que las claves guardadas en disco no se mezclen entre versiones.
+
+    Args:
+        expr (sympy.Expr): expresión SymPy
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        str: hash SHA-256 hexadecimal
+    """
+    texto = (f"{sp.__version__}:c{VERSION_CANONICA}:m{VERSION_MOTOR}:"
+             f"{sp.srepr(canonizar(expr, variable))}")
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def limpiar_caches():
+    """Vacía la tabla de internado y las cachés de formas canónicas y claves."""
+    canonizar.cache_clear()
+    clave_canonica.cache_clear()
+    TABLA.limpiar()
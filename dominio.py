@@ -0,0 +1,614 @@
+"""
+Módulo de Dominio como Conjunto de Intervalos
+Calcula el dominio real de una función y lo representa con estructura, no con texto:
+- ConjuntoReal: unión ordenada y disjunta de intervalos con extremos abiertos
+  o cerrados, más exclusiones periódicas (los polos de tan, sec, cot y csc)
+- Caminos rápidos con raíces reales de polinomios: denominadores ≠ 0,
+  radicandos de raíces pares ≥ 0 y argumentos de logaritmos > 0
+- continuous_domain de SymPy solo para lo que no encaja en esos casos
+- Texto legible armado desde la estructura
+- Tramos del dominio dentro de una ventana, para no muestrear fuera de él
+"""
+
+import math
+import re
+from functools import lru_cache
+
+import sympy as sp
+from sympy.calculus.util import continuous_domain
+
+from metricas import METRICAS, estadisticas_lru
+
+X = sp.Symbol('x')
+
+# Grado máximo de los polinomios cuyas raíces reales se aíslan
+MAX_GRADO_DOMINIO = 30
+
+# Largo máximo de un extremo exacto en el texto; los más largos se muestran en decimal
+MAX_LARGO_EXTREMO = 24
+
+# La constante E de SymPy se muestra como e
+_CONSTANTE_E = re.compile(r'\bE\b')
+
+# Coeficiente numérico seguido de un factor: 3*π -> 3π
+_COEFICIENTE = re.compile(r'(?<![\w.])(\d+)\*(?=π|[xe]\b|\()')
+
+# Funciones definidas en todo ℝ: el dominio es el de su argumento
+_ENTERAS = frozenset(('sin', 'cos', 'exp', 'sinh', 'cosh', 'tanh', 'atan', 'Abs', 'sign',
+                      'floor', 'ceiling'))
+
+# Funciones con polos periódicos: desplazamiento de los polos dentro de cada período π
+_POLOS_PERIODICOS = {
+    'tan': sp.pi / 2,
+    'sec': sp.pi / 2,
+    'cot': sp.S.Zero,
+    'csc': sp.S.Zero,
+}
+
+
+def _valor(extremo):
+    """Valor float de un extremo exacto (±inf para ±∞)."""
+    if extremo is sp.oo:
+        return math.inf
+    if extremo is sp.S.NegativeInfinity:
+        return -math.inf
+    return float(extremo)
+
+
+def _texto(extremo):
+    """Formatea un extremo: exacto si es corto, decimal si es una raíz sin fórmula."""
+    if extremo is sp.oo:
+        return "∞"
+    if extremo is sp.S.NegativeInfinity:
+        return "-∞"
+    if extremo.is_Float or extremo.has(sp.CRootOf):
+        return f"{float(extremo):.4g}"
+    texto = texto_exacto(extremo)
+    if len(texto) > MAX_LARGO_EXTREMO:
+        return f"{float(extremo):.4g}"
+    return texto
+
+
+def texto_exacto(valor):
+    """Escribe un valor exacto de SymPy en notación matemática, p. ej. "3π/2" o "2x + 1"."""
+    texto = _CONSTANTE_E.sub("e", str(valor).replace("pi", "π").replace("**", "^"))
+    return _COEFICIENTE.sub(r"\1", texto).replace("*", "·")
+
+
+def texto_periodico(inicio, periodo):
+    """Formatea los puntos inicio + k·periodo, p. ej. "π/2 + π·k"."""
+    multiplo = "k" if periodo == 1 else f"{_texto(periodo)}·k"
+    if inicio == 0:
+        return multiplo
+    return f"{_texto(inicio)} + {multiplo}"
+
+
+class Intervalo:
+    """Intervalo real con extremos exactos y abiertos o cerrados."""
+
+    __slots__ = ('inf', 'sup', 'abierto_inf', 'abierto_sup', 'a', 'b')
+
+    def __init__(self, inf, sup, abierto_inf=True, abierto_sup=True):
+        """
+        Args:
+            inf (sympy.Expr): extremo inferior (puede ser -oo)
+            sup (sympy.Expr): extremo superior (puede ser oo)
+            abierto_inf (bool): si el extremo inferior queda excluido
+            abierto_sup (bool): si el extremo superior queda excluido
+        """
+        self.inf = sp.sympify(inf)
+        self.sup = sp.sympify(sup)
+        self.a = _valor(self.inf)
+        self.b = _valor(self.sup)
+        # Los extremos infinitos nunca pertenecen al intervalo
+        self.abierto_inf = bool(abierto_inf) or self.a == -math.inf
+        self.abierto_sup = bool(abierto_sup) or self.b == math.inf
+
+    def es_punto(self):
+        """Indica si el intervalo es un único punto [p, p]."""
+        return self.a == self.b
+
+    def contiene(self, valor):
+        """Indica si el valor (float) pertenece al intervalo."""
+        if valor < self.a or valor > self.b:
+            return False
+        if valor == self.a and self.abierto_inf:
+            return False
+        return not (valor == self.b and self.abierto_sup)
+
+    def formatear(self):
+        """Devuelve el intervalo en notación matemática, p. ej. "[-2, 2]"."""
+        if self.es_punto():
+            return f"{{{_texto(self.inf)}}}"
+        apertura = "(" if self.abierto_inf else "["
+        cierre = ")" if self.abierto_sup else "]"
+        return f"{apertura}{_texto(self.inf)}, {_texto(self.sup)}{cierre}"
+
+    def a_sympy(self):
+        """Devuelve el intervalo como conjunto de SymPy."""
+        if self.es_punto():
+            return sp.FiniteSet(self.inf)
+        return sp.Interval(self.inf, self.sup, self.abierto_inf, self.abierto_sup)
+
+    def __repr__(self):
+        return f"Intervalo{self.formatear()}"
+
+
+def _normalizar(intervalos):
+    """Ordena los intervalos y une los que se solapan o se tocan en un extremo incluido."""
+    unidos = []
+    for intervalo in sorted(intervalos, key=lambda i: (i.a, i.abierto_inf)):
+        if unidos:
+            ultimo = unidos[-1]
+            if intervalo.a < ultimo.b or (intervalo.a == ultimo.b and
+                                         not (ultimo.abierto_sup and intervalo.abierto_inf)):
+                if intervalo.b > ultimo.b or (intervalo.b == ultimo.b and not intervalo.abierto_sup):
+                    unidos[-1] = Intervalo(ultimo.inf, intervalo.sup, ultimo.abierto_inf,
+                                           intervalo.abierto_sup)
+                continue
+        unidos.append(intervalo)
+    return unidos
+
+
+class ConjuntoReal:
+    """Subconjunto de ℝ: unión disjunta de intervalos menos exclusiones periódicas."""
+
+    __slots__ = ('intervalos', 'periodicos')
+
+    def __init__(self, intervalos=(), periodicos=()):
+        """
+        Args:
+            intervalos (iterable): Intervalo en cualquier orden; se ordenan y se unen
+            periodicos (iterable): pares (inicio, periodo) de los puntos
+                inicio + k·periodo (k entero) que se excluyen
+        """
+        self.intervalos = tuple(_normalizar(intervalos))
+        self.periodicos = tuple(periodicos)
+
+    @classmethod
+    def reales(cls):
+        """Devuelve ℝ."""
+        return cls([Intervalo(-sp.oo, sp.oo)])
+
+    def es_reales(self):
+        """Indica si el conjunto es todo ℝ."""
+        return (len(self.intervalos) == 1 and not self.periodicos and
+                self.intervalos[0].a == -math.inf and self.intervalos[0].b == math.inf)
+
+    def es_vacio(self):
+        """Indica si el conjunto no tiene puntos."""
+        return not self.intervalos
+
+    def interseccion(self, otro):
+        """
+        Calcula la intersección con otro conjunto, recorriendo ambas listas a la vez.
+
+        Args:
+            otro (ConjuntoReal): conjunto con el que se interseca
+
+        Returns:
+            ConjuntoReal: intersección
+        """
+        resultado = []
+        i = j = 0
+        while i < len(self.intervalos) and j < len(otro.intervalos):
+            p, q = self.intervalos[i], otro.intervalos[j]
+            # El extremo inferior es el mayor de los dos; en empate, abierto si alguno lo es
+            if p.a > q.a:
+                inf, abierto_inf = p.inf, p.abierto_inf
+            elif q.a > p.a:
+                inf, abierto_inf = q.inf, q.abierto_inf
+            else:
+                inf, abierto_inf = p.inf, p.abierto_inf or q.abierto_inf
+            if p.b < q.b:
+                sup, abierto_sup = p.sup, p.abierto_sup
+            elif q.b < p.b:
+                sup, abierto_sup = q.sup, q.abierto_sup
+            else:
+                sup, abierto_sup = p.sup, p.abierto_sup or q.abierto_sup
+            a, b = _valor(inf), _valor(sup)
+            if a < b or (a == b and not (abierto_inf or abierto_sup)):
+                resultado.append(Intervalo(inf, sup, abierto_inf, abierto_sup))
+            # Avanza el que termina primero
+            if p.b < q.b or (p.b == q.b and p.abierto_sup):
+                i += 1
+            else:
+                j += 1
+        return ConjuntoReal(resultado, self.periodicos + otro.periodicos)
+
+    def sin_puntos(self, puntos):
+        """
+        Quita un conjunto finito de puntos.
+
+        Args:
+            puntos (iterable): valores exactos (sympy.Expr) que se excluyen
+
+        Returns:
+            ConjuntoReal: el conjunto sin esos puntos
+        """
+        unicos = sorted({_valor(p): p for p in puntos}.items())
+        if not unicos:
+            return self
+        bordes = [-sp.oo] + [p for _, p in unicos] + [sp.oo]
+        complemento = ConjuntoReal([Intervalo(inf, sup) for inf, sup in zip(bordes, bordes[1:])])
+        return self.interseccion(complemento)
+
+    def contiene(self, valor):
+        """Indica si el valor (float) pertenece al conjunto."""
+        if not any(intervalo.contiene(valor) for intervalo in self.intervalos):
+            return False
+        for inicio, periodo in self.periodicos:
+            k = (valor - float(inicio)) / float(periodo)
+            if abs(k - round(k)) < 1e-12:
+                return False
+        return True
+
+    def tramos(self, a, b):
+        """
+        Devuelve las partes del conjunto dentro de la ventana [a, b].
+
+        Los puntos aislados y las exclusiones periódicas se ignoran: el
+        muestreo ya corta la curva en los polos.
+
+        Args:
+            a (float): inicio de la ventana
+            b (float): fin de la ventana
+
+        Returns:
+            list: pares (inicio, fin) de floats, ordenados
+        """
+        tramos = []
+        for intervalo in self.intervalos:
+            inicio, fin = max(intervalo.a, a), min(intervalo.b, b)
+            if inicio < fin:
+                tramos.append((inicio, fin))
+        return tramos
+
+    def a_sympy(self):
+        """Devuelve el conjunto como conjunto de SymPy."""
+        conjunto = sp.Union(*(intervalo.a_sympy() for intervalo in self.intervalos))
+        if self.periodicos:
+            n = sp.Dummy('n', integer=True)
+            polos = sp.Union(*(sp.ImageSet(sp.Lambda(n, inicio + periodo * n), sp.S.Integers)
+                               for inicio, periodo in self.periodicos))
+            conjunto = sp.Complement(conjunto, polos)
+        return conjunto
+
+    @classmethod
+    def desde_sympy(cls, conjunto):
+        """
+        Convierte un conjunto de SymPy, si tiene una forma representable.
+
+        Args:
+            conjunto (sympy.Set): conjunto real de SymPy
+
+        Returns:
+            ConjuntoReal: el conjunto equivalente, o None si no se puede representar
+        """
+        if conjunto == sp.S.Reals:
+            return cls.reales()
+        if conjunto is sp.S.EmptySet:
+            return cls()
+        if isinstance(conjunto, sp.Interval):
+            return cls([Intervalo(conjunto.start, conjunto.end, conjunto.left_open,
+                                  conjunto.right_open)])
+        if isinstance(conjunto, sp.FiniteSet):
+            if not all(p.is_extended_real and p.is_finite for p in conjunto.args):
+                return None
+            return cls([Intervalo(p, p, False, False) for p in conjunto.args])
+        if isinstance(conjunto, sp.Union):
+            partes = [cls.desde_sympy(parte) for parte in conjunto.args]
+            if any(parte is None or parte.periodicos for parte in partes):
+                return None
+            return cls([intervalo for parte in partes for intervalo in parte.intervalos])
+        if isinstance(conjunto, sp.Complement):
+            base, quitados = conjunto.args
+            base = cls.desde_sympy(base)
+            if base is None:
+                return None
+            if isinstance(quitados, sp.FiniteSet):
+                return base.sin_puntos(quitados.args)
+            periodicos = _periodicos_de_sympy(quitados)
+            if periodicos is None:
+                return None
+            return cls(base.intervalos, base.periodicos + periodicos)
+        return None
+
+    def formatear(self):
+        """
+        Describe el conjunto en notación matemática con una explicación.
+
+        Returns:
+            str: p. ej. "ℝ \\ {0} (Todos los reales excepto cero)"
+        """
+        if self.es_vacio():
+            return "∅ (Ningún número real)"
+        texto, descripcion = self._texto_intervalos()
+        if self.periodicos:
+            polos = ", ".join(texto_periodico(inicio, periodo) for inicio, periodo in self.periodicos)
+            if texto == "ℝ":
+                return f"ℝ \\ {{{polos} : k ∈ ℤ}} (Todos los reales excepto {polos}, con k entero)"
+            return f"{texto} \\ {{{polos} : k ∈ ℤ}}"
+        return f"{texto} ({descripcion})" if descripcion else texto
+
+    def _texto_intervalos(self):
+        """Texto y explicación de la parte de intervalos del conjunto."""
+        intervalos = self.intervalos
+        primero, ultimo = intervalos[0], intervalos[-1]
+        if len(intervalos) == 1:
+            return self._texto_intervalo(primero)
+
+        # ℝ menos una cantidad finita de puntos
+        if (primero.a == -math.inf and ultimo.b == math.inf and
+                all(i.abierto_inf and i.abierto_sup for i in intervalos) and
+                all(p.b == q.a for p, q in zip(intervalos, intervalos[1:]))):
+            puntos = [i.sup for i in intervalos[:-1]]
+            if len(puntos) == 1 and puntos[0] == 0:
+                return "ℝ \\ {0}", "Todos los reales excepto cero"
+            texto = ", ".join(_texto(p) for p in puntos)
+            return f"ℝ \\ {{{texto}}}", f"Todos los reales excepto {texto}"
+        return " ∪ ".join(i.formatear() for i in intervalos), None
+
+    @staticmethod
+    def _texto_intervalo(intervalo):
+        """Texto y explicación de un único intervalo."""
+        texto = intervalo.formatear()
+        if intervalo.a == -math.inf and intervalo.b == math.inf:
+            return "ℝ", "Todos los números reales"
+        if intervalo.es_punto():
+            return texto, "Un único punto"
+        if intervalo.b == math.inf:
+            p = _texto(intervalo.inf)
+            if intervalo.a == 0:
+                return texto, "Solo números positivos" if intervalo.abierto_inf else "Cero y números positivos"
+            return texto, f"Mayores que {p}" if intervalo.abierto_inf else f"Mayores o iguales que {p}"
+        if intervalo.a == -math.inf:
+            p = _texto(intervalo.sup)
+            return texto, f"Menores que {p}" if intervalo.abierto_sup else f"Menores o iguales que {p}"
+        return texto, f"Entre {_texto(intervalo.inf)} y {_texto(intervalo.sup)}"
+
+    def __str__(self):
+        return self.formatear()
+
+    def __repr__(self):
+        return f"ConjuntoReal({self.formatear()!r})"
+
+
+def _periodicos_de_sympy(conjunto):
+    """Convierte una unión de ImageSet lineales sobre ℤ en pares (inicio, periodo), o None."""
+    partes = conjunto.args if isinstance(conjunto, sp.Union) else (conjunto,)
+    periodicos = []
+    for parte in partes:
+        if not isinstance(parte, sp.ImageSet) or parte.base_set != sp.S.Integers:
+            return None
+        n, = parte.lamda.variables
+        expresion = parte.lamda.expr
+        periodo = sp.diff(expresion, n)
+        if periodo.has(n) or periodo == 0:
+            return None
+        periodicos.append((expresion.subs(n, 0), periodo))
+    return tuple(periodicos)
+
+
+@lru_cache(maxsize=512)
+def raices_reales(polinomio):
+    """
+    Raíces reales distintas de un polinomio, en orden creciente.
+
+    Con coeficientes racionales son exactas (radicales o CRootOf); con otros
+    coeficientes (π, e) son exactas hasta grado 2 y aproximadas con nroots
+    desde grado 3.
+
+    Args:
+        polinomio (sympy.Poly): polinomio en una variable
+
+    Returns:
+        tuple: raíces como sympy.Expr, o None si el grado es demasiado alto
+    """
+    grado = polinomio.degree()
+    if grado > MAX_GRADO_DOMINIO:
+        return None
+    if grado <= 0:
+        return ()
+    if polinomio.domain.is_ZZ or polinomio.domain.is_QQ:
+        return tuple(dict.fromkeys(polinomio.real_roots()))
+    if grado <= 2:
+        # Fórmula cerrada: x**2 - π tiene raíces ±√π exactas
+        return tuple(sorted((raiz for raiz in sp.roots(polinomio) if raiz.is_real), key=_valor))
+    raices = []
+    for raiz in polinomio.nroots():
+        real, imaginaria = raiz.as_real_imag()
+        if abs(imaginaria) <= 1e-10 * max(1.0, abs(real)):
+            raices.append(sp.Float(real))
+    return tuple(sorted(dict.fromkeys(raices), key=_valor))
+
+
+def _conjunto_signo(expr, x, relacion):
+    """
+    Resuelve expr > 0, expr ≥ 0 o expr ≠ 0 para una expresión racional en x.
+
+    Args:
+        expr (sympy.Expr): expresión racional en x
+        x (sympy.Symbol): variable independiente
+        relacion (str): '>', '>=' o '!='
+
+    Returns:
+        ConjuntoReal: puntos donde se cumple (sin contar los polos), o None si
+        la expresión no es racional o sus raíces no se pueden aislar
+    """
+    numerador, denominador = sp.fraction(expr)
+    if not (numerador.is_polynomial(x) and denominador.is_polynomial(x)):
+        numerador, denominador = sp.fraction(sp.together(expr))
+    try:
+        p_numerador = sp.Poly(numerador, x)
+        p_denominador = sp.Poly(denominador, x)
+    except sp.PolynomialError:
+        return None
+    if p_numerador.free_symbols - {x} or p_denominador.free_symbols - {x}:
+        return None
+    ceros = raices_reales(p_numerador)
+    polos = raices_reales(p_denominador)
+    if ceros is None or polos is None:
+        return None
+    if relacion == '!=':
+        return ConjuntoReal.reales().sin_puntos(ceros)
+
+    # Puntos críticos ordenados; entre dos consecutivos el signo no cambia
+    criticos = {_valor(c): c for c in polos}
+    criticos.update({_valor(c): c for c in ceros})
+    orden = sorted(criticos)
+    bordes = [-math.inf] + orden + [math.inf]
+    exactos = [-sp.oo] + [criticos[v] for v in orden] + [sp.oo]
+    intervalos = []
+    for k in range(len(bordes) - 1):
+        a, b = bordes[k], bordes[k + 1]
+        if a == -math.inf:
+            prueba = (b - 1) if b != math.inf else 0.0
+        elif b == math.inf:
+            prueba = a + 1
+        else:
+            prueba = (a + b) / 2
+        prueba = sp.Rational(prueba)
+        signo = float(p_numerador.eval(prueba)) * float(p_denominador.eval(prueba))
+        if signo > 0:
+            intervalos.append(Intervalo(exactos[k], exactos[k + 1]))
+    if relacion == '>=':
+        valores_polos = {_valor(c) for c in polos}
+        intervalos.extend(Intervalo(c, c, False, False) for c in ceros
+                          if _valor(c) not in valores_polos)
+    return ConjuntoReal(intervalos)
+
+
+def _polos_periodicos(nombre, argumento, x):
+    """Exclusiones periódicas de tan, sec, cot o csc de un argumento lineal, o None."""
+    try:
+        polinomio = sp.Poly(argumento, x)
+    except sp.PolynomialError:
+        return None
+    if polinomio.degree() != 1 or polinomio.free_symbols - {x}:
+        return None
+    pendiente, ordenada = polinomio.all_coeffs()
+    inicio = sp.simplify((_POLOS_PERIODICOS[nombre] - ordenada) / pendiente)
+    return ConjuntoReal([Intervalo(-sp.oo, sp.oo)], [(inicio, sp.pi / abs(pendiente))])
+
+
+def _dominio_expresion(expr, x):
+    """Dominio de una expresión por casos conocidos, o None si alguno no encaja."""
+    if not expr.has(x) or expr == x:
+        return ConjuntoReal.reales()
+
+    if expr.is_Add or expr.is_Mul:
+        conjunto = ConjuntoReal.reales()
+        for arg in expr.args:
+            parte = _dominio_expresion(arg, x)
+            if parte is None:
+                return None
+            conjunto = conjunto.interseccion(parte)
+        return conjunto
+
+    if expr.is_Pow:
+        base, exponente = expr.args
+        if exponente.has(x):
+            # a**g(x) solo con base constante positiva
+            if base.has(x) or not base.is_positive:
+                return None
+            return _dominio_expresion(exponente, x)
+        conjunto = _dominio_expresion(base, x)
+        if conjunto is None or (exponente.is_Integer and exponente >= 0):
+            return conjunto
+        if exponente.is_Integer or (exponente.is_Rational and exponente.q % 2 == 1):
+            # Las raíces de índice impar son reales también con base negativa
+            if exponente.is_positive:
+                return conjunto
+            condicion = _conjunto_signo(base, x, '!=')
+        elif exponente.is_extended_real:
+            # Índice par o exponente irracional: con base negativa no hay valor real
+            condicion = _conjunto_signo(base, x, '>=' if exponente.is_positive else '>')
+        else:
+            return None
+        return None if condicion is None else conjunto.interseccion(condicion)
+
+    nombre = type(expr).__name__
+    if len(expr.args) != 1:
+        return None
+    argumento = expr.args[0]
+    conjunto = _dominio_expresion(argumento, x)
+    if conjunto is None or nombre in _ENTERAS:
+        return conjunto
+    if nombre == 'log':
+        condicion = _conjunto_signo(argumento, x, '>')
+    elif nombre in ('asin', 'acos'):
+        condicion = _conjunto_signo(1 - argumento, x, '>=')
+        if condicion is not None:
+            otra = _conjunto_signo(1 + argumento, x, '>=')
+            condicion = None if otra is None else condicion.interseccion(otra)
+    elif nombre in _POLOS_PERIODICOS:
+        condicion = _polos_periodicos(nombre, argumento, x)
+    else:
+        return None
+    return None if condicion is None else conjunto.interseccion(condicion)
+
+
+@lru_cache(maxsize=256)
+def dominio_rapido(funcion_sympy, x=X):
+    """
+    Calcula el dominio solo por los caminos rápidos, sin continuous_domain.
+
+    Sirve cuando hay que responder enseguida (p. ej. al graficar): si la
+    expresión tiene algo fuera de los casos conocidos devuelve None.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        ConjuntoReal: dominio, o None si no hay camino rápido
+    """
+    try:
+        return _dominio_expresion(funcion_sympy, x)
+    except Exception as e:
+        print(f"Error en el camino rápido del dominio: {e}")
+        return None
+
+
+METRICAS.registrar_fuente("dominio", estadisticas_lru(dominio_rapido))
+METRICAS.registrar_fuente("raices", estadisticas_lru(raices_reales))
+
+
+def limpiar_caches():
+    """Vacía las cachés de dominios y de raíces reales."""
+    dominio_rapido.cache_clear()
+    raices_reales.cache_clear()
+
+
+def _texto_sympy(conjunto):
+    """Texto de un conjunto de SymPy que no se pudo convertir."""
+    texto = str(conjunto).replace("Interval.open", "").replace("Interval", "")
+    return texto.replace("Union", "∪").replace("-oo", "-∞").replace("oo", "∞")
+
+
+def describir_dominio(funcion_sympy, x=X):
+    """
+    Describe el dominio real de una función.
+
+    Prueba primero los caminos rápidos; si no alcanzan, usa continuous_domain
+    y convierte su resultado a ConjuntoReal.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        str: descripción del dominio
+    """
+    conjunto = dominio_rapido(funcion_sympy, x)
+    if conjunto is not None:
+        METRICAS.contar("dominio.rapido")
+        return conjunto.formatear()
+
+    METRICAS.contar("dominio.continuous_domain")
+    conjunto_sympy = continuous_domain(funcion_sympy, x, sp.S.Reals)
+    conjunto = ConjuntoReal.desde_sympy(conjunto_sympy)
+    if conjunto is None:
+        return _texto_sympy(conjunto_sympy)
+    return conjunto.formatear()
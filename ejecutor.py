@@ -0,0 +1,155 @@
+"""
+Módulo Ejecutor de Trabajos en Segundo Plano
+Ejecuta el trabajo pesado de SymPy fuera del hilo principal de Tk:
+- Los resultados vuelven al hilo de Tk mediante root.after
+- Un trabajo nuevo reemplaza y cancela al anterior del mismo canal
+- Los trabajos pueden publicar resultados parciales mientras avanzan
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class EjecutorAnalisis:
+    """Ejecuta trabajos en hilos de fondo y entrega sus resultados en el hilo de Tk."""
+
+    def __init__(self, root, intervalo_ms=30, max_hilos=2):
+        """
+        Args:
+            root: ventana raíz de Tk que recibe los resultados
+            intervalo_ms (int): cada cuánto se revisan los trabajos terminados
+            max_hilos (int): cantidad de hilos de fondo
+        """
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="analisis")
+        self._terminados = queue.Queue()
+        self._avances = queue.Queue()
+        self._vigentes = {}  # canal -> (id de trabajo, futuro, evento de cancelación)
+        self._contador = 0
+        self._after_id = None
+        self._cerrado = False
+
+    def enviar(self, canal, trabajo, al_terminar, al_fallar=None, al_avanzar=None):
+        """
+        Envía un trabajo a segundo plano, reemplazando al vigente del mismo canal.
+
+        El trabajo recibe un threading.Event que se activa si el trabajo queda
+        obsoleto, para que pueda detenerse entre etapas. Si se indica
+        al_avanzar, recibe además una función avanzar(valor) para publicar
+        resultados parciales.
+
+        Args:
+            canal (str): nombre del canal (p. ej. "analisis")
+            trabajo (callable): función trabajo(cancelado[, avanzar]) a ejecutar en el fondo
+            al_terminar (callable): recibe el resultado, en el hilo de Tk
+            al_fallar (callable): recibe la excepción, en el hilo de Tk
+            al_avanzar (callable): recibe cada resultado parcial, en el hilo de Tk
+        """
+        if self._cerrado:
+            return
+
+        self.cancelar(canal)
+        self._contador += 1
+        id_trabajo = self._contador
+        cancelado = threading.Event()
+
+        if al_avanzar is None:
+            futuro = self._pool.submit(trabajo, cancelado)
+        else:
+            def avanzar(valor):
+                self._avances.put((canal, id_trabajo, valor, al_avanzar))
+            futuro = self._pool.submit(trabajo, cancelado, avanzar)
+        self._vigentes[canal] = (id_trabajo, futuro, cancelado)
+        futuro.add_done_callback(
+            lambda f: self._terminados.put((canal, id_trabajo, f, al_terminar, al_fallar)))
+        self._programar_revision()
+
+    def cancelar(self, canal):
+        """Cancela el trabajo vigente de un canal; su resultado se descartará."""
+        vigente = self._vigentes.pop(canal, None)
+        if vigente is not None:
+            _, futuro, cancelado = vigente
+            cancelado.set()
+            futuro.cancel()
+
+    def ocupado(self, canal=None):
+        """
+        Indica si hay trabajos vigentes.
+
+        Args:
+            canal (str): canal a consultar; None consulta todos
+
+        Returns:
+            bool: True si hay al menos un trabajo sin entregar
+        """
+        if canal is None:
+            return bool(self._vigentes)
+        return canal in self._vigentes
+
+    def _programar_revision(self):
+        """Programa la revisión de trabajos terminados en el hilo de Tk."""
+        if self._after_id is None and not self._cerrado:
+            try:
+                self._after_id = self.root.after(self.intervalo_ms, self._revisar)
+            except Exception:
+                self._after_id = None
+
+    def _revisar(self):
+        """Entrega los resultados de los trabajos terminados que siguen vigentes."""
+        self._after_id = None
+        # Primero se toman los terminados y luego se entregan los avances: todo
+        # avance de un trabajo ya terminado está en la cola antes que su final
+        terminados = []
+        while True:
+            try:
+                terminados.append(self._terminados.get_nowait())
+            except queue.Empty:
+                break
+
+        while True:
+            try:
+                canal, id_trabajo, valor, al_avanzar = self._avances.get_nowait()
+            except queue.Empty:
+                break
+            vigente = self._vigentes.get(canal)
+            if vigente is None or vigente[0] != id_trabajo:
+                continue
+            try:
+                al_avanzar(valor)
+            except Exception as e:
+                print(f"Error al entregar avance ({canal}): {e}")
+
+        for canal, id_trabajo, futuro, al_terminar, al_fallar in terminados:
+            vigente = self._vigentes.get(canal)
+            if vigente is None or vigente[0] != id_trabajo or futuro.cancelled():
+                continue  # Trabajo reemplazado por uno más reciente
+            del self._vigentes[canal]
+
+            error = futuro.exception()
+            try:
+                if error is None:
+                    al_terminar(futuro.result())
+                elif al_fallar is not None:
+                    al_fallar(error)
+                else:
+                    print(f"Error en trabajo de fondo ({canal}): {error}")
+            except Exception as e:
+                print(f"Error al entregar resultado ({canal}): {e}")
+
+        if self._vigentes:
+            self._programar_revision()
+
+    def cerrar(self):
+        """Cancela todos los trabajos y detiene los hilos de fondo."""
+        self._cerrado = True
+        for canal in list(self._vigentes):
+            self.cancelar(canal)
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -4,24 +4,359 @@ Usa matplotlib + sympy para graficar funciones con:
 - Ejes claramente etiquetados
 - Intersecciones con X e Y
 - Punto evaluado destacado
+- Zoom con la rueda del mouse y desplazamiento arrastrando
+- Escala en Y que ignora la vecindad de las asíntotas verticales
+
+La figura y el canvas se crean una sola vez; cada gráfico nuevo solo
+actualiza los datos de la curva, los puntos y el título. El punto evaluado
+se dibuja con blitting, sin redibujar el resto de la figura. Al mover la
+vista se avisa a quien la muestra para que vuelva a muestrear la curva con
+un punto por píxel del ancho de los ejes. Las muestras se guardan en una
+caché en memoria, así volver a graficar la misma curva solo cuesta dibujarla.
 """
 
-import matplotlib.pyplot as plt
-import sympy as sp
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from asintotas import calcular_asintotas
+from cache_analisis import clave_expresion
+from dominio import dominio_rapido
+from metricas import METRICAS
+from muestreo import muestrear_adaptativo
+
+SIN_PUNTOS = np.empty((0, 2))
+FACTOR_ZOOM = 1.2  # cuánto se acerca o aleja cada paso de la rueda
+ANCHO_MINIMO = 1e-9  # ancho mínimo de la vista, relativo a su centro
+ANCHO_MAXIMO = 1e12
+MAX_BYTES_MUESTRAS = 32 * 1024 * 1024
+MIN_PUNTOS_TRAMO = 16  # resolución mínima de cada tramo del dominio
+MARGEN_POLO = 0.01  # fracción del ancho de la ventana junto a cada polo que no cuenta al escalar Y
+BANDA_RECORTE = 10  # alturas de la vista más allá de las cuales se recortan los valores
+LIMITE_SIN_POLOS = 1e6  # corte de valores absurdos si no se conocen los polos
+CALCULAR_POLOS = object()  # crear_grafico busca los polos por su cuenta
+
+
+def _redondear(valor, cifras=3):
+    """Redondea a cifras significativas para que vistas casi iguales compartan clave."""
+    return None if valor is None else float(f"{valor:.{cifras}g}")
+
+
+def muestrear_en_dominio(funcion_sympy, x_range, n_puntos, escala_y=None):
+    """
+    Muestrea la curva solo dentro del dominio de la función.
+
+    Si el dominio se conoce por los caminos rápidos, cada tramo dentro de la
+    ventana se muestrea por separado (con puntos proporcionales a su ancho)
+    y los tramos se unen con NaN, así no se evalúa donde la función no
+    existe y la curva llega hasta los bordes del dominio. Si no se conoce,
+    se muestrea la ventana completa.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x_range (tuple): rango de valores en X
+        n_puntos (int): resolución máxima del muestreo
+        escala_y (float): alto de la vista en Y; None la estima de los datos
+
+    Returns:
+        tuple: (xs, ys) como arreglos de NumPy
+    """
+    a, b = x_range
+    dominio = dominio_rapido(funcion_sympy)
+    if dominio is None or dominio.es_reales():
+        return muestrear_adaptativo(funcion_sympy, (a, b), n_puntos, escala_y=escala_y)
+    tramos = dominio.tramos(a, b)
+    if tramos == [(a, b)]:
+        return muestrear_adaptativo(funcion_sympy, (a, b), n_puntos, escala_y=escala_y)
+    if not tramos:
+        return np.array([a, b]), np.array([np.nan, np.nan])
+
+    partes_x, partes_y = [], []
+    for inicio, fin in tramos:
+        n = max(MIN_PUNTOS_TRAMO, int(n_puntos * (fin - inicio) / (b - a)))
+        xs, ys = muestrear_adaptativo(funcion_sympy, (inicio, fin), n, escala_y=escala_y)
+        if partes_x:
+            partes_x.append([inicio])
+            partes_y.append([np.nan])
+        partes_x.append(xs)
+        partes_y.append(ys)
+    return np.concatenate(partes_x), np.concatenate(partes_y)
+
+
+def polos_en_ventana(funcion_sympy, x_range):
+    """
+    Asíntotas verticales de la función dentro de la ventana.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x_range (tuple): rango de valores en X
+
+    Returns:
+        list: abscisas de los polos, o None si no se conocen todos
+    """
+    asintotas = calcular_asintotas(funcion_sympy, respaldo=False)
+    if asintotas is None or not asintotas.completas:
+        return None
+    return asintotas.polos_en(*x_range)
+
+
+def limites_y(xs, ys, polos, ancho):
+    """
+    Rango en Y de las muestras, sin las vecindades de los polos.
+
+    Args:
+        xs (numpy.ndarray): valores de x muestreados
+        ys (numpy.ndarray): valores de f(x)
+        polos (list): abscisas de los polos
+        ancho (float): ancho de la ventana en X
+
+    Returns:
+        tuple: (y_min, y_max), o None si no queda ningún valor finito
+    """
+    validos = np.isfinite(ys)
+    lejos = validos.copy()
+    for polo in polos:
+        lejos &= np.abs(xs - polo) > MARGEN_POLO * ancho
+    if lejos.any():
+        validos = lejos
+    if not validos.any():
+        return None
+    return float(ys[validos].min()), float(ys[validos].max())
+
+
+def recortar(ys, y_min, y_max):
+    """Recorta los valores a una banda alrededor de [y_min, y_max]; la curva sale de la vista sin perderse."""
+    alto = max(y_max - y_min, ANCHO_MINIMO * (1 + abs(y_min) + abs(y_max)))
+    return np.clip(ys, y_min - BANDA_RECORTE * alto, y_max + BANDA_RECORTE * alto)
+
+
+class CacheMuestras:
+    """Caché en memoria de muestras de curvas, acotada en bytes con expulsión LRU."""
+
+    def __init__(self, max_bytes=MAX_BYTES_MUESTRAS):
+        """
+        Args:
+            max_bytes (int): tamaño máximo del total de arreglos guardados
+        """
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # (expresión, x_min, x_max, n, escala) -> (xs, ys)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.parciales = 0
+        self.fallos = 0
+
+    def muestrear(self, funcion_sympy, x_range, n_puntos, escala_y=None):
+        """
+        Devuelve las muestras de la curva, evaluando solo lo que no está guardado.
+
+        Si una vista de la misma resolución se solapa con la pedida (al
+        desplazar el gráfico), se reutiliza la parte común y solo se muestrean
+        los bordes nuevos.
+
+        Args:
+            funcion_sympy (sympy.Expr): función en formato SymPy
+            x_range (tuple): rango de valores en X
+            n_puntos (int): resolución máxima del muestreo
+            escala_y (float): alto de la vista en Y; None la estima de los datos
+
+        Returns:
+            tuple: (xs, ys) como arreglos de NumPy de solo lectura
+        """
+        a, b = float(x_range[0]), float(x_range[1])
+        n_puntos = int(n_puntos)
+        clave = (clave_expresion(funcion_sympy), a, b, n_puntos, _redondear(escala_y))
+
+        with self._lock:
+            guardado = self._entradas.get(clave)
+            if guardado is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return guardado
+            solapada = self._buscar_solapada(clave) if escala_y is not None else None
+
+        if solapada is None:
+            xs, ys = muestrear_en_dominio(funcion_sympy, (a, b), n_puntos, escala_y=escala_y)
+        else:
+            xs, ys = self._completar(funcion_sympy, clave, solapada, escala_y)
+
+        with self._lock:
+            if solapada is None:
+                self.fallos += 1
+            else:
+                self.parciales += 1
+            return self._guardar(clave, xs, ys)
+
+    def _buscar_solapada(self, clave):
+        """Busca una entrada de la misma curva y resolución que cubra al menos media vista."""
+        expresion, a, b, n_puntos, escala = clave
+        paso = (b - a) / max(n_puntos - 1, 1)
+        for (otra, a_prev, b_prev, n_prev, escala_prev), muestras in reversed(self._entradas.items()):
+            if otra != expresion or escala_prev != escala:
+                continue
+            paso_prev = (b_prev - a_prev) / max(n_prev - 1, 1)
+            if abs(paso_prev - paso) > 1e-9 * abs(paso):
+                continue
+            if min(b, b_prev) - max(a, a_prev) >= 0.5 * (b - a):
+                return a_prev, b_prev, muestras
+        return None
+
+    def _completar(self, funcion_sympy, clave, solapada, escala_y):
+        """Une la parte común de una vista guardada con los bordes recién muestreados."""
+        _, a, b, n_puntos, _ = clave
+        a_prev, b_prev, (xs_prev, ys_prev) = solapada
+        paso = (b - a) / max(n_puntos - 1, 1)
+
+        def borde(inicio, fin):
+            n = max(3, int(round((fin - inicio) / paso)) + 1)
+            return muestrear_en_dominio(funcion_sympy, (inicio, fin), n, escala_y=escala_y)
+
+        partes_x, partes_y = [], []
+        if a < a_prev:
+            xs, ys = borde(a, a_prev)
+            partes_x.append(xs[:-1])
+            partes_y.append(ys[:-1])
+        # Un punto más a cada lado para que la línea llegue hasta el borde de la vista
+        inicio = max(np.searchsorted(xs_prev, a, side="right") - 1, 0)
+        fin = np.searchsorted(xs_prev, b, side="left") + 1
+        partes_x.append(xs_prev[inicio:fin])
+        partes_y.append(ys_prev[inicio:fin])
+        if b > b_prev:
+            xs, ys = borde(b_prev, b)
+            partes_x.append(xs[1:])
+            partes_y.append(ys[1:])
+        return np.concatenate(partes_x), np.concatenate(partes_y)
+
+    def _guardar(self, clave, xs, ys):
+        """Guarda las muestras y expulsa las menos usadas si se excede el tamaño."""
+        # Solo lectura: quien las reciba no puede alterar la copia guardada
+        xs.setflags(write=False)
+        ys.setflags(write=False)
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            self._bytes -= anterior[0].nbytes + anterior[1].nbytes
+        self._entradas[clave] = (xs, ys)
+        self._bytes += xs.nbytes + ys.nbytes
+        while self._bytes > self.max_bytes and len(self._entradas) > 1:
+            _, (xs_viejo, ys_viejo) = self._entradas.popitem(last=False)
+            self._bytes -= xs_viejo.nbytes + ys_viejo.nbytes
+        return xs, ys
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de uso de la caché.
+
+        Returns:
+            dict: aciertos, reutilizaciones parciales, fallos, tasa de aciertos,
+                entradas y bytes ocupados
+        """
+        with self._lock:
+            total = self.aciertos + self.parciales + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "parciales": self.parciales,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / total if total else 0.0,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+            }
+
+    def limpiar(self):
+        """Elimina todas las muestras guardadas."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
 
 class GraficadorFunciones:
     """Clase para graficar funciones simbólicas con Matplotlib."""
 
-    def __init__(self):
+    def __init__(self, cache_muestras=None):
+        """
+        Args:
+            cache_muestras (CacheMuestras): caché de muestras; None crea una nueva
+        """
+        self.muestras = cache_muestras if cache_muestras is not None else CacheMuestras()
+        METRICAS.registrar_fuente("cache_muestras", self.muestras.estadisticas)
         self.figura = None
         self.ejes = None
+        self.canvas = None
+        self._linea = None
+        self._puntos_x = None
+        self._punto_y = None
+        self._punto = None
+        self._etiqueta_punto = None
+        self._fondo = None
+        self._arrastre = None
+        # Con los polos conocidos la curva se recorta a la vista; si no, se descartan valores absurdos
+        self._polos_conocidos = False
+        # Se llama con (x_min, x_max, n_pixeles, alto_y) cada vez que el usuario mueve la vista
+        self.al_cambiar_vista = None
+
+    def _construir_figura(self):
+        """Crea la figura, los ejes y los artistas que luego se reutilizan."""
+        self.figura = Figure(figsize=(7, 5))
+        FigureCanvasAgg(self.figura)
+        self.ejes = self.figura.add_subplot()
+
+        self._linea, = self.ejes.plot([], [], color="blue")
+        self._puntos_x = self.ejes.scatter([], [], color="red", s=60, marker="o", label="Intersección X")
+        self._punto_y = self.ejes.scatter([], [], color="green", s=60, marker="o", label="Intersección Y")
+        self._punto = self.ejes.scatter([], [], color="orange", s=80, marker="x", label="Punto evaluado")
+        self._etiqueta_punto = self.ejes.annotate("", (0, 0), xytext=(8, 8), textcoords="offset points",
+                                                  color="darkorange", fontsize=9)
 
+        # Ejes y formato
+        self.ejes.axhline(0, color="black", linewidth=1)
+        self.ejes.axvline(0, color="black", linewidth=1)
+
+        self.ejes.set_title("", fontsize=14, fontweight="bold")
+        self.ejes.set_xlabel("Eje X")
+        self.ejes.set_ylabel("Eje Y")
+        self.ejes.grid(True, linestyle="--", alpha=0.6)
+
+        self.figura.tight_layout()
+
+    def vincular_canvas(self, master):
+        """
+        Crea (una sola vez) el canvas de Tk que muestra la figura.
+
+        Args:
+            master: widget de Tk donde se inserta el canvas
+
+        Returns:
+            FigureCanvasTkAgg: canvas persistente de la figura
+        """
+        if self.canvas is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            if self.figura is None:
+                self._construir_figura()
+            self.canvas = FigureCanvasTkAgg(self.figura, master)
+            # Medir cada dibujado completo (draw_idle termina llamando a draw)
+            self.canvas.draw = METRICAS.medido("grafico.dibujo")(self.canvas.draw)
+            # En pantalla el punto evaluado se anima: se dibuja con blitting sobre
+            # el fondo que se guarda tras cada dibujado completo
+            self._punto.set_animated(True)
+            self._etiqueta_punto.set_animated(True)
+            self.canvas.mpl_connect("draw_event", self._al_dibujar)
+            self.canvas.mpl_connect("scroll_event", self._al_girar_rueda)
+            self.canvas.mpl_connect("button_press_event", self._al_presionar)
+            self.canvas.mpl_connect("motion_notify_event", self._al_arrastrar)
+            self.canvas.mpl_connect("button_release_event", self._al_soltar)
+        return self.canvas
+
+    @METRICAS.medido("grafico.crear")
     def crear_grafico(self, funcion_sympy, x_range=(-10, 10),
                       intersecciones_x=None, interseccion_y=None,
-                      punto_evaluado=None, titulo="Gráfico de f(x)"):
+                      punto_evaluado=None, titulo="Gráfico de f(x)",
+                      n_puntos=None, polos=CALCULAR_POLOS):
         """
         Genera un gráfico de la función.
-        
+
         Args:
             funcion_sympy (sympy.Expr): función en formato SymPy
             x_range (tuple): rango de valores en X
@@ -29,66 +364,269 @@ class GraficadorFunciones:
             interseccion_y (float): valor de f(0)
             punto_evaluado (tuple): coordenada (x,y) evaluada
             titulo (str): título del gráfico
-        
+            n_puntos (int): resolución máxima del muestreo de la curva; nunca
+                más que píxeles tiene el ancho de los ejes (None usa ese ancho)
+            polos (list): polos en la ventana ya calculados (polos_en_ventana),
+                None si no se conocen; por omisión se calculan aquí
+
         Returns:
             matplotlib.figure.Figure: figura generada
         """
         try:
-            # Crear nueva figura
-            self.figura, self.ejes = plt.subplots(figsize=(7, 5))
-            
-            # Generar valores X sin numpy (solo lista de floats)
-            xs = [i/10 for i in range(x_range[0]*10, x_range[1]*10 + 1)]
-            ys = []
-            for val in xs:
-                try:
-                    y_val = float(funcion_sympy.subs(sp.Symbol('x'), val))
-                    if abs(y_val) < 1e6:  # limitar valores absurdos
-                        ys.append(y_val)
-                    else:
-                        ys.append(None)
-                except:
-                    ys.append(None)
-
-            # Graficar la curva principal
-            self.ejes.plot(xs, ys, label=f"f(x) = {funcion_sympy}", color="blue")
+            if self.figura is None:
+                self._construir_figura()
+
+            # Muestreo adaptativo: más puntos solo donde la curva lo necesita,
+            # y la línea se corta en polos y saltos
+            n_pixeles = self.ancho_pixeles()
+            n_puntos = n_pixeles if n_puntos is None else min(int(n_puntos), n_pixeles)
+            xs, ys = self.muestras.muestrear(funcion_sympy, x_range, n_puntos)
+            ys = np.where(np.isfinite(ys), ys, np.nan)
+
+            # Junto a los polos la escala en Y se toma de fuera de su vecindad y la
+            # curva se recorta; sin polos los valores grandes son legítimos (exp(x))
+            if polos is CALCULAR_POLOS:
+                polos = polos_en_ventana(funcion_sympy, x_range)
+            self._polos_conocidos = polos is not None
+            rango_y = None
+            if polos is None:
+                ys = np.where(np.abs(ys) >= LIMITE_SIN_POLOS, np.nan, ys)  # limitar valores absurdos
+            elif polos:
+                rango_y = limites_y(xs, ys, polos, x_range[1] - x_range[0])
+                if rango_y is not None:
+                    ys = recortar(ys, *rango_y)
+
+            # Actualizar la curva principal
+            self._linea.set_data(xs, ys)
+            self._linea.set_label(f"f(x) = {funcion_sympy}")
 
             # Intersecciones en X
             if intersecciones_x:
-                for x0 in intersecciones_x:
-                    self.ejes.scatter(x0, 0, color="red", s=60, marker="o", label="Intersección X")
+                self._puntos_x.set_offsets(np.column_stack([intersecciones_x, np.zeros(len(intersecciones_x))]))
+            else:
+                self._puntos_x.set_offsets(SIN_PUNTOS)
 
             # Intersección en Y
             if interseccion_y is not None:
-                self.ejes.scatter(0, interseccion_y, color="green", s=60, marker="o", label="Intersección Y")
-
-            # Punto evaluado
-            if punto_evaluado is not None:
-                self.ejes.scatter(punto_evaluado[0], punto_evaluado[1],
-                                  color="orange", s=80, marker="x", label=f"Punto ({punto_evaluado[0]}, {punto_evaluado[1]})")
-
-            # Ejes y formato
-            self.ejes.axhline(0, color="black", linewidth=1)
-            self.ejes.axvline(0, color="black", linewidth=1)
+                self._punto_y.set_offsets([[0, interseccion_y]])
+            else:
+                self._punto_y.set_offsets(SIN_PUNTOS)
 
             self.ejes.set_title(titulo, fontsize=14, fontweight="bold")
-            self.ejes.set_xlabel("Eje X")
-            self.ejes.set_ylabel("Eje Y")
-            self.ejes.grid(True, linestyle="--", alpha=0.6)
-            self.ejes.legend(loc="best", fontsize=9)
+            # Un gráfico nuevo descarta el zoom anterior y ajusta la vista a los datos
+            self.ejes.set_autoscale_on(True)
+            self.ejes.relim()
+            if punto_evaluado is not None:
+                self.ejes.update_datalim([punto_evaluado])
+            self.ejes.autoscale_view()
+            if rango_y is not None:
+                self._ajustar_y(rango_y, punto_evaluado)
+            self._actualizar_leyenda(intersecciones_x, interseccion_y)
 
-            self.figura.tight_layout()
+            self._fijar_punto(punto_evaluado)
+            self._dibujar()
             return self.figura
 
         except Exception as e:
             print(f"Error al crear gráfico: {e}")
             return None
 
+    def mostrar_punto(self, punto_evaluado):
+        """
+        Actualiza solo el punto evaluado, usando blitting cuando es posible.
+
+        Args:
+            punto_evaluado (tuple): coordenada (x,y) evaluada, o None para ocultarlo
+        """
+        if self.figura is None:
+            return
+
+        self._fijar_punto(punto_evaluado)
+        x_min, x_max = self.ejes.get_xlim()
+        y_min, y_max = self.ejes.get_ylim()
+        visible = punto_evaluado is None or (
+            x_min <= punto_evaluado[0] <= x_max and y_min <= punto_evaluado[1] <= y_max)
+
+        if self.canvas is None or self._fondo is None or not visible:
+            # Sin fondo guardado o fuera de la vista: redibujar todo
+            if not visible:
+                self.ejes.set_autoscale_on(True)
+                self.ejes.update_datalim([punto_evaluado])
+                self.ejes.autoscale_view()
+                self._avisar_cambio_vista()
+            self._dibujar()
+            return
+
+        with METRICAS.medir("grafico.blit"):
+            self.canvas.restore_region(self._fondo)
+            self._dibujar_animados()
+            self.canvas.blit(self.ejes.bbox)
+
+    def ancho_pixeles(self):
+        """
+        Ancho de los ejes en píxeles de pantalla.
+
+        Returns:
+            int: cantidad máxima de puntos que vale la pena evaluar para la curva
+        """
+        if self.figura is None:
+            self._construir_figura()
+        return max(2, int(self.ejes.bbox.width))
+
+    def actualizar_curva(self, xs, ys):
+        """
+        Reemplaza las muestras de la curva sin tocar la vista actual.
+
+        Args:
+            xs (numpy.ndarray): valores de x muestreados
+            ys (numpy.ndarray): valores de f(x), con NaN donde no hay valor
+        """
+        if self.figura is None:
+            return
+        y_min, y_max = self.ejes.get_ylim()
+        ys = np.where(np.isfinite(ys), ys, np.nan)
+        if self._polos_conocidos:
+            ys = recortar(ys, y_min, y_max)
+        else:
+            # Con zoom, "absurdo" depende de la escala visible
+            limite = max(LIMITE_SIN_POLOS, 1e3 * max(abs(y_min), abs(y_max)))
+            ys = np.where(np.abs(ys) >= limite, np.nan, ys)
+        self._linea.set_data(xs, ys)
+        self._dibujar()
+
+    def _ajustar_y(self, rango_y, punto_evaluado):
+        """Fija los límites en Y al rango dado (y el punto evaluado), con el margen habitual."""
+        y_min, y_max = rango_y
+        if punto_evaluado is not None and np.isfinite(float(punto_evaluado[1])):
+            y_min, y_max = min(y_min, float(punto_evaluado[1])), max(y_max, float(punto_evaluado[1]))
+        margen = self.ejes.margins()[1] * (y_max - y_min)
+        if margen > 0:
+            self.ejes.set_ylim(y_min - margen, y_max + margen)
+
+    def vista_actual(self):
+        """Devuelve (x_min, x_max, n_pixeles, alto_y) de la vista actual."""
+        x_min, x_max = self.ejes.get_xlim()
+        y_min, y_max = self.ejes.get_ylim()
+        return x_min, x_max, self.ancho_pixeles(), y_max - y_min
+
+    def _fijar_vista(self, x_lim, y_lim):
+        """Aplica nuevos límites a los ejes, acotando anchos degenerados."""
+        limites = []
+        for minimo, maximo in (x_lim, y_lim):
+            centro = (minimo + maximo) / 2
+            mitad = (maximo - minimo) / 2
+            mitad = min(max(mitad, ANCHO_MINIMO * (1 + abs(centro))), ANCHO_MAXIMO)
+            limites.append((centro - mitad, centro + mitad))
+        self.ejes.set_xlim(limites[0])
+        self.ejes.set_ylim(limites[1])
+        self._dibujar()
+        self._avisar_cambio_vista()
+
+    def _avisar_cambio_vista(self):
+        """Informa la nueva vista a quien deba volver a muestrear la curva."""
+        if self.al_cambiar_vista is not None:
+            self.al_cambiar_vista(*self.vista_actual())
+
+    def _al_girar_rueda(self, evento):
+        """Acerca o aleja la vista alrededor del cursor."""
+        if evento.inaxes is not self.ejes or evento.xdata is None:
+            return
+        factor = FACTOR_ZOOM ** (-evento.step)
+        x_min, x_max = self.ejes.get_xlim()
+        y_min, y_max = self.ejes.get_ylim()
+        x, y = evento.xdata, evento.ydata
+        self._fijar_vista(
+            (x - (x - x_min) * factor, x + (x_max - x) * factor),
+            (y - (y - y_min) * factor, y + (y_max - y) * factor),
+        )
+
+    def _al_presionar(self, evento):
+        """Comienza a desplazar la vista con el botón izquierdo."""
+        if evento.button != 1 or evento.inaxes is not self.ejes:
+            return
+        self._arrastre = (evento.x, evento.y, self.ejes.get_xlim(), self.ejes.get_ylim())
+
+    def _al_arrastrar(self, evento):
+        """Desplaza la vista siguiendo al cursor mientras se arrastra."""
+        if self._arrastre is None:
+            return
+        x0, y0, (x_min, x_max), (y_min, y_max) = self._arrastre
+        caja = self.ejes.bbox
+        # Desplazamiento en píxeles convertido a unidades de los datos
+        dx = (evento.x - x0) * (x_max - x_min) / caja.width
+        dy = (evento.y - y0) * (y_max - y_min) / caja.height
+        self._fijar_vista((x_min - dx, x_max - dx), (y_min - dy, y_max - dy))
+
+    def _al_soltar(self, evento):
+        """Termina el desplazamiento de la vista."""
+        self._arrastre = None
+
+    def _fijar_punto(self, punto_evaluado):
+        """Asigna los datos del punto evaluado y su etiqueta."""
+        if punto_evaluado is not None:
+            self._punto.set_offsets([punto_evaluado])
+            self._etiqueta_punto.xy = punto_evaluado
+            self._etiqueta_punto.set_text(f"({punto_evaluado[0]}, {punto_evaluado[1]})")
+        else:
+            self._punto.set_offsets(SIN_PUNTOS)
+            self._etiqueta_punto.set_text("")
+
+    def _actualizar_leyenda(self, intersecciones_x, interseccion_y):
+        """Muestra en la leyenda solo los elementos presentes."""
+        artistas = [self._linea]
+        if intersecciones_x:
+            artistas.append(self._puntos_x)
+        if interseccion_y is not None:
+            artistas.append(self._punto_y)
+        self.ejes.legend(handles=artistas, loc="best", fontsize=9)
+
+    def _dibujar(self):
+        """Redibuja la figura completa en Tk, en el próximo ciclo libre."""
+        # Sin canvas de Tk (uso sin interfaz) quien recibe la figura decide cuándo dibujarla
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
+    def _al_dibujar(self, evento):
+        """Guarda el fondo tras un dibujado completo y pinta los artistas animados."""
+        if self.canvas is None:
+            return
+        self._fondo = self.canvas.copy_from_bbox(self.ejes.bbox)
+        self._dibujar_animados()
+        self.canvas.blit(self.ejes.bbox)
+
+    def _dibujar_animados(self):
+        """Dibuja el punto evaluado y su etiqueta sobre el fondo actual."""
+        self.ejes.draw_artist(self._punto)
+        self.ejes.draw_artist(self._etiqueta_punto)
+
     def limpiar_grafico(self):
-        """Cierra la figura activa para liberar memoria."""
+        """Vacía el gráfico conservando la figura y el canvas para reutilizarlos."""
         try:
-            plt.close(self.figura)
-            self.figura = None
-            self.ejes = None
+            if self.figura is None:
+                return
+            self._linea.set_data([], [])
+            self._puntos_x.set_offsets(SIN_PUNTOS)
+            self._punto_y.set_offsets(SIN_PUNTOS)
+            self._fijar_punto(None)
+            self.ejes.set_title("")
+            leyenda = self.ejes.get_legend()
+            if leyenda is not None:
+                leyenda.remove()
+            self._dibujar()
         except:
             pass
+
+    def cerrar(self):
+        """Libera la figura y el canvas."""
+        try:
+            if self.canvas is not None:
+                self.canvas.get_tk_widget().destroy()
+        except:
+            pass
+        self.canvas = None
+        self.figura = None
+        self.ejes = None
+        self._fondo = None
+        self._arrastre = None
+        self.al_cambiar_vista = None
+        self.muestras.limpiar()
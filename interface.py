@@ -1,15 +1,50 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib
-matplotlib.use('TkAgg')
+import importlib
 import sys
 import os
 
-from analizador import AnalizadorFunciones
-from graficador import GraficadorFunciones
+from ejecutor import EjecutorAnalisis
+from metricas import METRICAS
+from vigilante import VigilanteHilo
+
+# Módulos pesados (SymPy, NumPy, matplotlib) que se importan en segundo plano
+# después de mostrar la ventana, en lugar de al iniciar el programa
+MODULOS_PESADOS = (
+    "matplotlib",
+    "matplotlib.backends.backend_tkagg",
+    "analizador",
+    "graficador",
+)
+
+# Espera tras el último zoom o desplazamiento antes de volver a muestrear la curva
+ESPERA_REMUESTREO_MS = 120
+
+# Vista previa mientras se escribe: espera tras la última tecla y etapas que
+# se completan de a una (las intersecciones primero, para el gráfico)
+ESPERA_VISTA_PREVIA_MS = 300
+ETAPAS_VISTA_PREVIA = ("intersecciones", "dominio", "recorrido")
+
+# Cada cuánto se actualiza la barra de métricas
+INTERVALO_METRICAS_MS = 1000
+
+# Ventana en X de cada gráfico nuevo
+VENTANA_GRAFICO = (-10, 10)
+
+
+def precargar_modulos():
+    """Importa los módulos pesados; se ejecuta en un hilo de fondo."""
+    import matplotlib
+    matplotlib.use('TkAgg')
+    for modulo in MODULOS_PESADOS:
+        importlib.import_module(modulo)
+
+
+def calcular_polos(funcion_sympy):
+    """Polos de la función en la ventana del gráfico; se ejecuta en un hilo de fondo."""
+    from graficador import polos_en_ventana
+    return polos_en_ventana(funcion_sympy, VENTANA_GRAFICO)
 
 # Configuración de la interfaz
 ctk.set_appearance_mode("dark")
@@ -20,15 +55,59 @@ class AnalizadorFuncionesApp:
     
     def __init__(self):
         self.root = ctk.CTk()
-        self.analizador = AnalizadorFunciones()
-        self.graficador = GraficadorFunciones()
+        self.trabajadores = None
+        self._analizador = None
+        self._graficador = None
         self.canvas_actual = None
+        self._funcion_graficada = None
+        self._polos_graficados = None
+        self._remuestreo_id = None
+        self._vista_previa_id = None
+        self._texto_previa = None
+        self._metricas_id = None
+        self._expresion_actual = None  # lo que se procesa, para el registro de bloqueos
+        self.ejecutor = EjecutorAnalisis(self.root, max_hilos=4)
         self._running = True
         
         self.configurar_ventana()
         self.crear_layout()
         self.configurar_atajos()
         self.root.protocol("WM_DELETE_WINDOW", self.cerrar_aplicacion)
+        self.iniciar_precarga()
+        self.actualizar_barra_metricas()
+        
+        # Registra con su pila cada bloqueo del hilo de Tk
+        self.vigilante = VigilanteHilo(self.root, contexto=lambda: self._expresion_actual)
+        self.vigilante.iniciar()
+        
+    def iniciar_precarga(self):
+        """Importa SymPy y matplotlib en segundo plano mientras la ventana ya está visible."""
+        self.label_estado.configure(text="Cargando módulos…")
+        self.ejecutor.enviar(
+            "precarga", lambda cancelado: precargar_modulos(),
+            al_terminar=lambda _: self.mostrar_calculando(False),
+            al_fallar=lambda error: print(f"Error al precargar módulos: {error}")
+        )
+        
+    @property
+    def analizador(self):
+        """AnalizadorFunciones: se crea en el primer uso (importa SymPy si aún no está)."""
+        if self._analizador is None:
+            from analizador import AnalizadorFunciones
+            from cache_analisis import CacheAnalisis
+            from trabajadores import PoolTrabajadores
+            self.trabajadores = PoolTrabajadores(n_procesos=2, tiempo_s=10)
+            self._analizador = AnalizadorFunciones(cache=CacheAnalisis(), trabajadores=self.trabajadores)
+        return self._analizador
+        
+    @property
+    def graficador(self):
+        """GraficadorFunciones: se crea en el primer uso (importa matplotlib si aún no está)."""
+        if self._graficador is None:
+            from graficador import GraficadorFunciones
+            self._graficador = GraficadorFunciones()
+            self._graficador.al_cambiar_vista = self._programar_remuestreo
+        return self._graficador
         
     def configurar_ventana(self):
         """Configura la ventana principal."""
@@ -103,6 +182,7 @@ class AnalizadorFuncionesApp:
         )
         self.entry_funcion.grid(row=2, column=0, sticky="ew", padx=15, pady=(0, 10))
         self.entry_funcion.bind('<Return>', lambda e: self.analizar_funcion())
+        self.entry_funcion.bind('<KeyRelease>', lambda e: self._programar_vista_previa())
         
         self.btn_analizar = ctk.CTkButton(
             funcion_frame,
@@ -113,7 +193,15 @@ class AnalizadorFuncionesApp:
             fg_color=("#dc3545", "#8b0000"),
             hover_color=("#b02a37", "#660000")
         )
-        self.btn_analizar.grid(row=3, column=0, sticky="ew", padx=15, pady=(0, 15))
+        self.btn_analizar.grid(row=3, column=0, sticky="ew", padx=15, pady=(0, 5))
+        
+        self.label_estado = ctk.CTkLabel(
+            funcion_frame,
+            text="",
+            font=ctk.CTkFont(size=12, slant="italic"),
+            text_color=("gray40", "gray70")
+        )
+        self.label_estado.grid(row=4, column=0, sticky="w", padx=15, pady=(0, 10))
         
         # Sección de ejemplos
         ejemplos_frame = ctk.CTkFrame(self.frame_izquierdo, corner_radius=10)
@@ -332,11 +420,45 @@ class AnalizadorFuncionesApp:
             justify="center"
         ).grid(row=0, column=0, pady=15)
         
+        # Barra de estado con las métricas de rendimiento
+        self.label_metricas = ctk.CTkLabel(
+            footer_frame,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color=("gray50", "gray50"),
+            justify="center"
+        )
+        self.label_metricas.grid(row=1, column=0, pady=(0, 10))
+        
+    def actualizar_barra_metricas(self):
+        """Muestra el resumen de métricas y programa la próxima actualización."""
+        if not self._running:
+            return
+        try:
+            self.label_metricas.configure(text=METRICAS.texto_estado())
+        except (AttributeError, tk.TclError):
+            pass
+        self._metricas_id = self.root.after(INTERVALO_METRICAS_MS, self.actualizar_barra_metricas)
+        
+    def exportar_metricas(self):
+        """Guarda las métricas (y los perfiles capturados) en un archivo JSON."""
+        if not self._running:
+            return
+        try:
+            from cache_analisis import ruta_cache_por_defecto
+            ruta = os.path.join(os.path.dirname(ruta_cache_por_defecto()), "metricas.json")
+            METRICAS.exportar_json(ruta, con_perfiles=True)
+            messagebox.showinfo("Métricas", f"Métricas exportadas en:\n{ruta}")
+        except Exception as e:
+            print(f"Error al exportar métricas: {e}")
+            messagebox.showerror("Error", f"No se pudieron exportar las métricas: {str(e)}")
+        
     def configurar_atajos(self):
         """Configura atajos de teclado."""
         self.root.bind('<Control-a>', lambda e: self.analizar_funcion())
         self.root.bind('<Control-e>', lambda e: self.evaluar_punto())
         self.root.bind('<Control-l>', lambda e: self.limpiar_todo())
+        self.root.bind('<Control-m>', lambda e: self.exportar_metricas())
         self.root.bind('<F1>', lambda e: self.mostrar_ayuda())
         
     def cargar_ejemplo(self, ejemplo):
@@ -347,6 +469,22 @@ class AnalizadorFuncionesApp:
         self.entry_funcion.delete(0, tk.END)
         self.entry_funcion.insert(0, ejemplo)
         self.entry_funcion.focus()
+        self._programar_vista_previa()
+        
+    def mostrar_calculando(self, activo):
+        """Muestra u oculta el estado "Calculando…" mientras hay trabajos de fondo."""
+        if not self._running:
+            return
+            
+        try:
+            if activo:
+                self.label_estado.configure(text="Calculando…")
+                self.btn_analizar.configure(text="Calculando…")
+            elif not any(self.ejecutor.ocupado(canal) for canal in ("precarga", "analisis", "evaluacion", "vista_previa")):
+                self.label_estado.configure(text="")
+                self.btn_analizar.configure(text="Analizar Función")
+        except (AttributeError, tk.TclError):
+            pass
         
     def analizar_funcion(self):
         """Analiza la función ingresada con presentación mejorada."""
@@ -358,35 +496,94 @@ class AnalizadorFuncionesApp:
             if not funcion_str:
                 messagebox.showwarning("Advertencia", "Por favor ingrese una función.")
                 return
+            self._expresion_actual = funcion_str
+            
+            # El análisis completo reemplaza a la vista previa
+            self._cancelar_vista_previa()
+            self._texto_previa = funcion_str
             
             if not self.analizador.parsear_funcion(funcion_str):
-                messagebox.showerror("Error", "Función inválida. Revise la sintaxis.")
+                error = self.analizador.error_parseo
+                # ErrorSintaxis del parseador (no se importa aquí para no cargar SymPy al arrancar)
+                detalle = f"{error.senalar()}\n\n{error.mensaje}" if hasattr(error, "posicion") else ""
+                messagebox.showerror("Error", f"Función inválida. Revise la sintaxis.\n\n{detalle}".rstrip())
                 return
             
             # Limpiar resultados anteriores
             self.text_resultados.delete(1.0, tk.END)
             
-            # Análisis completo
-            dominio = self.analizador.calcular_dominio()
-            recorrido = self.analizador.calcular_recorrido()
-            desarrollo = self.analizador.obtener_desarrollo_computacional()
+            # El análisis completo corre en segundo plano (también crear el
+            # resultado: planificar y consultar la caché); una nueva petición
+            # reemplaza a la anterior y descarta su resultado. Cada sección del
+            # desarrollo se muestra apenas se calcula.
+            analizador = self.analizador
+            funcion, funcion_sympy = analizador.funcion, analizador.funcion_sympy
+            self.iniciar_resultados_progresivos(funcion_str)
             
-            # Mostrar resultados con formato mejorado
-            self.mostrar_resultados_formateados(funcion_str, dominio, recorrido, desarrollo)
+            def trabajo(cancelado, avanzar):
+                resultado = analizador.resultado_de(funcion, funcion_sympy)
+                for seccion, pasos in analizador.iterar_desarrollo_computacional(resultado=resultado):
+                    if cancelado.is_set():
+                        return None
+                    avanzar((resultado, seccion, pasos))
+                # Lo que necesita el gráfico se calcula aquí, no en el hilo de Tk
+                resultado.intersecciones
+                return resultado, calcular_polos(resultado.funcion_sympy)
             
+            self.ejecutor.cancelar("evaluacion")
+            self.ejecutor.enviar(
+                "analisis", trabajo,
+                al_terminar=lambda datos: self._analisis_terminado(funcion_str, datos),
+                al_fallar=self._analisis_fallido,
+                al_avanzar=lambda datos: self.mostrar_seccion(*datos)
+            )
+            self.mostrar_calculando(True)
+            
+        except Exception as e:
+            print(f"Error en análisis: {e}")
+            if self._running:
+                messagebox.showerror("Error", f"Error al analizar la función: {str(e)}")
+    
+    def _analisis_terminado(self, funcion_str, datos):
+        """Muestra el resultado de un análisis terminado en segundo plano."""
+        self.mostrar_calculando(False)
+        if not self._running or datos is None:
+            return
+        resultado, polos = datos
+        # Una vista previa posterior pudo cambiar la función: el resultado ya no corresponde
+        if self.analizador.funcion_sympy is not resultado.funcion_sympy:
+            return
+            
+        try:
             # Crear gráfico
-            self.crear_grafico()
+            self.crear_grafico(resultado, polos=polos)
             
             if self._running:
-                messagebox.showinfo("Éxito", "Función analizada correctamente.")
+                if resultado.completo:
+                    messagebox.showinfo("Éxito", "Función analizada correctamente.")
+                else:
+                    messagebox.showwarning(
+                        "Análisis parcial",
+                        "Algunas etapas excedieron el tiempo o la memoria disponibles "
+                        "y se muestran como no determinadas."
+                    )
             
         except Exception as e:
             print(f"Error en análisis: {e}")
             if self._running:
                 messagebox.showerror("Error", f"Error al analizar la función: {str(e)}")
     
-    def mostrar_resultados_formateados(self, funcion_str, dominio, recorrido, desarrollo):
-        """Muestra los resultados con formato mejorado y colores."""
+    def _analisis_fallido(self, error):
+        """Informa un error ocurrido durante el análisis en segundo plano."""
+        self.mostrar_calculando(False)
+        print(f"Error en análisis: {error}")
+        if self._running:
+            messagebox.showerror("Error", f"Error al analizar la función: {str(error)}")
+    
+    def iniciar_resultados_progresivos(self, funcion_str):
+        """Muestra la estructura de los resultados con cada sección pendiente."""
+        from analizador import SECCIONES_DESARROLLO
+        
         # Limpiar área
         self.text_resultados.delete(1.0, tk.END)
         
@@ -400,41 +597,62 @@ class AnalizadorFuncionesApp:
         self.text_resultados.insert(tk.END, f"f(x) = {funcion_str}\n", "resultado")
         self.text_resultados.insert(tk.END, "\n")
         
-        # Dominio
-        self.text_resultados.insert(tk.END, "Dominio:\n", "subtitulo")
-        self.text_resultados.insert(tk.END, f"{dominio}\n", "resultado")
-        self.text_resultados.insert(tk.END, "\n")
-        
-        # Recorrido
-        self.text_resultados.insert(tk.END, "Recorrido:\n", "subtitulo")
-        self.text_resultados.insert(tk.END, f"{recorrido}\n", "resultado")
-        self.text_resultados.insert(tk.END, "\n")
+        # Dominio y recorrido: se completan al llegar sus secciones
+        for etapa, titulo in (("dominio", "Dominio"), ("recorrido", "Recorrido")):
+            self.text_resultados.insert(tk.END, f"{titulo}:\n", "subtitulo")
+            self.text_resultados.insert(tk.END, "Calculando…\n", ("normal", f"resumen_{etapa}"))
+            self.text_resultados.insert(tk.END, "\n")
         
         # Separador
         self.text_resultados.insert(tk.END, "DESARROLLO COMPUTACIONAL\n", "titulo")
         self.text_resultados.insert(tk.END, "-" * 30 + "\n", "separador")
         self.text_resultados.insert(tk.END, "\n")
         
-        # Desarrollo paso a paso
-        for paso in desarrollo:
+        # Un espacio reservado por sección, en el orden del desarrollo
+        for seccion in SECCIONES_DESARROLLO:
+            texto = "\n" if seccion == "encabezado" else f"  Calculando {seccion}…\n\n"
+            self.text_resultados.insert(tk.END, texto, ("normal", f"seccion_{seccion}"))
+        
+        # Scroll al inicio
+        self.text_resultados.see(1.0)
+    
+    def mostrar_seccion(self, resultado, seccion, pasos):
+        """Reemplaza el espacio reservado de una sección por sus pasos."""
+        if not self._running:
+            return
+        
+        # Las etapas ya están calculadas: leerlas del resultado no recalcula nada
+        if seccion in ("dominio", "recorrido"):
+            self._reemplazar(f"resumen_{seccion}", [(f"{getattr(resultado, seccion)}\n", "resultado")])
+        
+        fragmentos = []
+        for paso in pasos:
             if "===" in paso and "DESARROLLO" in paso:
                 continue  # Ya lo mostramos arriba
             elif paso.startswith(("1.", "2.", "3.", "4.")):
-                self.text_resultados.insert(tk.END, paso + "\n", "subtitulo")
+                fragmentos.append((paso + "\n", "subtitulo"))
             elif ":" in paso and not paso.startswith(" "):
                 if "Con eje X" in paso:
-                    self.text_resultados.insert(tk.END, "  " + paso + "\n", "destacado")
+                    fragmentos.append(("  " + paso + "\n", "destacado"))
                 elif "Con eje Y" in paso:
-                    self.text_resultados.insert(tk.END, "  " + paso + "\n", "destacado")
+                    fragmentos.append(("  " + paso + "\n", "destacado"))
                 else:
-                    self.text_resultados.insert(tk.END, "  " + paso + "\n", "info")
+                    fragmentos.append(("  " + paso + "\n", "info"))
             elif paso.strip() == "":
-                self.text_resultados.insert(tk.END, "\n")
+                fragmentos.append(("\n", "normal"))
             else:
-                self.text_resultados.insert(tk.END, "  " + paso + "\n", "normal")
-        
-        # Scroll al inicio
-        self.text_resultados.see(1.0)
+                fragmentos.append(("  " + paso + "\n", "normal"))
+        self._reemplazar(f"seccion_{seccion}", fragmentos)
+    
+    def _reemplazar(self, etiqueta, fragmentos):
+        """Reemplaza el texto marcado con una etiqueta por los fragmentos (texto, estilo) dados."""
+        rango = self.text_resultados.tag_ranges(etiqueta)
+        if not rango:
+            return
+        inicio = self.text_resultados.index(rango[0])
+        self.text_resultados.delete(rango[0], rango[1])
+        for texto, estilo in reversed(fragmentos):
+            self.text_resultados.insert(inicio, texto, (estilo, etiqueta))
     
     def evaluar_punto(self):
         """Evalúa la función en un punto específico con formato mejorado."""
@@ -456,9 +674,40 @@ class AnalizadorFuncionesApp:
             except ValueError:
                 messagebox.showerror("Error", "Ingrese un número válido.")
                 return
+            self._expresion_actual = f"{self.analizador.funcion} en x = {x_val}"
+            
+            # Evaluar y preparar las intersecciones del gráfico en segundo plano
+            analizador = self.analizador
+            funcion, funcion_sympy = analizador.funcion, analizador.funcion_sympy
             
-            resultado, pasos = self.analizador.evaluar_punto(x_val)
+            def trabajo(cancelado):
+                analisis = analizador.resultado_de(funcion, funcion_sympy)
+                resultado, pasos = analizador.evaluar_punto(x_val)
+                polos = None
+                if resultado is not None and not cancelado.is_set():
+                    analisis.intersecciones
+                    polos = calcular_polos(funcion_sympy)
+                return analisis, resultado, pasos, polos
             
+            self.ejecutor.enviar(
+                "evaluacion", trabajo,
+                al_terminar=lambda datos: self._evaluacion_terminada(x_val, *datos),
+                al_fallar=self._evaluacion_fallida
+            )
+            self.mostrar_calculando(True)
+                
+        except Exception as e:
+            print(f"Error en evaluación: {e}")
+            if self._running:
+                messagebox.showerror("Error", f"Error al evaluar el punto: {str(e)}")
+    
+    def _evaluacion_terminada(self, x_val, analisis, resultado, pasos, polos):
+        """Muestra el resultado de una evaluación terminada en segundo plano."""
+        self.mostrar_calculando(False)
+        if not self._running or self.analizador.funcion_sympy is not analisis.funcion_sympy:
+            return
+            
+        try:
             if resultado is not None:
                 # Mostrar evaluación con formato mejorado
                 self.text_resultados.insert(tk.END, f"\nEVALUACIÓN EN x = {x_val}\n", "titulo")
@@ -476,8 +725,11 @@ class AnalizadorFuncionesApp:
                 
                 self.text_resultados.insert(tk.END, f"\nResultado: f({x_val}) = {resultado}\n", "resultado")
                 
-                # Crear gráfico con el punto evaluado
-                self.crear_grafico(punto_evaluado=(x_val, resultado))
+                # Si la curva ya está en pantalla solo se dibuja el punto (blitting)
+                if self.canvas_actual is not None and self._funcion_graficada is analisis.funcion_sympy:
+                    self.graficador.mostrar_punto((x_val, resultado))
+                else:
+                    self.crear_grafico(analisis, punto_evaluado=(x_val, resultado), polos=polos)
                 
                 if self._running:
                     messagebox.showinfo("Éxito", f"f({x_val}) = {resultado}")
@@ -490,62 +742,53 @@ class AnalizadorFuncionesApp:
             print(f"Error en evaluación: {e}")
             if self._running:
                 messagebox.showerror("Error", f"Error al evaluar el punto: {str(e)}")
+    
+    def _evaluacion_fallida(self, error):
+        """Informa un error ocurrido durante la evaluación en segundo plano."""
+        self.mostrar_calculando(False)
+        print(f"Error en evaluación: {error}")
+        if self._running:
+            messagebox.showerror("Error", f"Error al evaluar el punto: {str(error)}")
             
-    def crear_grafico(self, punto_evaluado=None):
-        """Crea y muestra el gráfico de la función."""
+    def crear_grafico(self, resultado, punto_evaluado=None, polos=None):
+        """
+        Crea y muestra el gráfico de un resultado de análisis.
+        
+        Solo usa lo ya calculado en segundo plano: las intersecciones si su
+        etapa terminó y los polos recibidos; nada simbólico corre en el hilo de Tk.
+        
+        Args:
+            resultado (ResultadoAnalisis): resultado cuya función se grafica
+            punto_evaluado (tuple): coordenada (x, y) evaluada
+            polos (list): polos en la ventana (calcular_polos), None si no se conocen
+        """
         if not self._running:
             return
             
         try:
-            # Limpiar matplotlib completamente
-            try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
-            except:
-                pass
+            int_x, int_y = resultado.intersecciones if "intersecciones" in resultado.estados else ([], None)
             
-            # Limpiar canvas anterior
-            if hasattr(self, 'canvas_actual') and self.canvas_actual is not None:
-                try:
-                    widget = self.canvas_actual.get_tk_widget()
-                    if hasattr(widget, 'winfo_exists'):
-                        try:
-                            if widget.winfo_exists():
-                                widget.pack_forget()
-                                widget.destroy()
-                        except tk.TclError:
-                            pass
-                except (AttributeError, tk.TclError):
-                    pass
-                finally:
-                    self.canvas_actual = None
-            
-            # Limpiar el canvas tkinter
-            try:
-                if hasattr(self, 'canvas_grafico'):
-                    try:
-                        if self.canvas_grafico.winfo_exists():
-                            self.canvas_grafico.delete("all")
-                    except tk.TclError:
-                        pass
-            except (AttributeError, tk.TclError):
-                pass
-            
-            int_x, int_y = self.analizador.calcular_intersecciones()
+            # Un remuestreo pendiente corresponde a la vista anterior
+            self.ejecutor.cancelar("remuestreo")
             
             fig = self.graficador.crear_grafico(
-                funcion_sympy=self.analizador.funcion_sympy,
-                x_range=(-10, 10),
+                funcion_sympy=resultado.funcion_sympy,
+                x_range=VENTANA_GRAFICO,
                 intersecciones_x=int_x,
                 interseccion_y=int_y,
                 punto_evaluado=punto_evaluado,
-                titulo=f"f(x) = {self.analizador.funcion}"
+                titulo=f"f(x) = {resultado.funcion}",
+                polos=polos
             )
             
-            if fig and self._running:
+            self._funcion_graficada = resultado.funcion_sympy if fig else None
+            self._polos_graficados = polos
+            
+            # La figura y el canvas se reutilizan: solo se crean la primera vez
+            if fig and self._running and self.canvas_actual is None:
                 try:
                     if hasattr(self, 'canvas_grafico') and self.canvas_grafico.winfo_exists():
-                        self.canvas_actual = FigureCanvasTkAgg(fig, self.canvas_grafico)
+                        self.canvas_actual = self.graficador.vincular_canvas(self.canvas_grafico)
                         self.canvas_actual.draw()
                         self.canvas_actual.get_tk_widget().pack(fill=tk.BOTH, expand=True)
                 except Exception as e:
@@ -554,6 +797,163 @@ class AnalizadorFuncionesApp:
         except Exception as e:
             print(f"Error al crear gráfico: {e}")
             
+    def _programar_vista_previa(self):
+        """Programa la vista previa para cuando el usuario deje de escribir."""
+        if not self._running:
+            return
+        if self._vista_previa_id is not None:
+            try:
+                self.root.after_cancel(self._vista_previa_id)
+            except Exception:
+                pass
+        self._vista_previa_id = self.root.after(ESPERA_VISTA_PREVIA_MS, self._iniciar_vista_previa)
+
+    def _cancelar_vista_previa(self):
+        """Descarta la vista previa programada o en curso."""
+        if self._vista_previa_id is not None:
+            try:
+                self.root.after_cancel(self._vista_previa_id)
+            except Exception:
+                pass
+            self._vista_previa_id = None
+        self.ejecutor.cancelar("vista_previa")
+
+    def _iniciar_vista_previa(self):
+        """Convierte y muestrea en segundo plano la función escrita hasta ahora."""
+        self._vista_previa_id = None
+        if not self._running:
+            return
+        texto = self.entry_funcion.get().strip()
+        if not texto or texto == self._texto_previa:
+            return
+        self._texto_previa = texto
+        self._expresion_actual = texto
+        
+        # Solo el camino numérico: convertir (con caché), crear el resultado sin
+        # etapas y muestrear la curva; en el hilo de Tk convertir y muestrear
+        # vuelven a ser aciertos de caché
+        n_pixeles = self.graficador.ancho_pixeles()
+        muestras = self.graficador.muestras
+        analizador = self.analizador
+        
+        def trabajo(cancelado):
+            from analizador import convertir_expresion, normalizar_expresion
+            funcion_sympy = convertir_expresion(texto)
+            if cancelado.is_set():
+                return None
+            resultado = analizador.resultado_de(normalizar_expresion(texto), funcion_sympy)
+            muestras.muestrear(funcion_sympy, VENTANA_GRAFICO, n_pixeles)
+            return resultado, calcular_polos(funcion_sympy)
+        
+        self.ejecutor.enviar(
+            "vista_previa", trabajo,
+            al_terminar=lambda datos: self._vista_previa_lista(texto, datos),
+            al_fallar=lambda error: self._vista_previa_invalida(texto, error)
+        )
+
+    def _vista_previa_lista(self, texto, datos):
+        """Grafica la curva de la vista previa y lanza las etapas simbólicas."""
+        if not self._running or datos is None or self.entry_funcion.get().strip() != texto:
+            return
+        resultado, polos = datos
+        try:
+            if not self.analizador.parsear_funcion(texto):
+                return
+            self.crear_grafico(resultado, polos=polos)
+            self._mostrar_vista_previa(texto, resultado)
+            pendientes = tuple(e for e in ETAPAS_VISTA_PREVIA if e not in resultado.estados)
+            self._siguiente_etapa_previa(texto, resultado, pendientes)
+        except Exception as e:
+            print(f"Error en vista previa: {e}")
+
+    def _vista_previa_invalida(self, texto, error=None):
+        """Indica que lo escrito todavía no es una función válida (y dónde, si se sabe)."""
+        if self._running and self.entry_funcion.get().strip() == texto:
+            if hasattr(error, "posicion"):
+                self.label_estado.configure(text=f"Expresión incompleta o inválida: {error}")
+            else:
+                self.label_estado.configure(text="Expresión incompleta o inválida")
+
+    def _siguiente_etapa_previa(self, texto, resultado, pendientes):
+        """Calcula en segundo plano la próxima etapa simbólica de la vista previa."""
+        if not pendientes:
+            self.mostrar_calculando(False)
+            return
+        etapa = pendientes[0]
+        self.label_estado.configure(text=f"Vista previa: calculando {etapa}…")
+        self.ejecutor.enviar(
+            "vista_previa", lambda cancelado: getattr(resultado, etapa),
+            al_terminar=lambda _: self._etapa_previa_lista(texto, resultado, etapa, pendientes[1:]),
+            al_fallar=lambda error: print(f"Error en vista previa ({etapa}): {error}")
+        )
+
+    def _etapa_previa_lista(self, texto, resultado, etapa, pendientes):
+        """Muestra una etapa recién calculada y continúa con la siguiente."""
+        if not self._running or self.analizador.funcion_sympy is not resultado.funcion_sympy:
+            return
+        try:
+            if etapa == "intersecciones" and self._funcion_graficada is resultado.funcion_sympy:
+                self.crear_grafico(resultado, polos=self._polos_graficados)
+            self._mostrar_vista_previa(texto, resultado)
+        except Exception as e:
+            print(f"Error en vista previa: {e}")
+        self._siguiente_etapa_previa(texto, resultado, pendientes)
+
+    def _mostrar_vista_previa(self, texto, resultado):
+        """Muestra las etapas ya calculadas; las demás figuran como pendientes."""
+        estados = resultado.estados
+        
+        def valor(etapa):
+            return getattr(resultado, etapa) if etapa in estados else "calculando…"
+        
+        intersecciones = valor("intersecciones")
+        if isinstance(intersecciones, tuple):
+            int_x, int_y = intersecciones
+            intersecciones = f"eje X: {int_x if int_x else 'ninguna'}; eje Y: {int_y if int_y is not None else 'ninguna'}"
+        
+        self.label_estado.configure(text="")
+        self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, "VISTA PREVIA\n", "titulo")
+        self.text_resultados.insert(tk.END, "=" * 50 + "\n", "separador")
+        self.text_resultados.insert(tk.END, f"f(x) = {texto}\n\n", "resultado")
+        for titulo, contenido in (("Dominio", valor("dominio")), ("Recorrido", valor("recorrido")),
+                                  ("Intersecciones", intersecciones)):
+            self.text_resultados.insert(tk.END, f"{titulo}:\n", "subtitulo")
+            self.text_resultados.insert(tk.END, f"{contenido}\n\n", "resultado")
+        self.text_resultados.insert(tk.END, "Presione Enter para ver el análisis completo.\n", "info")
+
+    def _programar_remuestreo(self, x_min, x_max, n_pixeles, alto_y):
+        """Vuelve a muestrear la curva cuando la vista deja de moverse."""
+        if not self._running or self._funcion_graficada is None:
+            return
+        if self._remuestreo_id is not None:
+            try:
+                self.root.after_cancel(self._remuestreo_id)
+            except Exception:
+                pass
+        self._remuestreo_id = self.root.after(
+            ESPERA_REMUESTREO_MS, lambda: self._remuestrear(x_min, x_max, n_pixeles, alto_y))
+
+    def _remuestrear(self, x_min, x_max, n_pixeles, alto_y):
+        """Muestrea la vista visible en segundo plano, con a lo sumo un punto por píxel."""
+        self._remuestreo_id = None
+        funcion = self._funcion_graficada
+        if not self._running or funcion is None or self._graficador is None:
+            return
+        muestras = self._graficador.muestras
+
+        # La curva anterior queda en pantalla hasta que llegan las nuevas muestras
+        def al_terminar(curva):
+            if self._funcion_graficada is funcion and self._graficador is not None:
+                self._graficador.actualizar_curva(*curva)
+
+        self.ejecutor.enviar(
+            "remuestreo",
+            lambda cancelado: muestras.muestrear(funcion, (x_min, x_max), n_pixeles, escala_y=alto_y),
+            al_terminar=al_terminar,
+            al_fallar=lambda error: print(f"Error al remuestrear gráfico: {error}")
+        )
+
     def limpiar_todo(self):
         """Limpia todos los campos y resultados."""
         if not self._running:
@@ -579,41 +979,14 @@ class AnalizadorFuncionesApp:
             except (AttributeError, tk.TclError):
                 pass
             
-            # Limpiar canvas
-            try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
-            except:
-                pass
-                
-            if hasattr(self, 'canvas_actual') and self.canvas_actual is not None:
-                try:
-                    widget = self.canvas_actual.get_tk_widget()
-                    if hasattr(widget, 'winfo_exists'):
-                        try:
-                            if widget.winfo_exists():
-                                widget.pack_forget()
-                                widget.destroy()
-                        except tk.TclError:
-                            pass
-                except (AttributeError, tk.TclError):
-                    pass
-                finally:
-                    self.canvas_actual = None
-            
-            try:
-                if hasattr(self, 'canvas_grafico'):
-                    try:
-                        if self.canvas_grafico.winfo_exists():
-                            self.canvas_grafico.delete("all")
-                    except tk.TclError:
-                        pass
-            except (AttributeError, tk.TclError):
-                pass
-            
+            # Vaciar el gráfico (la figura y el canvas se conservan)
             try:
-                if hasattr(self, 'graficador'):
-                    self.graficador.limpiar_grafico()
+                self._cancelar_vista_previa()
+                self._texto_previa = None
+                self._funcion_graficada = None
+                self.ejecutor.cancelar("remuestreo")
+                if self._graficador is not None:
+                    self._graficador.limpiar_grafico()
             except (AttributeError, Exception):
                 pass
             
@@ -652,6 +1025,7 @@ ATAJOS DE TECLADO:
 • Ctrl+A: Analizar función
 • Ctrl+E: Evaluar punto
 • Ctrl+L: Limpiar todo
+• Ctrl+M: Exportar métricas de rendimiento
 • F1: Mostrar esta ayuda
 
 NOTACIÓN:
@@ -667,7 +1041,23 @@ NOTACIÓN:
         self._running = False
         
         try:
+            # Detener el vigilante del hilo principal
+            if hasattr(self, 'vigilante'):
+                self.vigilante.detener()
+            
+            # Detener los trabajos de análisis en segundo plano
+            if hasattr(self, 'ejecutor'):
+                try:
+                    self.ejecutor.cerrar()
+                except:
+                    pass
+            
             # Cancelar callbacks pendientes
+            if self._metricas_id is not None:
+                try:
+                    self.root.after_cancel(self._metricas_id)
+                except:
+                    pass
             if hasattr(self.root, '_after_ids'):
                 for after_id in getattr(self.root, '_after_ids', []):
                     try:
@@ -675,27 +1065,25 @@ NOTACIÓN:
                     except:
                         pass
             
-            # Limpiar matplotlib canvas
-            if hasattr(self, 'canvas_actual') and self.canvas_actual is not None:
+            # Liberar la figura y el canvas del graficador
+            if self._graficador is not None:
                 try:
-                    widget = self.canvas_actual.get_tk_widget()
-                    if hasattr(widget, 'winfo_exists') and widget.winfo_exists():
-                        widget.destroy()
+                    self._graficador.cerrar()
                 except:
                     pass
-                self.canvas_actual = None
+            self.canvas_actual = None
             
-            # Limpiar gráficos de matplotlib
-            try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
-            except:
-                pass
+            # Detener los procesos trabajadores
+            if self.trabajadores is not None:
+                try:
+                    self.trabajadores.cerrar()
+                except:
+                    pass
             
-            # Limpiar graficador
-            if hasattr(self, 'graficador'):
+            # Cerrar la caché persistente de análisis
+            if self._analizador is not None and self._analizador.cache is not None:
                 try:
-                    self.graficador.limpiar_grafico()
+                    self._analizador.cache.cerrar()
                 except:
                     pass
             
@@ -734,11 +1122,6 @@ NOTACIÓN:
             self.cerrar_aplicacion()
         finally:
             self._running = False
-            try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
-            except:
-                pass
 
 if __name__ == "__main__":
     app = AnalizadorFuncionesApp()
@@ -0,0 +1,468 @@
+"""
+Módulo de Análisis por Lotes (sin interfaz gráfica)
+Analiza muchas expresiones en paralelo con un pool de procesos y escribe
+un registro JSON por línea con:
+- Dominio, recorrido, intersecciones y derivada
+- Tiempo de cada etapa
+
+Uso:
+    python main.py batch entrada.txt [-o salida.jsonl] [-j PROCESOS]
+    generador | python main.py stream [--desordenado] [--en-vuelo N]
+
+El modo stream lee la entrada de forma perezosa, mantiene un número acotado
+de trabajos en vuelo y emite cada registro apenas está listo, de modo que la
+memoria no crece con el tamaño de la entrada.
+
+Las etapas simbólicas de cada expresión corren en un proceso trabajador
+propio con presupuesto de tiempo y memoria: una expresión que lo excede
+produce un registro de error y no detiene el lote ni el flujo.
+
+No importa tkinter ni customtkinter.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from analizador import AnalizadorFunciones
+from trabajadores import (ESTADO_OK, MEMORIA_POR_DEFECTO, TIEMPO_POR_DEFECTO,
+                          PoolTrabajadores)
+
+# Analizador propio de cada proceso trabajador
+_analizador = None
+
+
+def _iniciar_proceso(ruta_cache=None, tiempo_s=TIEMPO_POR_DEFECTO, memoria_mb=MEMORIA_POR_DEFECTO):
+    """
+    Crea el analizador del proceso trabajador (una vez por proceso).
+
+    Las etapas simbólicas corren en un trabajador propio bajo presupuesto:
+    ProcessPoolExecutor no puede interrumpir una tarea colgada, pero ese
+    trabajador sí se mata al agotar el tiempo o la memoria.
+    """
+    global _analizador
+    # Los mensajes de diagnóstico no deben mezclarse con el JSONL de salida
+    sys.stdout = sys.stderr
+    cache = None
+    if ruta_cache:
+        from cache_analisis import CacheAnalisis
+        cache = CacheAnalisis(ruta_cache)
+    trabajadores = PoolTrabajadores(n_procesos=1, tiempo_s=tiempo_s, memoria_mb=memoria_mb)
+    _analizador = AnalizadorFunciones(cache=cache, trabajadores=trabajadores)
+
+
+def _registro_error(expresion, error, id_entrada=None):
+    """Construye el registro de una expresión cuyo análisis falló."""
+    registro = {"expresion": expresion, "ok": False, "error": error}
+    if id_entrada is not None:
+        registro["id"] = id_entrada
+    return registro
+
+
+def analizar_expresion_segura(expresion, id_entrada=None):
+    """
+    Analiza una expresión sin dejar escapar excepciones.
+
+    Args:
+        expresion (str): expresión matemática como texto
+        id_entrada: identificador opcional que se copia al registro
+
+    Returns:
+        dict: registro de resultados o de error
+    """
+    try:
+        registro = analizar_expresion(expresion)
+    except Exception as e:
+        return _registro_error(expresion, f"{type(e).__name__}: {e}", id_entrada)
+    if id_entrada is not None:
+        registro["id"] = id_entrada
+    return registro
+
+
+def _analizar_bloque(expresiones):
+    """Analiza un bloque de expresiones en un proceso trabajador, sin dejar escapar excepciones."""
+    return [analizar_expresion_segura(expresion) for expresion in expresiones]
+
+
+def analizar_expresion(expresion):
+    """
+    Analiza una expresión y devuelve su registro de resultados.
+
+    Args:
+        expresion (str): expresión matemática como texto
+
+    Returns:
+        dict: registro serializable a JSON
+    """
+    if _analizador is None:
+        _iniciar_proceso()
+
+    registro = {"expresion": expresion, "ok": False}
+    tiempos = {}
+
+    inicio = time.perf_counter()
+    parseada = _analizador.parsear_funcion(expresion)
+    tiempos["parseo"] = time.perf_counter() - inicio
+    if not parseada:
+        error = _analizador.error_parseo
+        registro["error"] = f"Función inválida: {error}" if error is not None else "Función inválida"
+        registro["tiempos"] = tiempos
+        return registro
+
+    resultado = _analizador.analizar()
+    for etapa in ("dominio", "recorrido", "intersecciones", "derivada"):
+        inicio = time.perf_counter()
+        getattr(resultado, etapa)
+        tiempos[etapa] = time.perf_counter() - inicio
+
+    int_x, int_y = resultado.intersecciones
+    derivada = resultado.derivada
+    # Una etapa que excedió su presupuesto convierte el registro en error (con lo calculado)
+    excedidas = [f"{etapa} ({estado})" for etapa, estado in resultado.estados.items()
+                 if estado != ESTADO_OK]
+    if excedidas:
+        registro["error"] = f"Presupuesto excedido en: {', '.join(excedidas)}"
+    registro.update({
+        "ok": not excedidas,
+        "dominio": resultado.dominio,
+        "recorrido": resultado.recorrido,
+        "intersecciones_x": int_x if isinstance(int_x, list) else [],
+        "interseccion_y": int_y,
+        "metodo_intersecciones": resultado.metodo_intersecciones,
+        "derivada": None if derivada is None else str(derivada),
+        "estados": resultado.estados,
+        "tiempos": tiempos,
+    })
+    return registro
+
+
+def leer_expresiones(ruta):
+    """
+    Lee las expresiones de un archivo, una por línea.
+
+    Se ignoran las líneas vacías y las que comienzan con '#'.
+
+    Args:
+        ruta (str): ruta del archivo ('-' para la entrada estándar)
+
+    Returns:
+        list: expresiones como texto
+    """
+    archivo = sys.stdin if ruta == "-" else open(ruta, encoding="utf-8")
+    try:
+        return [linea.strip() for linea in archivo
+                if linea.strip() and not linea.lstrip().startswith("#")]
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+
+
+def analizar_lote(expresiones, procesos=None, tamano_bloque=None, ruta_cache=None,
+                  tiempo_s=TIEMPO_POR_DEFECTO, memoria_mb=MEMORIA_POR_DEFECTO):
+    """
+    Analiza una lista de expresiones en paralelo, conservando el orden.
+
+    Args:
+        expresiones (list): expresiones como texto
+        procesos (int): cantidad de procesos; por defecto todos los núcleos
+        tamano_bloque (int): expresiones enviadas por tarea a cada proceso
+        ruta_cache (str): archivo de caché persistente opcional
+        tiempo_s (float): presupuesto de tiempo de cada etapa simbólica
+        memoria_mb (float): presupuesto de memoria del trabajador simbólico
+
+    Una expresión que falla, que excede el presupuesto de una etapa o que
+    hace morir a su proceso trabajador se informa con un registro de error;
+    el resto del lote sigue adelante.
+
+    Yields:
+        dict: registro de cada expresión, en el orden de entrada
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if tamano_bloque is None:
+        # Bloques grandes reducen la comunicación; varios por proceso equilibran la carga
+        tamano_bloque = max(1, min(64, len(expresiones) // (procesos * 8)))
+
+    presupuesto = (ruta_cache, tiempo_s, memoria_mb)
+
+    def nuevo_pool():
+        return ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso,
+                                   initargs=presupuesto)
+
+    def enviar(pool, bloque, futuro=None):
+        # Un bloque que ya terminó bien antes de romperse el pool conserva su resultado
+        if futuro is not None and futuro.done() and not futuro.cancelled() and \
+                not isinstance(futuro.exception(), BrokenProcessPool):
+            return bloque, futuro
+        return bloque, pool.submit(_analizar_bloque, bloque)
+
+    pool = nuevo_pool()
+    en_vuelo = deque(enviar(pool, expresiones[i:i + tamano_bloque])
+                     for i in range(0, len(expresiones), tamano_bloque))
+    try:
+        while en_vuelo:
+            bloque, futuro = en_vuelo.popleft()
+            try:
+                yield from futuro.result()
+                continue
+            except BrokenProcessPool:
+                pass
+            except Exception as e:
+                yield from (_registro_error(expresion, f"{type(e).__name__}: {e}") for expresion in bloque)
+                continue
+
+            # Un proceso trabajador murió: el pool se reemplaza, los bloques pendientes
+            # se reenvían y el afectado se analiza aparte, de a una expresión
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = nuevo_pool()
+            en_vuelo = deque(enviar(pool, b, f) for b, f in en_vuelo)
+            yield from _analizar_aislado(bloque, presupuesto)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _analizar_aislado(expresiones, presupuesto=()):
+    """
+    Analiza expresiones de a una en un proceso propio, para aislar la que lo hace morir.
+
+    Args:
+        expresiones (list): expresiones como texto
+        presupuesto (tuple): argumentos de _iniciar_proceso
+
+    Yields:
+        dict: registro de cada expresión; la que mata al proceso queda como error
+    """
+    def nuevo_pool():
+        return ProcessPoolExecutor(max_workers=1, initializer=_iniciar_proceso, initargs=presupuesto)
+
+    pool = nuevo_pool()
+    try:
+        for expresion in expresiones:
+            try:
+                yield pool.submit(analizar_expresion_segura, expresion).result()
+            except BrokenProcessPool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = nuevo_pool()
+                yield _registro_error(expresion, "el proceso trabajador terminó inesperadamente")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iterar_entrada(archivo):
+    """
+    Lee una entrada línea a línea, sin cargarla completa en memoria.
+
+    Cada línea puede ser una expresión en texto plano o un objeto JSON con
+    la clave "expresion" (y opcionalmente "id").
+
+    Args:
+        archivo: archivo de texto abierto
+
+    Yields:
+        tuple: (id_entrada, expresion)
+    """
+    for linea in archivo:
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        if linea.startswith("{"):
+            try:
+                objeto = json.loads(linea)
+                yield objeto.get("id"), str(objeto["expresion"])
+            except (ValueError, KeyError, AttributeError):
+                yield None, linea
+        else:
+            yield None, linea
+
+
+def analizar_flujo(entradas, procesos=None, max_en_vuelo=None, ordenado=True, ruta_cache=None,
+                   tiempo_s=TIEMPO_POR_DEFECTO, memoria_mb=MEMORIA_POR_DEFECTO):
+    """
+    Analiza un flujo potencialmente infinito de expresiones.
+
+    Se envían al pool como máximo max_en_vuelo trabajos a la vez; la entrada
+    solo se sigue leyendo cuando se entrega un resultado (contrapresión).
+    Si un proceso trabajador muere, el pool se reemplaza y las expresiones
+    afectadas se informan como registros de error. Las etapas simbólicas
+    corren bajo presupuesto, así que una expresión colgada termina en un
+    registro de error y no retiene a las que siguen en modo ordenado.
+
+    Args:
+        entradas (iterable): pares (id_entrada, expresion)
+        procesos (int): cantidad de procesos; por defecto todos los núcleos
+        max_en_vuelo (int): trabajos simultáneos; por defecto 4 por proceso
+        ordenado (bool): True entrega en el orden de entrada; False, según terminan
+        ruta_cache (str): archivo de caché persistente opcional
+        tiempo_s (float): presupuesto de tiempo de cada etapa simbólica
+        memoria_mb (float): presupuesto de memoria del trabajador simbólico
+
+    Yields:
+        dict: registro de cada expresión
+    """
+    procesos = procesos or os.cpu_count() or 1
+    max_en_vuelo = max_en_vuelo or procesos * 4
+    entradas = iter(entradas)
+
+    def nuevo_pool():
+        return ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso,
+                                   initargs=(ruta_cache, tiempo_s, memoria_mb))
+
+    def registro_de(futuro, id_entrada, expresion):
+        try:
+            return futuro.result()
+        except BrokenProcessPool:
+            return _registro_error(expresion, "el proceso trabajador terminó inesperadamente", id_entrada)
+        except Exception as e:
+            return _registro_error(expresion, f"{type(e).__name__}: {e}", id_entrada)
+
+    pool = nuevo_pool()
+    en_vuelo = deque()  # (futuro, id_entrada, expresion) en orden de envío
+    agotada = False
+    try:
+        while en_vuelo or not agotada:
+            # Rellenar hasta el límite de trabajos en vuelo
+            while not agotada and len(en_vuelo) < max_en_vuelo:
+                try:
+                    id_entrada, expresion = next(entradas)
+                except StopIteration:
+                    agotada = True
+                    break
+                try:
+                    futuro = pool.submit(analizar_expresion_segura, expresion, id_entrada)
+                except BrokenProcessPool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = nuevo_pool()
+                    futuro = pool.submit(analizar_expresion_segura, expresion, id_entrada)
+                en_vuelo.append((futuro, id_entrada, expresion))
+
+            if not en_vuelo:
+                break
+
+            if ordenado:
+                listos = [en_vuelo.popleft()]
+                listos[0][0].exception()  # Esperar al más antiguo
+            else:
+                terminados, _ = wait([f for f, _, _ in en_vuelo], return_when=FIRST_COMPLETED)
+                listos = [item for item in en_vuelo if item[0] in terminados]
+                en_vuelo = deque(item for item in en_vuelo if item[0] not in terminados)
+
+            pool_roto = False
+            for futuro, id_entrada, expresion in listos:
+                if isinstance(futuro.exception(), BrokenProcessPool):
+                    pool_roto = True
+                yield registro_de(futuro, id_entrada, expresion)
+
+            if pool_roto:
+                # Los trabajos pendientes del pool roto se reenvían a uno nuevo
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = nuevo_pool()
+                pendientes = en_vuelo
+                en_vuelo = deque()
+                for futuro, id_entrada, expresion in pendientes:
+                    if futuro.done() and not isinstance(futuro.exception(), BrokenProcessPool):
+                        en_vuelo.append((futuro, id_entrada, expresion))
+                    else:
+                        en_vuelo.append((pool.submit(analizar_expresion_segura, expresion, id_entrada),
+                                         id_entrada, expresion))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _argumentos_presupuesto(parser):
+    """Agrega las opciones de presupuesto por etapa a un parser de argumentos."""
+    parser.add_argument("--tiempo", type=float, default=TIEMPO_POR_DEFECTO,
+                        help=f"segundos por etapa simbólica (por defecto, {TIEMPO_POR_DEFECTO:g})")
+    parser.add_argument("--memoria", type=float, default=MEMORIA_POR_DEFECTO,
+                        help=f"MB de memoria del trabajador simbólico (por defecto, {MEMORIA_POR_DEFECTO:g})")
+
+
+def main_flujo(argumentos=None):
+    """
+    Punto de entrada del modo stream.
+
+    Args:
+        argumentos (list): argumentos de línea de comandos (sin 'stream')
+
+    Returns:
+        int: código de salida
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py stream",
+        description="Analiza expresiones leídas de forma continua y emite un registro JSON por línea."
+    )
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="archivo de entrada ('-' o vacío para stdin)")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de salida (por defecto stdout)")
+    parser.add_argument("-j", "--procesos", type=int, default=None,
+                        help="cantidad de procesos (por defecto, todos los núcleos)")
+    parser.add_argument("--en-vuelo", type=int, default=None,
+                        help="máximo de trabajos simultáneos (por defecto, 4 por proceso)")
+    parser.add_argument("--desordenado", action="store_true",
+                        help="emitir cada resultado apenas termina, sin respetar el orden de entrada")
+    parser.add_argument("--cache", default=None, help="archivo de caché persistente de análisis")
+    _argumentos_presupuesto(parser)
+    args = parser.parse_args(argumentos)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        for registro in analizar_flujo(iterar_entrada(entrada), args.procesos, args.en_vuelo,
+                                       not args.desordenado, args.cache, args.tiempo, args.memoria):
+            salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            salida.flush()
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+def main_lote(argumentos=None):
+    """
+    Punto de entrada del modo por lotes.
+
+    Args:
+        argumentos (list): argumentos de línea de comandos (sin 'batch')
+
+    Returns:
+        int: código de salida
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Analiza expresiones en lote y escribe un registro JSON por línea."
+    )
+    parser.add_argument("entrada", help="archivo con una expresión por línea ('-' para stdin)")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de salida (por defecto stdout)")
+    parser.add_argument("-j", "--procesos", type=int, default=None,
+                        help="cantidad de procesos (por defecto, todos los núcleos)")
+    parser.add_argument("--bloque", type=int, default=None, help="expresiones por tarea")
+    parser.add_argument("--cache", default=None, help="archivo de caché persistente de análisis")
+    _argumentos_presupuesto(parser)
+    args = parser.parse_args(argumentos)
+
+    expresiones = leer_expresiones(args.entrada)
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+
+    inicio = time.perf_counter()
+    errores = 0
+    try:
+        for registro in analizar_lote(expresiones, args.procesos, args.bloque, args.cache,
+                                      args.tiempo, args.memoria):
+            if not registro["ok"]:
+                errores += 1
+            salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    duracion = time.perf_counter() - inicio
+    print(f"{len(expresiones)} expresiones analizadas en {duracion:.2f} s ({errores} con error)",
+          file=sys.stderr)
+    return 0
@@ -6,20 +6,32 @@ Proyecto Parte B - EID
 
 Este programa permite analizar funciones matemáticas, calcular su dominio,
 recorrido, intersecciones y generar gráficos profesionales.
+
+Uso:
+    python main.py                          Inicia la interfaz gráfica
+    python main.py batch entrada.txt        Analiza un archivo sin interfaz
+    generador | python main.py stream       Analiza un flujo continuo (JSONL)
 """
 
 import sys
 import os
+import importlib.util
 
 def verificar_dependencias():
-    """Verifica que las dependencias estén instaladas."""
-    dependencias = ['sympy', 'matplotlib', 'customtkinter']
+    """
+    Verifica que las dependencias estén instaladas.
+    
+    Solo busca la especificación de cada módulo, sin ejecutarlo, para no
+    pagar el costo de importarlos antes de mostrar la ventana.
+    """
+    dependencias = ['sympy', 'numpy', 'matplotlib', 'customtkinter']
     faltantes = []
     
     for dep in dependencias:
         try:
-            __import__(dep)
-        except ImportError:
+            if importlib.util.find_spec(dep) is None:
+                faltantes.append(dep)
+        except (ImportError, ValueError):
             faltantes.append(dep)
     
     if faltantes:
@@ -37,6 +49,16 @@ def verificar_dependencias():
 
 def main():
     """Función principal que inicia la aplicación."""
+    # Modo por lotes sin interfaz gráfica: python main.py batch entrada.txt
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from lote import main_lote
+        sys.exit(main_lote(sys.argv[2:]))
+    
+    # Modo stream sin interfaz gráfica: generador | python main.py stream
+    if len(sys.argv) > 1 and sys.argv[1] == "stream":
+        from lote import main_flujo
+        sys.exit(main_flujo(sys.argv[2:]))
+    
     print("Analizador de Funciones Matemáticas")
     print("=" * 40)
     
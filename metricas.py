@@ -0,0 +1,352 @@
+"""
+Módulo de Métricas de Rendimiento
+Registro central de tiempos y contadores de la aplicación:
+- Tiempo real, cantidad de llamadas y máximos por operación
+- Tasas de acierto de las cachés (análisis, muestras, compilación, parseo)
+- Exportación a JSON y registro estructurado opcional (JSON Lines)
+- Captura opcional con cProfile de los N cálculos más lentos
+
+Variables de entorno:
+    EID_METRICAS_LOG: archivo donde se agrega una línea JSON por medición
+    EID_PERFILAR: cantidad de cálculos lentos a perfilar (0 lo desactiva)
+"""
+
+import cProfile
+import heapq
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+LINEAS_PERFIL = 25
+
+
+class EstadisticaTiempo:
+    """Acumulado de las mediciones de una operación."""
+
+    __slots__ = ('llamadas', 'total', 'maximo', 'ultimo')
+
+    def __init__(self):
+        self.llamadas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.ultimo = 0.0
+
+    def agregar(self, duracion):
+        """Suma una medición en segundos."""
+        self.llamadas += 1
+        self.total += duracion
+        self.ultimo = duracion
+        self.maximo = max(self.maximo, duracion)
+
+    def a_dict(self):
+        """Devuelve la estadística como diccionario (tiempos en segundos)."""
+        return {
+            "llamadas": self.llamadas,
+            "total_s": self.total,
+            "media_s": self.total / self.llamadas if self.llamadas else 0.0,
+            "maximo_s": self.maximo,
+            "ultimo_s": self.ultimo,
+        }
+
+
+def estadisticas_lru(funcion):
+    """
+    Adapta cache_info() de una función con functools.lru_cache al formato de las cachés.
+
+    Args:
+        funcion (callable): función decorada con lru_cache
+
+    Returns:
+        callable: función sin argumentos que devuelve aciertos, fallos, tasa y entradas
+    """
+    def estadisticas():
+        info = funcion.cache_info()
+        total = info.hits + info.misses
+        return {
+            "aciertos": info.hits,
+            "fallos": info.misses,
+            "tasa_aciertos": info.hits / total if total else 0.0,
+            "entradas": info.currsize,
+        }
+    return estadisticas
+
+
+def ejecutar_perfilado(funcion, *args):
+    """
+    Ejecuta funcion(*args) bajo cProfile.
+
+    Está definida a nivel de módulo para poder enviarse a un proceso trabajador.
+
+    Returns:
+        tuple: (valor, duración en segundos, texto del perfil)
+    """
+    perfil = cProfile.Profile()
+    inicio = time.perf_counter()
+    perfil.enable()
+    try:
+        valor = funcion(*args)
+    finally:
+        perfil.disable()
+    duracion = time.perf_counter() - inicio
+    salida = io.StringIO()
+    pstats.Stats(perfil, stream=salida).sort_stats("cumulative").print_stats(LINEAS_PERFIL)
+    return valor, duracion, salida.getvalue()
+
+
+class RegistroMetricas:
+    """Registro de tiempos, contadores y cachés, seguro entre hilos."""
+
+    def __init__(self, ruta_log=None, n_perfiles=0):
+        """
+        Args:
+            ruta_log (str): archivo JSON Lines con cada medición; None no registra
+            n_perfiles (int): cantidad de cálculos lentos a conservar perfilados
+        """
+        self._lock = threading.Lock()
+        self._tiempos = {}
+        self._contadores = {}
+        self._fuentes = {}
+        self._aciertos = {}  # caché -> [aciertos, fallos]
+        self._perfiles = []  # montículo de (duración, orden, etiqueta, texto)
+        self._orden = 0
+        self.ruta_log = ruta_log
+        self.n_perfiles = n_perfiles
+        self.inicio = time.time()
+
+    # -- Mediciones ---------------------------------------------------------
+
+    def registrar_tiempo(self, nombre, duracion, **datos):
+        """
+        Agrega una medición de tiempo.
+
+        Args:
+            nombre (str): operación medida (p. ej. "etapa.dominio")
+            duracion (float): tiempo real en segundos
+            **datos: información extra para el registro estructurado
+        """
+        with self._lock:
+            estadistica = self._tiempos.get(nombre)
+            if estadistica is None:
+                estadistica = self._tiempos[nombre] = EstadisticaTiempo()
+            estadistica.agregar(duracion)
+        if self.ruta_log:
+            self._escribir_log({"metrica": nombre, "duracion_s": duracion, **datos})
+
+    @contextmanager
+    def medir(self, nombre, **datos):
+        """Mide el tiempo real del bloque con nombre."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar_tiempo(nombre, time.perf_counter() - inicio, **datos)
+
+    def medido(self, nombre):
+        """Decorador que mide cada llamada a la función."""
+        def decorador(funcion):
+            @wraps(funcion)
+            def envoltura(*args, **kwargs):
+                with self.medir(nombre):
+                    return funcion(*args, **kwargs)
+            return envoltura
+        return decorador
+
+    def contar(self, nombre, cantidad=1):
+        """Incrementa un contador."""
+        with self._lock:
+            self._contadores[nombre] = self._contadores.get(nombre, 0) + cantidad
+
+    def registrar_evento(self, nombre, **datos):
+        """
+        Cuenta un evento y lo agrega al registro estructurado.
+
+        Args:
+            nombre (str): tipo de evento (p. ej. "plan")
+            **datos: detalle del evento para el registro
+        """
+        self.contar("eventos." + nombre)
+        if self.ruta_log:
+            self._escribir_log({"evento": nombre, **datos})
+
+    def registrar_acierto(self, nombre, acierto):
+        """
+        Cuenta un acierto o un fallo de una caché sin estadísticas propias.
+
+        Args:
+            nombre (str): nombre de la caché
+            acierto (bool): True si el valor ya estaba guardado
+        """
+        with self._lock:
+            cuenta = self._aciertos.setdefault(nombre, [0, 0])
+            cuenta[0 if acierto else 1] += 1
+
+    def registrar_fuente(self, nombre, estadisticas):
+        """
+        Registra una caché cuyas estadísticas se consultan al exportar.
+
+        Args:
+            nombre (str): nombre de la caché
+            estadisticas (callable): devuelve un dict con aciertos, fallos y tasa_aciertos
+        """
+        with self._lock:
+            self._fuentes[nombre] = estadisticas
+
+    # -- Perfiles -------------------------------------------------------------
+
+    @property
+    def perfilando(self):
+        """bool: True si se capturan perfiles de los cálculos lentos."""
+        return self.n_perfiles > 0
+
+    def guardar_perfil(self, etiqueta, duracion, texto):
+        """Conserva el perfil si está entre los N cálculos más lentos."""
+        with self._lock:
+            self._orden += 1
+            entrada = (duracion, self._orden, etiqueta, texto)
+            if len(self._perfiles) < self.n_perfiles:
+                heapq.heappush(self._perfiles, entrada)
+            elif self._perfiles and duracion > self._perfiles[0][0]:
+                heapq.heapreplace(self._perfiles, entrada)
+
+    def perfiles_lentos(self):
+        """
+        Devuelve los perfiles conservados.
+
+        Returns:
+            list: (duración, etiqueta, texto del perfil), del más lento al más rápido
+        """
+        with self._lock:
+            return [(d, e, t) for d, _, e, t in sorted(self._perfiles, reverse=True)]
+
+    # -- Consulta y exportación ----------------------------------------------
+
+    def tiempo(self, nombre):
+        """Devuelve la estadística de una operación como dict, o None si no hay mediciones."""
+        with self._lock:
+            estadistica = self._tiempos.get(nombre)
+            return estadistica.a_dict() if estadistica is not None else None
+
+    def resumen(self):
+        """
+        Devuelve todas las métricas.
+
+        Returns:
+            dict: tiempos, contadores, cachés y perfiles (sin el texto completo)
+        """
+        with self._lock:
+            tiempos = {nombre: e.a_dict() for nombre, e in sorted(self._tiempos.items())}
+            contadores = dict(sorted(self._contadores.items()))
+            fuentes = dict(self._fuentes)
+            aciertos = {nombre: tuple(cuenta) for nombre, cuenta in self._aciertos.items()}
+        caches = {}
+        for nombre, (si, no) in sorted(aciertos.items()):
+            caches[nombre] = {"aciertos": si, "fallos": no, "tasa_aciertos": si / (si + no)}
+        for nombre, estadisticas in sorted(fuentes.items()):
+            try:
+                caches[nombre] = estadisticas()
+            except Exception as e:
+                caches[nombre] = {"error": str(e)}
+        return {
+            "inicio": self.inicio,
+            "tiempos": tiempos,
+            "contadores": contadores,
+            "caches": caches,
+            "perfiles": [{"duracion_s": d, "etiqueta": e} for d, e, _ in self.perfiles_lentos()],
+        }
+
+    def exportar_json(self, ruta=None, con_perfiles=False):
+        """
+        Exporta las métricas en JSON.
+
+        Args:
+            ruta (str): archivo de destino; None solo devuelve el texto
+            con_perfiles (bool): incluir el texto completo de los perfiles
+
+        Returns:
+            str: métricas en JSON
+        """
+        datos = self.resumen()
+        if con_perfiles:
+            datos["perfiles"] = [{"duracion_s": d, "etiqueta": e, "perfil": t}
+                                 for d, e, t in self.perfiles_lentos()]
+        texto = json.dumps(datos, indent=2, ensure_ascii=False)
+        if ruta is not None:
+            directorio = os.path.dirname(ruta)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+        return texto
+
+    def texto_estado(self):
+        """
+        Resume las métricas principales en una línea para la barra de estado.
+
+        Returns:
+            str: p. ej. "Análisis: 3 · último 120 ms · gráfico 4 ms · cachés 85%"
+        """
+        with self._lock:
+            etapas = [e for nombre, e in self._tiempos.items() if nombre.startswith("etapa.")]
+            dibujo = self._tiempos.get("grafico.dibujo")
+            parseo = self._tiempos.get("parseo")
+            fuentes = list(self._fuentes.values())
+            aciertos = sum(cuenta[0] for cuenta in self._aciertos.values())
+            fallos = sum(cuenta[1] for cuenta in self._aciertos.values())
+
+        partes = []
+        if parseo is not None:
+            partes.append(f"Funciones: {parseo.llamadas}")
+        if etapas:
+            ultima = max(etapas, key=lambda e: e.maximo)
+            partes.append(f"etapa más lenta {ultima.maximo * 1000:.0f} ms")
+        if dibujo is not None:
+            partes.append(f"gráfico {dibujo.ultimo * 1000:.0f} ms")
+
+        for estadisticas in fuentes:
+            try:
+                datos = estadisticas()
+            except Exception:
+                continue
+            aciertos += datos.get("aciertos", 0) + datos.get("parciales", 0)
+            fallos += datos.get("fallos", 0)
+        if aciertos + fallos:
+            partes.append(f"cachés {100 * aciertos / (aciertos + fallos):.0f}%")
+        return " · ".join(partes)
+
+    def limpiar(self):
+        """Borra tiempos, contadores y perfiles (las cachés registradas se conservan)."""
+        with self._lock:
+            self._tiempos.clear()
+            self._contadores.clear()
+            self._aciertos.clear()
+            self._perfiles.clear()
+            self.inicio = time.time()
+
+    def _escribir_log(self, registro):
+        """Agrega una línea JSON al registro estructurado."""
+        registro = {"t": time.time(), **registro}
+        try:
+            with self._lock, open(self.ruta_log, "a", encoding="utf-8") as archivo:
+                archivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+        except OSError as e:
+            print(f"Error al escribir métricas: {e}")
+
+
+def _entero_de_entorno(nombre):
+    """Lee una variable de entorno entera; 0 si no está o no es válida."""
+    try:
+        return max(0, int(os.environ.get(nombre, "0")))
+    except ValueError:
+        return 0
+
+
+# Registro global de la aplicación
+METRICAS = RegistroMetricas(
+    ruta_log=os.environ.get("EID_METRICAS_LOG") or None,
+    n_perfiles=_entero_de_entorno("EID_PERFILAR"),
+)
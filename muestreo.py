@@ -0,0 +1,295 @@
+"""
+Módulo de Muestreo Numérico de Funciones
+Compila expresiones SymPy en funciones vectorizadas de NumPy para:
+- Evaluar mallas completas de puntos en una sola llamada
+- Marcar como NaN los valores no finitos o fuera del dominio
+- Muestrear de forma adaptativa, cortando la curva en polos y saltos
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import sympy as sp
+
+from metricas import METRICAS, estadisticas_lru
+
+X = sp.Symbol('x')
+
+# Códigos de error por elemento de evaluar_con_errores
+EVALUACION_OK = 0
+EVALUACION_COMPLEJA = 1
+EVALUACION_INFINITA = 2
+EVALUACION_INDEFINIDA = 3
+
+# Punto donde se divide cada intervalo en el muestreo adaptativo; al no ser el
+# punto medio exacto se evita que funciones simétricas (p. ej. sign) lo engañen
+FRACCION_DIVISION = 0.4817
+
+MENSAJES_ERROR = {
+    EVALUACION_COMPLEJA: "Resultado no real (fuera del dominio)",
+    EVALUACION_INFINITA: "División por cero o valor infinito",
+    EVALUACION_INDEFINIDA: "Valor indefinido (fuera del dominio)",
+}
+
+
+def compilar_funcion(funcion_sympy, variable=X):
+    """
+    Compila una expresión SymPy en una función vectorizada de NumPy.
+
+    Se compila la expresión tal como se escribió: la forma canónica expandida
+    puede perder precisión (p. ej. (x - 1)**12 cerca de x = 1).
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        callable: función que recibe un arreglo de NumPy y devuelve otro
+    """
+    return _compilar(funcion_sympy, variable)
+
+
+@lru_cache(maxsize=128)
+def _compilar(funcion_sympy, variable):
+    """Compila la expresión (con caché)."""
+    return sp.lambdify(variable, raices_reales(funcion_sympy), modules="numpy")
+
+
+def _es_raiz_impar(expr):
+    """Indica si expr es b**(p/q) con q impar y base que puede ser negativa."""
+    return (expr.is_Pow and expr.exp.is_Rational and not expr.exp.is_Integer
+            and expr.exp.q % 2 == 1 and not expr.base.is_nonnegative)
+
+
+def _raiz_real(potencia):
+    """Reescribe b**(p/q), con q impar, como la raíz real: (-8)**(1/3) = -2."""
+    modulo = sp.Abs(potencia.base)**potencia.exp
+    return sp.sign(potencia.base) * modulo if potencia.exp.p % 2 else modulo
+
+
+def raices_reales(funcion_sympy):
+    """
+    Reescribe las raíces de índice impar para evaluarlas como raíces reales.
+
+    SymPy usa la raíz principal, que no es real con base negativa; el dominio
+    admite esas bases, así que la evaluación numérica debe coincidir.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+
+    Returns:
+        sympy.Expr: expresión equivalente en los reales no negativos
+    """
+    return funcion_sympy.replace(_es_raiz_impar, _raiz_real)
+
+
+METRICAS.registrar_fuente("compilacion", estadisticas_lru(_compilar))
+
+
+def limpiar_caches():
+    """Vacía la caché de funciones compiladas."""
+    _compilar.cache_clear()
+
+
+def evaluar_malla(funcion_sympy, xs, variable=X):
+    """
+    Evalúa la función sobre un arreglo de valores X en una sola llamada.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        xs (numpy.ndarray): valores de x
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        numpy.ndarray: valores de f(x) con NaN donde no hay valor real finito
+    """
+    return evaluar_con_errores(funcion_sympy, xs, variable)[0]
+
+
+def evaluar_con_errores(funcion_sympy, xs, variable=X):
+    """
+    Evalúa la función sobre un arreglo de valores X e indica por qué falla cada punto.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        xs (numpy.ndarray): valores de x
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        tuple: (ys, codigos) donde ys tiene NaN donde no hay valor real finito
+            y codigos es un arreglo con un código EVALUACION_* por punto
+    """
+    xs = np.asarray(xs, dtype=float)
+    try:
+        funcion = compilar_funcion(funcion_sympy, variable)
+        with np.errstate(all="ignore"):
+            ys = np.asarray(funcion(xs))
+    except Exception:
+        # Funciones sin equivalente en NumPy: evaluar punto a punto
+        ys = np.array([_evaluar_escalar(funcion_sympy, variable, val) for val in xs.ravel()])
+        ys = ys.reshape(xs.shape)
+
+    ys = np.broadcast_to(ys, xs.shape)
+    codigos = np.zeros(xs.shape, dtype=np.int8)
+    if np.iscomplexobj(ys):
+        # Solo se aceptan valores prácticamente reales
+        no_reales = np.abs(ys.imag) >= 1e-10
+        codigos[no_reales] = EVALUACION_COMPLEJA
+        ys = np.where(no_reales, np.nan, ys.real)
+
+    ys = ys.astype(float)
+    codigos[(codigos == EVALUACION_OK) & np.isinf(ys)] = EVALUACION_INFINITA
+    codigos[(codigos == EVALUACION_OK) & np.isnan(ys)] = EVALUACION_INDEFINIDA
+    ys[~np.isfinite(ys)] = np.nan
+    return ys, codigos
+
+
+def _evaluar_escalar(funcion_sympy, variable, val):
+    """Evalúa la función en un único punto con SymPy (respaldo lento)."""
+    try:
+        return float(raices_reales(funcion_sympy).subs(variable, val))
+    except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+        return np.nan
+
+
+def muestrear_funcion(funcion_sympy, x_range=(-10, 10), n_puntos=201, variable=X):
+    """
+    Genera una malla uniforme y evalúa la función sobre ella.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x_range (tuple): rango de valores en X
+        n_puntos (int): cantidad de puntos de la malla
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        tuple: (xs, ys) como arreglos de NumPy
+    """
+    xs = np.linspace(x_range[0], x_range[1], int(n_puntos))
+    return xs, evaluar_malla(funcion_sympy, xs, variable)
+
+
+def _escala_robusta(ys):
+    """Amplitud típica de los valores, ignorando extremos (p. ej. cerca de polos)."""
+    finitos = ys[np.isfinite(ys)]
+    if finitos.size == 0:
+        return 1.0
+    bajo, alto = np.percentile(finitos, [5, 95])
+    return float(alto - bajo) or max(1.0, abs(float(np.median(finitos))))
+
+
+def _es_discontinuo(funcion_sympy, izquierda, derecha, y_izquierda, y_derecha, limite,
+                    variable=X, iteraciones=24):
+    """
+    Decide qué intervalos contienen una discontinuidad siguiendo el salto por bisección.
+
+    En una función continua el salto se achica junto con el intervalo (y se
+    descarta en cuanto baja del límite); en un salto se mantiene y en un polo crece.
+
+    Returns:
+        tuple: (discontinuos, posiciones) arreglos booleano y de x aproximada
+    """
+    izquierda, derecha = izquierda.copy(), derecha.copy()
+    y_izquierda, y_derecha = y_izquierda.copy(), y_derecha.copy()
+    activos = np.arange(izquierda.size)
+    for _ in range(iteraciones):
+        if activos.size == 0:
+            break
+        medios = (izquierda[activos] + derecha[activos]) / 2
+        y_medios = evaluar_malla(funcion_sympy, medios, variable)
+        y_izq, y_der = y_izquierda[activos], y_derecha[activos]
+        # Un valor indefinido en el medio también corta la curva
+        hueco = ~np.isfinite(y_medios)
+        a_la_izquierda = hueco | (np.abs(y_medios - y_izq) >= np.abs(y_der - y_medios))
+
+        derecha[activos] = np.where(a_la_izquierda, medios, derecha[activos])
+        y_derecha[activos] = np.where(a_la_izquierda, np.where(hueco, np.inf, y_medios), y_der)
+        izquierda[activos] = np.where(a_la_izquierda, izquierda[activos], medios)
+        y_izquierda[activos] = np.where(a_la_izquierda, y_izq, y_medios)
+        with np.errstate(invalid="ignore"):
+            activos = activos[~(np.abs(y_derecha[activos] - y_izquierda[activos]) <= limite)
+                              & np.isfinite(y_derecha[activos])]
+
+    with np.errstate(invalid="ignore"):
+        discontinuos = ~(np.abs(y_derecha - y_izquierda) <= limite)
+    return discontinuos, (izquierda + derecha) / 2
+
+
+@METRICAS.medido("grafico.muestreo")
+def muestrear_adaptativo(funcion_sympy, x_range=(-10, 10), n_maximo=601, tolerancia=2e-3,
+                         escala_y=None, variable=X):
+    """
+    Muestrea la función subdividiendo solo donde la curva se aparta de una recta.
+
+    Parte de una malla gruesa y, en rondas vectorizadas, divide a la mitad los
+    intervalos cuyo punto interior se aleja de la cuerda más que la tolerancia.
+    Los intervalos que no convergen al ancho mínimo se examinan en busca de
+    polos o saltos, y allí se inserta un NaN para cortar la línea. El total de
+    puntos, cortes incluidos, nunca supera n_maximo: parte de él se reserva para
+    los cortes y, si el resto no alcanza, se dividen primero los intervalos
+    más anchos.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x_range (tuple): rango de valores en X
+        n_maximo (int): resolución máxima, en puntos (p. ej. píxeles de ancho)
+        tolerancia (float): error admitido, relativo a la escala en Y
+        escala_y (float): alto de la vista en Y; None la estima de los datos
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        tuple: (xs, ys) como arreglos de NumPy, con NaN en las discontinuidades
+    """
+    a, b = float(x_range[0]), float(x_range[1])
+    n_maximo = max(int(n_maximo), 3)
+    ancho_minimo = (b - a) / (n_maximo - 1)
+    xs = np.linspace(a, b, min(n_maximo, max(9, (n_maximo - 1) // 16 + 1)))
+    # Hasta un corte por intervalo de la malla gruesa
+    techo = n_maximo - (n_maximo - 1) // 16
+    ys = evaluar_malla(funcion_sympy, xs, variable)
+    if escala_y is None:
+        escala_y = _escala_robusta(ys)
+    limite = tolerancia * escala_y
+    pendientes = np.ones(len(xs) - 1, dtype=bool)
+
+    while True:
+        indices = np.nonzero(pendientes & (np.diff(xs) > 1.5 * ancho_minimo))[0]
+        disponibles = techo - len(xs)
+        if indices.size == 0 or disponibles <= 0:
+            break
+        if indices.size > disponibles:
+            anchos = xs[indices + 1] - xs[indices]
+            indices = np.sort(indices[np.argsort(-anchos, kind="stable")[:disponibles]])
+        medios = xs[indices] + FRACCION_DIVISION * (xs[indices + 1] - xs[indices])
+        y_medios = evaluar_malla(funcion_sympy, medios, variable)
+        y_izquierda, y_derecha = ys[indices], ys[indices + 1]
+
+        finitos = np.isfinite(y_izquierda).astype(int) + np.isfinite(y_medios) + np.isfinite(y_derecha)
+        with np.errstate(invalid="ignore"):
+            cuerda = y_izquierda + FRACCION_DIVISION * (y_derecha - y_izquierda)
+            error = np.abs(y_medios - cuerda)
+        # Con valores indefinidos se sigue refinando para ubicar el borde del dominio
+        sigue = np.where(finitos == 3, error > limite, finitos != 0)
+
+        pendientes[indices] = sigue
+        pendientes = np.insert(pendientes, indices + 1, sigue)
+        xs = np.insert(xs, indices + 1, medios)
+        ys = np.insert(ys, indices + 1, y_medios)
+
+    # Intervalos que no convergieron al ancho mínimo: ¿polo o salto?
+    with np.errstate(invalid="ignore"):
+        sospechosos = np.nonzero(
+            pendientes & np.isfinite(ys[:-1]) & np.isfinite(ys[1:])
+            & (np.abs(ys[1:] - ys[:-1]) > limite)
+        )[0]
+    if sospechosos.size:
+        discontinuos, posiciones = _es_discontinuo(
+            funcion_sympy, xs[sospechosos], xs[sospechosos + 1],
+            ys[sospechosos], ys[sospechosos + 1], limite, variable
+        )
+        cortes = sospechosos[discontinuos][:n_maximo - len(xs)]
+        posiciones = posiciones[discontinuos][:len(cortes)]
+        xs = np.insert(xs, cortes + 1, posiciones)
+        ys = np.insert(ys, cortes + 1, np.nan)
+
+    return xs, ys
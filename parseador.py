@@ -0,0 +1,331 @@
+"""
+Módulo Parseador de Expresiones
+Convierte el texto que escribe el usuario en una expresión SymPy sin pasar por sympify:
+- Gramática propia: + - * / ^ **, superíndices (x², x⁻¹), √, ln, π
+- Multiplicación implícita: 2x, 3sin(x), (x+1)(x-1), x(x+1)
+- Tablas de símbolos y expresión regular precompiladas al importar el módulo
+- Construye directamente los nodos de SymPy (sin eval ni tokenize de Python)
+- Los errores indican la posición exacta del problema en el texto
+"""
+
+import math
+import re
+
+import sympy as sp
+
+X = sp.Symbol('x')
+
+# Funciones reconocidas: nombre -> (constructor, argumentos mínimos, máximos)
+FUNCIONES = {
+    'sin': (sp.sin, 1, 1), 'sen': (sp.sin, 1, 1),
+    'cos': (sp.cos, 1, 1),
+    'tan': (sp.tan, 1, 1), 'tg': (sp.tan, 1, 1),
+    'cot': (sp.cot, 1, 1), 'sec': (sp.sec, 1, 1), 'csc': (sp.csc, 1, 1),
+    'asin': (sp.asin, 1, 1), 'arcsin': (sp.asin, 1, 1),
+    'acos': (sp.acos, 1, 1), 'arccos': (sp.acos, 1, 1),
+    'atan': (sp.atan, 1, 1), 'arctan': (sp.atan, 1, 1),
+    'sinh': (sp.sinh, 1, 1), 'cosh': (sp.cosh, 1, 1), 'tanh': (sp.tanh, 1, 1),
+    'exp': (sp.exp, 1, 1),
+    'log': (sp.log, 1, 2), 'ln': (sp.log, 1, 1),
+    'sqrt': (sp.sqrt, 1, 1), 'cbrt': (sp.cbrt, 1, 1),
+    'abs': (sp.Abs, 1, 1), 'Abs': (sp.Abs, 1, 1),
+    'sign': (sp.sign, 1, 1),
+    'floor': (sp.floor, 1, 1), 'ceiling': (sp.ceiling, 1, 1),
+}
+
+# Constantes y la variable independiente
+CONSTANTES = {
+    'x': X,
+    'pi': sp.pi, 'π': sp.pi,
+    'e': sp.E, 'E': sp.E,
+}
+
+# Superíndices unicode -> caracteres ASCII
+SUPERINDICES = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺', '0123456789-+')
+
+# Dígitos máximos de una potencia numérica exacta (9^9^9 colgaría SymPy)
+MAX_DIGITOS_POTENCIA = 10000
+
+_TOKEN = re.compile(r"""
+     (?P<espacio>\s+)
+    |(?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    |(?P<nombre>[A-Za-z_]+|π)
+    |(?P<superindice>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺]+)
+    |(?P<potencia>\*\*|\^)
+    |(?P<operador>[-+*/−·×÷])
+    |(?P<abre>[(\[])
+    |(?P<cierra>[)\]])
+    |(?P<coma>,)
+    |(?P<raiz>√)
+""", re.VERBOSE)
+
+# Un identificador como "sinx" o "xsin" se separa en nombres conocidos,
+# eligiendo siempre el más largo ("exp" antes que "e")
+_NOMBRE = re.compile('|'.join(sorted(
+    (re.escape(n) for n in list(FUNCIONES) + list(CONSTANTES)), key=len, reverse=True)))
+
+_OPERADORES = {'−': '-', '·': '*', '×': '*', '÷': '/'}
+_CIERRES = {'(': ')', '[': ']'}
+
+# Tokens con los que puede empezar un factor (habilitan la multiplicación implícita)
+_INICIO_FACTOR = frozenset(('numero', 'nombre', 'abre', 'raiz'))
+
+
+class ErrorSintaxis(ValueError):
+    """Error de sintaxis con la posición (índice desde 0) donde se detectó."""
+
+    def __init__(self, mensaje, posicion, texto=None):
+        """
+        Args:
+            mensaje (str): descripción del problema
+            posicion (int): índice del carácter en el texto original
+            texto (str): texto analizado, para señalar la posición
+        """
+        super().__init__(f"{mensaje} (posición {posicion + 1})")
+        self.mensaje = mensaje
+        self.posicion = posicion
+        self.texto = texto
+
+    def senalar(self, marca='▸'):
+        """
+        Muestra el texto con una marca delante del carácter del error.
+
+        La marca va en la misma línea para que se vea bien con cualquier fuente.
+
+        Args:
+            marca (str): texto que se inserta en la posición del error
+
+        Returns:
+            str: p. ej. "(x + 1▸" para un paréntesis sin cerrar
+        """
+        if self.texto is None:
+            return str(self)
+        return f"{self.texto[:self.posicion]}{marca}{self.texto[self.posicion:]}"
+
+
+def tokenizar(texto):
+    """
+    Divide el texto en tokens.
+
+    Args:
+        texto (str): expresión escrita por el usuario
+
+    Returns:
+        list: tuplas (tipo, valor, posición)
+
+    Raises:
+        ErrorSintaxis: si hay un carácter o un nombre no reconocido
+    """
+    tokens = []
+    posicion = 0
+    largo = len(texto)
+    while posicion < largo:
+        coincidencia = _TOKEN.match(texto, posicion)
+        if coincidencia is None:
+            raise ErrorSintaxis(f"Carácter no reconocido {texto[posicion]!r}", posicion, texto)
+        tipo = coincidencia.lastgroup
+        valor = coincidencia.group()
+        if tipo == 'nombre':
+            _separar_nombres(texto, valor, posicion, tokens)
+        elif tipo == 'operador':
+            tokens.append((tipo, _OPERADORES.get(valor, valor), posicion))
+        elif tipo != 'espacio':
+            tokens.append((tipo, valor, posicion))
+        posicion = coincidencia.end()
+    return tokens
+
+
+def _separar_nombres(texto, identificador, inicio, tokens):
+    """Separa un identificador en funciones y constantes conocidas."""
+    desplazamiento = 0
+    while desplazamiento < len(identificador):
+        coincidencia = _NOMBRE.match(identificador, desplazamiento)
+        if coincidencia is None:
+            resto = identificador[desplazamiento:]
+            raise ErrorSintaxis(f"Nombre desconocido {resto!r} (la variable es x)",
+                                inicio + desplazamiento, texto)
+        tokens.append(('nombre', coincidencia.group(), inicio + desplazamiento))
+        desplazamiento = coincidencia.end()
+
+
+class _Parser:
+    """Parser descendente recursivo sobre la lista de tokens."""
+
+    __slots__ = ('texto', 'tokens', 'i')
+
+    def __init__(self, texto, tokens):
+        self.texto = texto
+        self.tokens = tokens
+        self.i = 0
+
+    def _actual(self):
+        """Devuelve el token actual, o None al final."""
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def _error(self, mensaje, token=None):
+        """Crea un ErrorSintaxis en la posición del token (o al final del texto)."""
+        posicion = token[2] if token is not None else len(self.texto.rstrip())
+        return ErrorSintaxis(mensaje, posicion, self.texto)
+
+    def parsear(self):
+        """Analiza el texto completo."""
+        if not self.tokens:
+            raise self._error("La expresión está vacía")
+        nodo = self.expresion()
+        token = self._actual()
+        if token is not None:
+            if token[0] == 'cierra':
+                raise self._error(f"{token[1]!r} sin abrir", token)
+            raise self._error(f"Símbolo inesperado {token[1]!r}", token)
+        return nodo
+
+    def expresion(self):
+        """expresion := termino (('+' | '-') termino)*"""
+        nodo = self.termino()
+        while True:
+            token = self._actual()
+            if token is None or token[0] != 'operador' or token[1] not in '+-':
+                return nodo
+            self.i += 1
+            derecho = self.termino()
+            nodo = nodo + derecho if token[1] == '+' else nodo - derecho
+
+    def termino(self):
+        """termino := unario (('*' | '/') unario | potencia implícita)*"""
+        nodo = self.unario()
+        while True:
+            token = self._actual()
+            if token is None:
+                return nodo
+            if token[0] == 'operador' and token[1] in '*/':
+                self.i += 1
+                derecho = self.unario()
+                nodo = nodo * derecho if token[1] == '*' else nodo / derecho
+            elif token[0] in _INICIO_FACTOR:
+                # Dos números seguidos ("3..2", "1.5.5", "2 3") no son una multiplicación
+                if token[0] == 'numero' and self.tokens[self.i - 1][0] == 'numero':
+                    raise self._error(f"Falta un operador antes del número {token[1]!r}", token)
+                # 2x, 3sin(x), (x+1)(x-1): el factor implícito no lleva signo propio
+                nodo = nodo * self.potencia()
+            else:
+                return nodo
+
+    def unario(self):
+        """unario := ('+' | '-') unario | potencia"""
+        token = self._actual()
+        if token is not None and token[0] == 'operador' and token[1] in '+-':
+            self.i += 1
+            operando = self.unario()
+            return -operando if token[1] == '-' else operando
+        return self.potencia()
+
+    def potencia(self):
+        """potencia := postfijo (('^' | '**') unario)?  (asociativa a derecha)"""
+        base = self.postfijo()
+        token = self._actual()
+        if token is not None and token[0] == 'potencia':
+            self.i += 1
+            return self._elevar(base, self.unario(), token)
+        return base
+
+    def postfijo(self):
+        """postfijo := primario superindice*"""
+        nodo = self.primario()
+        while True:
+            token = self._actual()
+            if token is None or token[0] != 'superindice':
+                return nodo
+            self.i += 1
+            try:
+                exponente = sp.Integer(int(token[1].translate(SUPERINDICES)))
+            except ValueError:
+                raise self._error(f"Superíndice inválido {token[1]!r}", token) from None
+            nodo = self._elevar(nodo, exponente, token)
+
+    def primario(self):
+        """primario := número | constante | función | '(' expresion ')' | '√' postfijo"""
+        token = self._actual()
+        if token is None:
+            raise self._error("La expresión termina de forma incompleta")
+        tipo, valor, _ = token
+
+        if tipo == 'numero':
+            self.i += 1
+            if '.' in valor or 'e' in valor or 'E' in valor:
+                return sp.Float(valor)
+            return sp.Integer(valor)
+
+        if tipo == 'nombre':
+            self.i += 1
+            if valor in CONSTANTES:
+                return CONSTANTES[valor]
+            return self._funcion(token)
+
+        if tipo == 'abre':
+            self.i += 1
+            nodo = self.expresion()
+            self._cerrar(token)
+            return nodo
+
+        if tipo == 'raiz':
+            self.i += 1
+            return sp.sqrt(self.postfijo())
+
+        if tipo == 'cierra':
+            raise self._error(f"Falta un operando antes de {valor!r}", token)
+        raise self._error(f"Se esperaba un número, x o '(' en lugar de {valor!r}", token)
+
+    def _funcion(self, token_nombre):
+        """Aplica una función a sus argumentos: sin(x), log(x, 2) o sin x."""
+        constructor, minimo, maximo = FUNCIONES[token_nombre[1]]
+        token = self._actual()
+        if token is None or token[0] != 'abre':
+            # Sin paréntesis la función toma el factor siguiente: sin x, ln 2x -> ln(2)*x
+            if token is None or token[0] not in _INICIO_FACTOR:
+                raise self._error(f"Falta el argumento de {token_nombre[1]}", token)
+            return constructor(self.potencia())
+
+        self.i += 1
+        argumentos = [self.expresion()]
+        while self._actual() is not None and self._actual()[0] == 'coma':
+            self.i += 1
+            argumentos.append(self.expresion())
+        self._cerrar(token)
+        if not minimo <= len(argumentos) <= maximo:
+            esperados = minimo if minimo == maximo else f"{minimo} o {maximo}"
+            raise self._error(f"{token_nombre[1]} recibe {esperados} argumento(s), "
+                              f"no {len(argumentos)}", token_nombre)
+        return constructor(*argumentos)
+
+    def _cerrar(self, apertura):
+        """Consume el cierre que corresponde a la apertura indicada."""
+        esperado = _CIERRES[apertura[1]]
+        token = self._actual()
+        if token is None or token[1] != esperado:
+            raise self._error(f"Falta {esperado!r} para cerrar el de la posición {apertura[2] + 1}",
+                              token)
+        self.i += 1
+
+    def _elevar(self, base, exponente, token):
+        """Construye base**exponente rechazando potencias numéricas gigantes."""
+        if base.is_Number and exponente.is_Integer and abs(base) > 1:
+            digitos = abs(int(exponente)) * math.log10(abs(float(base)))
+            if digitos > MAX_DIGITOS_POTENCIA:
+                raise self._error("Potencia demasiado grande", token)
+        return sp.Pow(base, exponente)
+
+
+def parsear(texto):
+    """
+    Convierte una expresión en texto en una expresión SymPy.
+
+    Args:
+        texto (str): expresión escrita por el usuario, p. ej. "2x^2 + 3sin(x)"
+
+    Returns:
+        sympy.Expr: expresión SymPy en la variable x
+
+    Raises:
+        ErrorSintaxis: si el texto no es una expresión válida (con la posición del error)
+    """
+    return _Parser(texto, tokenizar(texto)).parsear()
@@ -0,0 +1,260 @@
+"""
+Módulo Planificador de Estrategias de Análisis
+Antes de calcular nada, inspecciona la expresión y elige cómo resolver cada etapa:
+- Perfil de costo: count_ops, profundidad del árbol, clases de funciones
+  presentes y estructura polinómica o racional
+- Estrategia por etapa: exacta (camino rápido), simbólica (SymPy general)
+  o numérica (estimación en la ventana del gráfico, con sus límites indicados)
+- Cada decisión queda registrada en las métricas con su motivo
+- Las decisiones se pueden forzar por etapa (parámetro o EID_ESTRATEGIAS)
+"""
+
+import os
+
+import sympy as sp
+
+from metricas import METRICAS
+
+ESTRATEGIA_EXACTA = "exacta"
+ESTRATEGIA_SIMBOLICA = "simbólica"
+ESTRATEGIA_NUMERICA = "numérica"
+ESTRATEGIAS = (ESTRATEGIA_EXACTA, ESTRATEGIA_SIMBOLICA, ESTRATEGIA_NUMERICA)
+
+# Etapas que se planifican (la derivada siempre es simbólica y barata)
+ETAPAS_PLANIFICADAS = ('dominio', 'recorrido', 'intersecciones')
+
+# Umbrales del modelo de costo
+MAX_OPS_SIMBOLICO = 40        # dominio e intersecciones con SymPy general
+MAX_PROFUNDIDAD_SIMBOLICA = 8
+MAX_OPS_LIMITES = 20          # recorrido con límites en ±∞
+MAX_GRADO_EXACTO = 30         # raíces reales exactas de un polinomio (y de su derivada)
+
+# Clases de funciones que se reconocen en el perfil
+_CLASES = (
+    (('sin', 'cos', 'tan', 'cot', 'sec', 'csc'), 'trigonométrica'),
+    (('asin', 'acos', 'atan', 'acot', 'asec', 'acsc'), 'trigonométrica inversa'),
+    (('sinh', 'cosh', 'tanh', 'coth', 'sech', 'csch'), 'hiperbólica'),
+    (('exp',), 'exponencial'),
+    (('log',), 'logarítmica'),
+    (('Abs', 'sign', 'floor', 'ceiling', 'Piecewise', 'Heaviside'), 'no suave'),
+)
+_CLASE_DE = {nombre: clase for nombres, clase in _CLASES for nombre in nombres}
+
+# Funciones definidas y continuas en todo ℝ: componerlas con polinomios da dominio ℝ
+_ENTERAS = frozenset(('sin', 'cos', 'exp', 'sinh', 'cosh', 'tanh', 'atan', 'Abs', 'sign',
+                      'floor', 'ceiling'))
+
+# Nombres aceptados al forzar una estrategia (sin tildes para la variable de entorno)
+_ALIAS = {
+    'exacta': ESTRATEGIA_EXACTA,
+    'simbolica': ESTRATEGIA_SIMBOLICA, 'simbólica': ESTRATEGIA_SIMBOLICA,
+    'numerica': ESTRATEGIA_NUMERICA, 'numérica': ESTRATEGIA_NUMERICA,
+}
+
+
+class PerfilExpresion:
+    """Características de la expresión que usa el modelo de costo."""
+
+    __slots__ = ('operaciones', 'profundidad', 'clases', 'es_polinomio', 'grado',
+                 'coeficientes_racionales', 'es_racional', 'es_algebraica', 'es_entera')
+
+    def __init__(self, funcion_sympy, x):
+        """
+        Args:
+            funcion_sympy (sympy.Expr): función en formato SymPy
+            x (sympy.Symbol): variable independiente
+        """
+        self.operaciones = int(sp.count_ops(funcion_sympy))
+        self.profundidad = _profundidad(funcion_sympy)
+        self.clases = set()
+        self.es_algebraica = True
+        self.es_entera = True
+        for nodo in sp.preorder_traversal(funcion_sympy):
+            if nodo.is_Atom or not nodo.has(x):
+                continue
+            if nodo.is_Pow:
+                if nodo.exp.has(x):
+                    self.clases.add('exponencial')
+                    self.es_algebraica = False
+                    self.es_entera = self.es_entera and not nodo.base.has(x)
+                elif not (nodo.exp.is_Integer and nodo.exp >= 0):
+                    self.es_entera = False
+                    if not nodo.exp.is_Integer:
+                        self.clases.add('radical')
+                        self.es_algebraica = self.es_algebraica and nodo.exp.is_Rational
+                continue
+            if nodo.is_Add or nodo.is_Mul:
+                continue
+            nombre = type(nodo).__name__
+            self.clases.add(_CLASE_DE.get(nombre, nombre))
+            self.es_algebraica = False
+            if nombre not in _ENTERAS:
+                self.es_entera = False
+
+        self.es_polinomio = funcion_sympy.is_polynomial(x)
+        self.es_racional = funcion_sympy.is_rational_function(x)
+        self.grado = None
+        self.coeficientes_racionales = False
+        if self.es_polinomio:
+            polinomio = sp.Poly(funcion_sympy, x)
+            self.grado = polinomio.degree()
+            self.coeficientes_racionales = all(c.is_Rational for c in polinomio.coeffs())
+
+    def a_dict(self):
+        """Devuelve el perfil como diccionario serializable."""
+        return {
+            "operaciones": self.operaciones,
+            "profundidad": self.profundidad,
+            "clases": sorted(self.clases),
+            "polinomio": self.es_polinomio,
+            "grado": self.grado,
+            "racional": self.es_racional,
+            "algebraica": self.es_algebraica,
+        }
+
+
+def _profundidad(expr):
+    """Profundidad del árbol de la expresión."""
+    if not expr.args:
+        return 0
+    return 1 + max(_profundidad(arg) for arg in expr.args)
+
+
+class Plan:
+    """Estrategia elegida para cada etapa, con su motivo."""
+
+    __slots__ = ('perfil', 'decisiones', 'forzadas')
+
+    def __init__(self, perfil, decisiones, forzadas):
+        """
+        Args:
+            perfil (PerfilExpresion): perfil de la expresión
+            decisiones (dict): etapa -> (estrategia, motivo)
+            forzadas (frozenset): etapas cuya estrategia fue forzada
+        """
+        self.perfil = perfil
+        self.decisiones = decisiones
+        self.forzadas = forzadas
+
+    def estrategia(self, etapa):
+        """Devuelve la estrategia de una etapa (simbólica si no se planificó)."""
+        return self.decisiones.get(etapa, (ESTRATEGIA_SIMBOLICA, ""))[0]
+
+    def motivo(self, etapa):
+        """Devuelve el motivo de la estrategia de una etapa."""
+        return self.decisiones.get(etapa, (ESTRATEGIA_SIMBOLICA, ""))[1]
+
+    def resumen(self):
+        """
+        Resume el plan en una línea.
+
+        Returns:
+            str: p. ej. "dominio exacta · recorrido numérica · intersecciones numérica"
+        """
+        return " · ".join(f"{etapa} {estrategia}" + (" (forzada)" if etapa in self.forzadas else "")
+                          for etapa, (estrategia, _) in self.decisiones.items())
+
+
+def _plan_dominio(perfil):
+    """Elige la estrategia del dominio."""
+    if perfil.es_entera:
+        return ESTRATEGIA_EXACTA, "composición de funciones definidas en todo ℝ"
+    if perfil.operaciones <= MAX_OPS_SIMBOLICO and perfil.profundidad <= MAX_PROFUNDIDAD_SIMBOLICA:
+        return ESTRATEGIA_SIMBOLICA, f"expresión pequeña ({perfil.operaciones} operaciones)"
+    return ESTRATEGIA_NUMERICA, (f"expresión grande ({perfil.operaciones} operaciones, "
+                                 f"profundidad {perfil.profundidad})")
+
+
+def _plan_recorrido(perfil):
+    """Elige la estrategia del recorrido."""
+    if perfil.es_polinomio and perfil.grado <= MAX_GRADO_EXACTO:
+        return ESTRATEGIA_EXACTA, f"puntos críticos de un polinomio de grado {perfil.grado}"
+    if perfil.es_polinomio:
+        return ESTRATEGIA_SIMBOLICA, f"polinomio de grado {perfil.grado}"
+    if perfil.es_racional:
+        return ESTRATEGIA_EXACTA, "función racional: puntos críticos, polos y términos principales"
+    if perfil.clases & {'trigonométrica', 'no suave'}:
+        return ESTRATEGIA_NUMERICA, "los límites en ±∞ no describen funciones periódicas o a trozos"
+    if perfil.operaciones <= MAX_OPS_LIMITES:
+        return ESTRATEGIA_SIMBOLICA, f"límites en ±∞ ({perfil.operaciones} operaciones)"
+    return ESTRATEGIA_NUMERICA, f"límites costosos ({perfil.operaciones} operaciones)"
+
+
+def _plan_intersecciones(perfil):
+    """Elige la estrategia de las intersecciones con los ejes."""
+    if perfil.es_polinomio and perfil.coeficientes_racionales and perfil.grado <= MAX_GRADO_EXACTO:
+        return ESTRATEGIA_EXACTA, f"raíces reales de un polinomio de grado {perfil.grado}"
+    if perfil.es_algebraica and perfil.operaciones <= MAX_OPS_SIMBOLICO:
+        return ESTRATEGIA_SIMBOLICA, "expresión algebraica pequeña"
+    if not perfil.es_algebraica:
+        return ESTRATEGIA_NUMERICA, "expresión trascendente: raíces sin fórmula cerrada"
+    return ESTRATEGIA_NUMERICA, f"expresión algebraica grande ({perfil.operaciones} operaciones)"
+
+
+_PLANES = {
+    'dominio': _plan_dominio,
+    'recorrido': _plan_recorrido,
+    'intersecciones': _plan_intersecciones,
+}
+
+
+def leer_forzadas(texto):
+    """
+    Interpreta estrategias forzadas escritas como texto.
+
+    Args:
+        texto (str): "numerica" (todas las etapas) o pares separados por comas,
+            p. ej. "recorrido=numerica,dominio=simbolica"
+
+    Returns:
+        dict: etapa -> estrategia; las entradas inválidas se informan y se ignoran
+    """
+    forzadas = {}
+    for parte in (texto or "").split(","):
+        parte = parte.strip().lower()
+        if not parte:
+            continue
+        etapa, _, nombre = parte.rpartition("=")
+        estrategia = _ALIAS.get(nombre.strip())
+        etapas = ETAPAS_PLANIFICADAS if not etapa else (etapa.strip(),)
+        if estrategia is None or any(e not in ETAPAS_PLANIFICADAS for e in etapas):
+            print(f"Estrategia forzada inválida ignorada: {parte!r}")
+            continue
+        for e in etapas:
+            forzadas[e] = estrategia
+    return forzadas
+
+
+def forzadas_de_entorno():
+    """Lee las estrategias forzadas de la variable de entorno EID_ESTRATEGIAS."""
+    return leer_forzadas(os.environ.get("EID_ESTRATEGIAS"))
+
+
+def planificar(funcion_sympy, x, forzadas=None, etiqueta=None):
+    """
+    Elige la estrategia de cada etapa y registra la decisión.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+        forzadas (dict): etapa -> estrategia que reemplaza a la elegida
+        etiqueta (str): texto de la función para el registro
+
+    Returns:
+        Plan: estrategias por etapa
+    """
+    forzadas = forzadas or {}
+    with METRICAS.medir("planificacion"):
+        perfil = PerfilExpresion(funcion_sympy, x)
+        decisiones = {}
+        for etapa, elegir in _PLANES.items():
+            if etapa in forzadas:
+                decisiones[etapa] = (forzadas[etapa], "forzada")
+            else:
+                decisiones[etapa] = elegir(perfil)
+            METRICAS.contar(f"plan.{etapa}.{decisiones[etapa][0]}")
+
+    METRICAS.registrar_evento("plan", funcion=etiqueta, perfil=perfil.a_dict(),
+                              decisiones={etapa: {"estrategia": e, "motivo": m}
+                                          for etapa, (e, m) in decisiones.items()})
+    return Plan(perfil, decisiones, frozenset(forzadas))
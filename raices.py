@@ -0,0 +1,180 @@
+"""
+Módulo de Búsqueda Numérica de Raíces
+Encuentra todas las raíces reales de una función en un intervalo:
+- Acotamiento vectorizado por cambio de signo sobre una malla densa
+- Acotamiento de extremos locales de |f| para raíces sin cambio de signo
+- Refinamiento con el método de Brent y eliminación de duplicados
+"""
+
+import math
+
+import numpy as np
+
+from muestreo import X, compilar_funcion, evaluar_malla
+
+def _funcion_escalar(funcion_sympy, variable):
+    """Devuelve f como función de un float que retorna float (NaN si no es real)."""
+    compilada = compilar_funcion(funcion_sympy, variable)
+
+    def f(valor):
+        try:
+            with np.errstate(all="ignore"):
+                y = complex(compilada(valor))
+        except Exception:
+            y = complex(evaluar_malla(funcion_sympy, np.array([valor]), variable)[0])
+        if abs(y.imag) > 1e-10 or not math.isfinite(y.real):
+            return math.nan
+        return y.real
+
+    return f
+
+
+def brent(f, a, b, fa=None, fb=None, xtol=1e-14, rtol=4 * np.finfo(float).eps, max_iter=100):
+    """
+    Refina una raíz acotada en [a, b] con el método de Brent.
+
+    Args:
+        f (callable): función escalar
+        a, b (float): extremos con f(a) y f(b) de signos opuestos
+        fa, fb (float): valores ya conocidos de f en los extremos
+        xtol (float): tolerancia absoluta en x
+        rtol (float): tolerancia relativa en x
+        max_iter (int): máximo de iteraciones
+
+    Returns:
+        float: aproximación de la raíz
+    """
+    x_pre, x_act = float(a), float(b)
+    f_pre = f(x_pre) if fa is None else float(fa)
+    f_act = f(x_act) if fb is None else float(fb)
+    if f_pre == 0:
+        return x_pre
+    if f_act == 0:
+        return x_act
+
+    x_blq = f_blq = paso_pre = paso_act = 0.0
+    for _ in range(max_iter):
+        if f_pre * f_act < 0:
+            x_blq, f_blq = x_pre, f_pre
+            paso_pre = paso_act = x_act - x_pre
+        if abs(f_blq) < abs(f_act):
+            x_pre, x_act, x_blq = x_act, x_blq, x_act
+            f_pre, f_act, f_blq = f_act, f_blq, f_act
+
+        delta = (xtol + rtol * abs(x_act)) / 2
+        biseccion = (x_blq - x_act) / 2
+        if f_act == 0 or abs(biseccion) < delta:
+            return x_act
+
+        if abs(paso_pre) > delta and abs(f_act) < abs(f_pre):
+            if x_pre == x_blq:
+                # Método de la secante
+                intento = -f_act * (x_act - x_pre) / (f_act - f_pre)
+            else:
+                # Interpolación cuadrática inversa
+                d_pre = (f_pre - f_act) / (x_pre - x_act)
+                d_blq = (f_blq - f_act) / (x_blq - x_act)
+                intento = -f_act * (f_blq * d_blq - f_pre * d_pre) / (d_blq * d_pre * (f_blq - f_pre))
+            if 2 * abs(intento) < min(abs(paso_pre), 3 * abs(biseccion) - delta):
+                paso_pre, paso_act = paso_act, intento
+            else:
+                paso_pre = paso_act = biseccion
+        else:
+            paso_pre = paso_act = biseccion
+
+        x_pre, f_pre = x_act, f_act
+        if abs(paso_act) > delta:
+            x_act += paso_act
+        else:
+            x_act += delta if biseccion > 0 else -delta
+        f_act = f(x_act)
+        if math.isnan(f_act):
+            # Punto fuera del dominio dentro del intervalo: no hay raíz confiable
+            return x_act
+    return x_act
+
+
+def _minimo_seccion_aurea(f, a, b, xtol=1e-13, max_iter=200):
+    """Busca el mínimo de f en [a, b] por sección áurea."""
+    razon = (math.sqrt(5) - 1) / 2
+    c = b - razon * (b - a)
+    d = a + razon * (b - a)
+    fc, fd = f(c), f(d)
+    for _ in range(max_iter):
+        if abs(b - a) <= xtol * (1 + abs(a) + abs(b)):
+            break
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - razon * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + razon * (b - a)
+            fd = f(d)
+    return (a + b) / 2
+
+
+def _eliminar_duplicados(raices, tolerancia=1e-7):
+    """Ordena las raíces y une las que están a menos de la tolerancia relativa."""
+    unicas = []
+    for raiz in sorted(raices):
+        if not unicas or abs(raiz - unicas[-1]) > tolerancia * (1 + abs(raiz)):
+            unicas.append(raiz)
+    return unicas
+
+
+def buscar_raices(funcion_sympy, intervalo=(-10, 10), n_puntos=4001, variable=X):
+    """
+    Encuentra numéricamente las raíces reales de una función en un intervalo.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        intervalo (tuple): (a, b) donde buscar raíces
+        n_puntos (int): puntos de la malla de acotamiento
+        variable (sympy.Symbol): variable independiente
+
+    Returns:
+        list: raíces ordenadas como floats
+    """
+    xs = np.linspace(intervalo[0], intervalo[1], int(n_puntos))
+    ys = evaluar_malla(funcion_sympy, xs, variable)
+    f = _funcion_escalar(funcion_sympy, variable)
+
+    finitos = np.isfinite(ys)
+    if not finitos.any():
+        return []
+    # Escala de la función para distinguir raíces de polos
+    escala = 1.0 + float(np.nanmedian(np.abs(ys)))
+
+    raices = [float(x) for x in xs[finitos & (ys == 0)]]
+
+    # Cambios de signo entre puntos consecutivos
+    izquierda, derecha = ys[:-1], ys[1:]
+    cambios = np.nonzero(np.isfinite(izquierda) & np.isfinite(derecha) & (izquierda * derecha < 0))[0]
+    for i in cambios:
+        raiz = brent(f, xs[i], xs[i + 1], ys[i], ys[i + 1])
+        valor = f(raiz)
+        # Un cambio de signo a través de un polo no es una raíz
+        if math.isfinite(valor) and abs(valor) <= 1e-8 * escala:
+            raices.append(float(raiz))
+
+    # Mínimos locales de |f| sin cambio de signo (raíces dobles, tangencias)
+    absolutos = np.abs(ys)
+    centro = absolutos[1:-1]
+    minimos = np.nonzero(
+        np.isfinite(ys[:-2]) & np.isfinite(ys[1:-1]) & np.isfinite(ys[2:])
+        & (centro <= absolutos[:-2]) & (centro <= absolutos[2:])
+        & (ys[:-2] * ys[1:-1] > 0) & (ys[1:-1] * ys[2:] > 0)
+    )[0] + 1
+
+    def modulo(t):
+        valor = f(t)
+        return math.inf if math.isnan(valor) else abs(valor)
+
+    for i in minimos:
+        candidato = _minimo_seccion_aurea(modulo, xs[i - 1], xs[i + 1])
+        valor = f(candidato)
+        if math.isfinite(valor) and abs(valor) <= 1e-10 * escala:
+            raices.append(float(candidato))
+
+    return _eliminar_duplicados(raices)
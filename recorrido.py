@@ -0,0 +1,300 @@
+"""
+Módulo de Recorrido Exacto de Funciones Racionales
+Calcula el recorrido de polinomios y cocientes de polinomios sin límites generales:
+- Puntos críticos: raíces reales aisladas del numerador de la derivada
+- Valores exactos de la función en los puntos críticos
+- Límites laterales en los polos por el signo de la función junto a cada polo
+- Comportamiento en ±∞ por los términos principales
+- Huecos (factores comunes) cuyo valor no se alcanza en otro punto
+Las derivadas y las raíces aisladas quedan en caché, así que repetir una
+consulta cuesta milisegundos.
+"""
+
+import math
+from functools import lru_cache
+
+import sympy as sp
+
+from dominio import ConjuntoReal, Intervalo, MAX_GRADO_DOMINIO, raices_reales
+from metricas import METRICAS, estadisticas_lru
+
+X = sp.Symbol('x')
+
+# Tolerancia relativa para comparar valores de la función
+TOLERANCIA_VALORES = 1e-9
+
+# Dígitos con que se evalúan las raíces sin fórmula cerrada (CRootOf)
+DIGITOS_RAICES = 30
+
+
+def _cerca(a, b):
+    """Compara dos valores float (incluidos ±inf) con tolerancia relativa."""
+    if a == b:
+        return True
+    if math.isinf(a) or math.isinf(b):
+        return False
+    return abs(a - b) <= TOLERANCIA_VALORES * max(1.0, abs(a), abs(b))
+
+
+def _flotante(valor):
+    """Valor float de un valor exacto, con ±∞."""
+    if valor is sp.oo:
+        return math.inf
+    if valor is sp.S.NegativeInfinity:
+        return -math.inf
+    return float(valor)
+
+
+def partes_racionales(funcion_sympy, x=X):
+    """
+    Separa una función racional en numerador y denominador polinómicos.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        tuple: (numerador, denominador) como sympy.Poly, o None si la función
+        no es racional o su grado supera el que se aísla
+    """
+    if not funcion_sympy.is_rational_function(x):
+        return None
+    numerador, denominador = sp.fraction(funcion_sympy)
+    if not (numerador.is_polynomial(x) and denominador.is_polynomial(x)):
+        numerador, denominador = sp.fraction(sp.together(funcion_sympy))
+    try:
+        p_numerador = sp.Poly(numerador, x)
+        p_denominador = sp.Poly(denominador, x)
+    except sp.PolynomialError:
+        return None
+    if p_numerador.free_symbols - {x} or p_denominador.free_symbols - {x}:
+        return None
+    if p_numerador.degree() + p_denominador.degree() > MAX_GRADO_DOMINIO:
+        return None
+    return p_numerador, p_denominador
+
+
+class AnalisisRacional:
+    """Polos, huecos y puntos críticos de un cociente de polinomios."""
+
+    __slots__ = ('numerador', 'denominador', 'derivada', 'polos', 'huecos', 'criticos')
+
+    def __init__(self, numerador, denominador):
+        """
+        Args:
+            numerador (sympy.Poly): numerador
+            denominador (sympy.Poly): denominador (no nulo)
+        """
+        # Los factores comunes se cancelan para el análisis; sus raíces quedan como huecos
+        comun = numerador.gcd(denominador)
+        self.numerador = numerador.exquo(comun)
+        self.denominador = denominador.exquo(comun)
+        # Numerador de la derivada (el denominador, Q², no cambia de signo)
+        self.derivada = (self.numerador.diff() * self.denominador -
+                         self.numerador * self.denominador.diff())
+        self.polos = raices_reales(self.denominador)
+        huecos = raices_reales(comun)
+        if self.polos is None or huecos is None:
+            raise ValueError("grado demasiado alto para aislar las raíces")
+        valores_polos = {_flotante(p) for p in self.polos}
+        self.huecos = tuple(h for h in huecos if _flotante(h) not in valores_polos)
+        excluidos = valores_polos | {_flotante(h) for h in self.huecos}
+        criticos = () if self.derivada.is_zero else raices_reales(self.derivada)
+        if criticos is None:
+            raise ValueError("grado demasiado alto para aislar las raíces")
+        self.criticos = tuple(c for c in criticos if _flotante(c) not in excluidos)
+
+    def es_constante(self):
+        """Indica si la función reducida es constante."""
+        return self.derivada.is_zero
+
+    def valor(self, punto):
+        """
+        Valor exacto de la función reducida en un punto que no es polo.
+
+        Returns:
+            sympy.Expr: valor exacto simplificado, o Float si el punto es un CRootOf
+        """
+        if punto.has(sp.CRootOf):
+            # Sin fórmula cerrada el valor se muestra en decimal; evaluar el CRootOf
+            # exacto pasaría por el dominio EX, cientos de veces más lento
+            punto = punto.evalf(DIGITOS_RAICES)
+        valor = self.numerador.eval(punto) / self.denominador.eval(punto)
+        if punto.is_Rational or punto.is_Float:
+            return valor
+        return sp.radsimp(sp.expand(valor))
+
+    def limite_infinito(self, signo):
+        """
+        Límite en +∞ (signo 1) o -∞ (signo -1) por los términos principales.
+
+        Returns:
+            sympy.Expr: valor del límite, o ±oo
+        """
+        exceso = self.numerador.degree() - self.denominador.degree()
+        cociente = self.numerador.LC() / self.denominador.LC()
+        if exceso < 0:
+            return sp.S.Zero
+        if exceso == 0:
+            return cociente
+        orientacion = _flotante(cociente) * (signo ** exceso)
+        return sp.oo if orientacion > 0 else -sp.oo
+
+    def limite_polo(self, polo, lado):
+        """
+        Límite lateral en un polo: ±∞ según el signo de la función junto al polo.
+
+        Args:
+            polo (sympy.Expr): raíz real del denominador reducido
+            lado (int): -1 por la izquierda, 1 por la derecha
+
+        Returns:
+            sympy.Expr: oo o -oo
+        """
+        # Entre el polo y el cero o polo más cercano de ese lado el signo no cambia
+        centro = _flotante(polo)
+        eventos = [_flotante(r) for r in raices_reales(self.numerador) + self.polos]
+        if lado > 0:
+            vecinos = [e for e in eventos if e > centro]
+            prueba = (centro + min(vecinos)) / 2 if vecinos else centro + 1
+        else:
+            vecinos = [e for e in eventos if e < centro]
+            prueba = (centro + max(vecinos)) / 2 if vecinos else centro - 1
+        prueba = sp.Rational(prueba)
+        signo = _flotante(self.numerador.eval(prueba)) * _flotante(self.denominador.eval(prueba))
+        return sp.oo if signo > 0 else -sp.oo
+
+
+@lru_cache(maxsize=256)
+def analizar_racional(numerador, denominador):
+    """
+    Analiza un cociente de polinomios, recordando los ya analizados.
+
+    Args:
+        numerador (sympy.Poly): numerador
+        denominador (sympy.Poly): denominador
+
+    Returns:
+        AnalisisRacional: polos, huecos, derivada y puntos críticos
+    """
+    return AnalisisRacional(numerador, denominador)
+
+
+def _extremo(candidatos, elegir):
+    """
+    Elige el extremo de un tramo entre sus candidatos.
+
+    Args:
+        candidatos (list): (valor exacto, alcanzado) de límites y puntos críticos
+        elegir (callable): min o max
+
+    Returns:
+        tuple: (valor exacto, cerrado)
+    """
+    objetivo = elegir(_flotante(valor) for valor, _ in candidatos)
+    cerrado = False
+    exacto = None
+    for valor, alcanzado in candidatos:
+        if _cerca(_flotante(valor), objetivo):
+            if exacto is None or alcanzado:
+                exacto = valor
+            cerrado = cerrado or alcanzado
+    return exacto, cerrado
+
+
+def _recorrido_analisis(analisis):
+    """Recorrido de la función reducida, tramo por tramo entre polos consecutivos."""
+    if analisis.es_constante():
+        valor = analisis.numerador.LC() / analisis.denominador.LC()
+        return ConjuntoReal([Intervalo(valor, valor, False, False)])
+
+    bordes = [-sp.oo] + list(analisis.polos) + [sp.oo]
+    intervalos = []
+    for inicio, fin in zip(bordes, bordes[1:]):
+        a, b = _flotante(inicio), _flotante(fin)
+        candidatos = [
+            (analisis.limite_infinito(-1) if inicio is -sp.oo else analisis.limite_polo(inicio, 1), False),
+            (analisis.limite_infinito(1) if fin is sp.oo else analisis.limite_polo(fin, -1), False),
+        ]
+        candidatos.extend((analisis.valor(c), True) for c in analisis.criticos
+                          if a < _flotante(c) < b)
+        inf, cerrado_inf = _extremo(candidatos, min)
+        sup, cerrado_sup = _extremo(candidatos, max)
+        intervalos.append(Intervalo(inf, sup, not cerrado_inf, not cerrado_sup))
+    conjunto = ConjuntoReal(intervalos)
+
+    # El valor en un hueco solo pertenece al recorrido si se alcanza en otro punto
+    faltantes = []
+    for hueco in analisis.huecos:
+        valor = analisis.valor(hueco)
+        nivel = analisis.numerador - analisis.denominador * sp.Poly(valor, *analisis.numerador.gens)
+        soluciones = raices_reales(nivel) if not nivel.is_zero else None
+        huecos = {_flotante(h) for h in analisis.huecos}
+        if soluciones is not None and not any(_flotante(s) not in huecos for s in soluciones):
+            faltantes.append(valor)
+    return conjunto.sin_puntos(faltantes) if faltantes else conjunto
+
+
+@lru_cache(maxsize=256)
+def recorrido_racional(funcion_sympy, x=X):
+    """
+    Calcula el recorrido exacto de un polinomio o una función racional.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        ConjuntoReal: recorrido, o None si la función no es racional o su
+        grado es demasiado alto
+    """
+    partes = partes_racionales(funcion_sympy, x)
+    if partes is None:
+        return None
+    try:
+        with METRICAS.medir("recorrido.racional"):
+            return _recorrido_analisis(analizar_racional(*partes))
+    except (ValueError, sp.PolynomialError) as e:
+        print(f"Recorrido exacto no disponible: {e}")
+        return None
+
+
+METRICAS.registrar_fuente("recorrido", estadisticas_lru(recorrido_racional))
+
+
+def limpiar_caches():
+    """Vacía las cachés de recorridos y de análisis racionales."""
+    recorrido_racional.cache_clear()
+    analizar_racional.cache_clear()
+
+
+def describir_recorrido(funcion_sympy, x=X):
+    """
+    Describe el recorrido de un polinomio o una función racional.
+
+    Los polinomios conservan las explicaciones habituales (función constante,
+    vértice, mínimo o máximo global); el resto se describe como conjunto.
+
+    Args:
+        funcion_sympy (sympy.Expr): función en formato SymPy
+        x (sympy.Symbol): variable independiente
+
+    Returns:
+        str: descripción del recorrido, o None si no es racional
+    """
+    conjunto = recorrido_racional(funcion_sympy, x)
+    if conjunto is None:
+        return None
+    if not funcion_sympy.is_polynomial(x) or len(conjunto.intervalos) != 1:
+        return conjunto.formatear()
+
+    grado = sp.degree(funcion_sympy, x)
+    intervalo = conjunto.intervalos[0]
+    if grado == 0:
+        return f"{{{funcion_sympy}}} (Función constante)"
+    if conjunto.es_reales():
+        return "ℝ (Todos los números reales)"
+    punto = "el vértice" if grado == 2 else ("el mínimo" if intervalo.b == math.inf else "el máximo")
+    if intervalo.b == math.inf:
+        return f"{intervalo.formatear()} (Desde {punto} hacia arriba)"
+    return f"{intervalo.formatear()} (Desde {punto} hacia abajo)"
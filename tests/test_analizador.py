@@ -0,0 +1,89 @@
+"""Pruebas de ResultadoAnalisis y de AnalizadorFunciones."""
+
+import threading
+import time
+
+import pytest
+
+import analizador
+import asintotas
+from analizador import AnalizadorFunciones, ResultadoAnalisis
+from parseador import X, parsear
+from trabajadores import PoolTrabajadores
+
+
+def test_etapa_se_calcula_una_vez_con_hilos(monkeypatch):
+    llamadas = []
+
+    def derivada_lenta(funcion_sympy, x):
+        llamadas.append(threading.get_ident())
+        time.sleep(0.05)
+        return funcion_sympy.diff(x)
+
+    for estrategia in list(analizador._CALCULOS['derivada']):
+        monkeypatch.setitem(analizador._CALCULOS['derivada'], estrategia, derivada_lenta)
+    resultado = ResultadoAnalisis("x^3", parsear("x^3"), X)
+    valores = []
+    hilos = [threading.Thread(target=lambda: valores.append(resultado.derivada)) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert len(llamadas) == 1
+    assert valores == [3 * X**2] * 4
+    assert resultado.estados == {'derivada': 'ok'}
+
+
+def test_resultado_no_se_reasigna():
+    resultado = ResultadoAnalisis("x", X, X)
+    with pytest.raises(AttributeError):
+        resultado.funcion = "y"
+
+
+def test_misma_expresion_reutiliza_resultado():
+    analizador_funciones = AnalizadorFunciones()
+    assert analizador_funciones.parsear_funcion("sin(x)")
+    resultado = analizador_funciones.analizar()
+    assert analizador_funciones.parsear_funcion(" sin(x) ")
+    assert analizador_funciones.analizar() is resultado
+
+
+def test_parsear_no_crea_resultado():
+    analizador_funciones = AnalizadorFunciones()
+    assert analizador_funciones.parsear_funcion("x^2 - 4")
+    assert analizador_funciones.resultado is None
+    resultado = analizador_funciones.resultado_de(analizador_funciones.funcion,
+                                                  analizador_funciones.funcion_sympy)
+    assert analizador_funciones.resultado is None
+    assert analizador_funciones.analizar() is resultado
+
+
+def test_error_de_parseo_queda_en_error_parseo(capsys):
+    analizador_funciones = AnalizadorFunciones()
+    assert not analizador_funciones.parsear_funcion("x +* 2")
+    assert analizador_funciones.error_parseo is not None
+    assert capsys.readouterr().out == ""
+
+
+def test_intersecciones_con_raiz_impar():
+    resultado = ResultadoAnalisis("x^(5/3)-x", parsear("x^(5/3)-x"), X)
+    assert resultado.intersecciones[0] == pytest.approx([-1, 0, 1], abs=1e-9)
+    resultado = ResultadoAnalisis("cbrt(x^2-4)", parsear("cbrt(x^2-4)"), X)
+    assert resultado.intersecciones[1] == pytest.approx(-4 ** (1 / 3))
+
+
+def test_asintotas_de_los_pasos_usan_el_pool_fuera_del_hilo_principal():
+    asintotas.limpiar_caches()
+    pool = PoolTrabajadores(n_procesos=1)
+    try:
+        analizador_con_pool = AnalizadorFunciones(trabajadores=pool)
+        analizador_con_pool.parsear_funcion("sqrt(x^2+x) - x")
+        pasos = []
+        hilo = threading.Thread(target=lambda: pasos.extend(
+            analizador_con_pool.iterar_desarrollo_computacional()))
+        hilo.start()
+        hilo.join()
+    finally:
+        pool.cerrar()
+    recorrido = dict(pasos)['recorrido']
+    assert any(paso.startswith("Asíntotas:") and "y = 1/2" in paso for paso in recorrido)
@@ -0,0 +1,109 @@
+"""Pruebas de límites, asíntotas y recorrido por tramos monótonos."""
+
+import math
+import threading
+
+import pytest
+import sympy as sp
+
+import asintotas
+from analizador import AnalizadorFunciones
+from asintotas import calcular_asintotas, limite_infinito, limite_lateral, recorrido_monotono
+from parseador import X, parsear
+
+
+@pytest.mark.parametrize("texto, signo, esperado", [
+    ("(2x^2+1)/(x^2-3)", 1, 2),
+    ("exp(-x)", 1, 0),
+    ("exp(-x)", -1, sp.oo),
+    ("atan(x)", -1, -sp.pi / 2),
+    ("sin(x)/x", 1, 0),
+    ("(1+1/x)^x", 1, sp.E),
+])
+def test_limite_infinito(texto, signo, esperado):
+    assert limite_infinito(parsear(texto), X, signo) == esperado
+
+
+@pytest.mark.parametrize("texto, punto, lado, esperado", [
+    ("1/x", 0, 1, sp.oo),
+    ("1/x", 0, -1, -sp.oo),
+    ("exp(-1/x)", 0, 1, 0),
+    ("sin(x)/x", 0, -1, 1),
+])
+def test_limite_lateral(texto, punto, lado, esperado):
+    assert limite_lateral(parsear(texto), X, sp.S(punto), lado) == esperado
+
+
+def test_limite_omitido_no_queda_en_cache():
+    funcion = parsear("sqrt(x^2+x) - x")
+    asintotas.limpiar_caches()
+    en_hilo = []
+    hilo = threading.Thread(target=lambda: en_hilo.append(limite_infinito(funcion, X, 1)))
+    hilo.start()
+    hilo.join()
+    assert en_hilo == [None]
+    assert limite_infinito(funcion, X, 1) == sp.Rational(1, 2)
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("sqrt(x)", "[0, ∞)"),
+    ("exp(x)", "(0, ∞)"),
+    ("atan(x)", "(-π/2, π/2)"),
+    ("exp(-1/x)", "(0, 1) ∪ (1, ∞)"),
+    ("-3*sqrt(x+2)", "(-∞, 0]"),
+    ("acos(x)", "[0, π]"),
+    ("cbrt(x-1) + 2", "ℝ"),
+    ("1/cbrt(x)", "ℝ \\ {0}"),
+    ("x^(-2/3)", "(0, ∞)"),
+])
+def test_recorrido_monotono(texto, esperado):
+    assert recorrido_monotono(parsear(texto), X).formatear().startswith(esperado)
+
+
+@pytest.mark.parametrize("texto", [
+    "sqrt(x/(x-1))", "1/(exp(x)-1)", "x*exp(-x)", "x^x", "log(log(x))",
+    "log(x^2-1)", "sqrt(4-x^2)", "exp(-x^2)",
+])
+def test_sin_monotonia_no_usa_limites(texto):
+    assert recorrido_monotono(parsear(texto), X) is None
+
+
+@pytest.mark.parametrize("texto, descartado", [
+    ("sqrt(x/(x-1))", "{1}"),
+    ("exp(-1/x)", "{1}"),
+    ("x*exp(-x)", "(-∞, 0)"),
+    ("x^x", "(0, ∞)"),
+    ("log(log(x))", "oo"),
+])
+def test_recorrido_no_confunde_limites_con_imagen(texto, descartado):
+    analizador = AnalizadorFunciones()
+    assert analizador.parsear_funcion(texto)
+    recorrido = analizador.calcular_recorrido()
+    assert not recorrido.startswith(descartado)
+    assert "Recorrido:" not in recorrido
+
+
+@pytest.mark.parametrize("texto", ["1/sin(x)", "1/(exp(x)-1)", "log(log(x))", "tan(x^2)"])
+def test_busqueda_incompleta_no_dice_no_tiene(texto):
+    descripcion = calcular_asintotas(parsear(texto), X).describir()
+    assert descripcion != "No tiene"
+    assert "no determinadas automáticamente" in descripcion
+
+
+def test_asintotas_conocidas():
+    racional = calcular_asintotas(parsear("(x^2+1)/(x-1)"), X)
+    assert racional.verticales == (1,)
+    assert racional.oblicuas[1] == (1, 1)
+
+    tangente = calcular_asintotas(parsear("tan(x)"), X)
+    assert tangente.periodicas == ((sp.pi / 2, sp.pi),)
+    assert tangente.polos_en(-2, 2) == pytest.approx([-math.pi / 2, math.pi / 2])
+
+    assert calcular_asintotas(parsear("sqrt(x)"), X).describir() == "No tiene"
+
+
+def test_sin_horizontal_fuera_del_dominio():
+    potencia = calcular_asintotas(parsear("x^x"), X)
+    assert -1 not in potencia.horizontales
+    assert -1 not in potencia.oblicuas
+    assert calcular_asintotas(parsear("exp(x)"), X).horizontales == {-1: 0}
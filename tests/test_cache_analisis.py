@@ -0,0 +1,59 @@
+"""Pruebas de la caché persistente de análisis."""
+
+import sqlite3
+
+from analizador import AnalizadorFunciones
+from cache_analisis import CacheAnalisis
+
+
+def _usos(ruta):
+    with sqlite3.connect(ruta) as conexion:
+        return dict(conexion.execute("SELECT clave, ultimo_uso FROM analisis"))
+
+
+def test_guardar_y_obtener(tmp_path):
+    cache = CacheAnalisis(str(tmp_path / "cache.sqlite3"))
+    cache.guardar("a", {"dominio": "ℝ", "intersecciones": ([1.0], 0.0), "derivada": object()})
+    assert cache.obtener("a") == {"dominio": "ℝ", "intersecciones": ([1.0], 0.0)}
+    assert cache.obtener("b") == {}
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+    cache.cerrar()
+
+
+def test_lectura_no_escribe_hasta_guardar_o_cerrar(tmp_path):
+    ruta = str(tmp_path / "cache.sqlite3")
+    cache = CacheAnalisis(ruta)
+    cache.guardar("a", {"dominio": "ℝ"})
+    guardado = _usos(ruta)["a"]
+
+    cache.obtener("a")
+    assert _usos(ruta)["a"] == guardado
+    cache.cerrar()
+    assert _usos(ruta)["a"] > guardado
+
+
+def test_expulsion_lru(tmp_path):
+    cache = CacheAnalisis(str(tmp_path / "cache.sqlite3"), max_entradas=2)
+    cache.guardar("a", {"dominio": "ℝ"})
+    cache.guardar("b", {"dominio": "ℝ"})
+    cache.obtener("a")
+    cache.guardar("c", {"dominio": "ℝ"})
+    assert cache.obtener("a") and cache.obtener("c")
+    assert cache.obtener("b") == {}
+    cache.cerrar()
+
+
+def test_analisis_reutiliza_etapas_guardadas(tmp_path):
+    ruta = str(tmp_path / "cache.sqlite3")
+    primero = AnalizadorFunciones(cache=CacheAnalisis(ruta))
+    primero.parsear_funcion("x^2 - 1")
+    dominio = primero.analizar().dominio
+    primero.analizar().derivada
+    primero.cache.cerrar()
+
+    segundo = AnalizadorFunciones(cache=CacheAnalisis(ruta))
+    segundo.parsear_funcion("x^2 - 1")
+    resultado = segundo.analizar()
+    assert resultado.estados == {"dominio": "ok"}
+    assert resultado.dominio == dominio
+    segundo.cache.cerrar()
@@ -0,0 +1,50 @@
+"""Pruebas de la forma canónica y de las claves de caché."""
+
+import sympy as sp
+
+from analizador import AnalizadorFunciones, convertir_expresion
+from cache_analisis import clave_expresion
+from canonico import TABLA, canonizar, forma_canonica
+from parseador import X
+
+
+def test_la_expresion_conserva_la_forma_escrita():
+    funcion = convertir_expresion("1/(x-1)^2")
+    assert funcion == (X - 1)**-2
+
+    analizador = AnalizadorFunciones()
+    assert analizador.parsear_funcion("1/(x-1)^2")
+    assert analizador.funcion_sympy == (X - 1)**-2
+    assert analizador.analizar().derivada == -2/(X - 1)**3
+
+
+def test_formas_equivalentes_comparten_clave():
+    assert (clave_expresion(convertir_expresion("(x+1)^2"))
+            == clave_expresion(convertir_expresion("x²+2x+1")))
+    assert (clave_expresion(convertir_expresion("1/(x-1)^2"))
+            == clave_expresion(convertir_expresion("1/(x^2-2x+1)")))
+    assert clave_expresion(convertir_expresion("x^2")) != clave_expresion(convertir_expresion("x^3"))
+
+
+def test_forma_equivalente_hereda_etapas_compartidas():
+    analizador = AnalizadorFunciones()
+    analizador.parsear_funcion("(x+1)^2")
+    dominio = analizador.analizar().dominio
+
+    analizador.parsear_funcion("x^2+2x+1")
+    resultado = analizador.analizar()
+    assert "dominio" in resultado.estados
+    assert "derivada" not in resultado.estados
+    assert resultado.dominio == dominio
+    assert resultado.derivada == 2*X + 2
+
+
+def test_forma_canonica_conserva_huecos():
+    canonica = forma_canonica((X**2 - 4)/(X - 2))
+    assert sp.fraction(canonica)[1] == X - 2
+
+
+def test_internado_devuelve_el_mismo_objeto():
+    assert canonizar((X + 1)**2) is canonizar(X**2 + 2*X + 1)
+    assert TABLA.internar(sp.sin(X) + 1) is TABLA.internar(sp.sin(X) + 1)
+    assert convertir_expresion("sin(x)") is convertir_expresion(" sin(x) ")
@@ -0,0 +1,51 @@
+"""Pruebas del dominio por conjuntos de intervalos."""
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from dominio import ConjuntoReal, Intervalo, dominio_rapido
+from muestreo import evaluar_malla
+from parseador import X, parsear
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("(x^2-4)/(x-2)", "ℝ \\ {2}"),
+    ("sqrt(x)", "[0, ∞)"),
+    ("sqrt(4-x^2)", "[-2, 2]"),
+    ("log(x^2-1)", "(-∞, -1) ∪ (1, ∞)"),
+    ("sqrt(x/(x-1))", "(-∞, 0] ∪ (1, ∞)"),
+    ("1/(x^2+1)", "ℝ"),
+    ("tan(x)", "ℝ \\ {π/2 + π·k : k ∈ ℤ}"),
+    ("tan(x/3)", "ℝ \\ {3π/2 + 3π·k : k ∈ ℤ}"),
+    ("csc(pi x)", "ℝ \\ {k : k ∈ ℤ}"),
+    ("x^(1/3)", "ℝ"),
+    ("cbrt(x)", "ℝ"),
+    ("x^(2/3)", "ℝ"),
+    ("x^(-1/3)", "ℝ \\ {0}"),
+    ("x^(3/2)", "[0, ∞)"),
+    ("x^(-1/2)", "(0, ∞)"),
+])
+def test_dominio_rapido(texto, esperado):
+    assert dominio_rapido(parsear(texto), X).formatear().startswith(esperado)
+
+
+def test_dominio_no_soportado():
+    assert dominio_rapido(parsear("log(log(x))"), X) is None
+
+
+def test_operaciones_de_conjuntos():
+    positivos = ConjuntoReal([Intervalo(0, sp.oo, abierto_inf=False)])
+    acotado = ConjuntoReal([Intervalo(-1, 1)])
+    interseccion = positivos.interseccion(acotado)
+    assert interseccion.contiene(0)
+    assert not interseccion.contiene(1)
+    assert not interseccion.sin_puntos([sp.Rational(1, 2)]).contiene(0.5)
+    assert ConjuntoReal.reales().es_reales()
+
+
+def test_raiz_impar_se_evalua_con_base_negativa():
+    xs = np.array([-8.0, 8.0])
+    assert evaluar_malla(parsear("cbrt(x)"), xs, X) == pytest.approx([-2, 2])
+    assert evaluar_malla(parsear("x^(2/3)"), xs, X) == pytest.approx([4, 4])
+    assert np.isnan(evaluar_malla(parsear("sqrt(x)"), xs, X)[0])
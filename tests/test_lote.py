@@ -0,0 +1,27 @@
+"""Pruebas del análisis por lotes y en flujo."""
+
+from lote import analizar_flujo, analizar_lote
+
+
+def test_lote_informa_errores_sin_detenerse():
+    registros = list(analizar_lote(["x^2", "3..2", "x+1"], procesos=1))
+    assert [registro["ok"] for registro in registros] == [True, False, True]
+    assert registros[0]["recorrido"].startswith("[0, ∞)")
+
+
+
+def test_etapa_que_excede_el_presupuesto_produce_error():
+    registros = list(analizar_lote(["sin(x)/x", "x^2"], procesos=1, tiempo_s=1e-4))
+    agotado, siguiente = registros
+    assert not agotado["ok"]
+    assert "Presupuesto excedido en: dominio" in agotado["error"]
+    assert agotado["estados"]["dominio"] == "tiempo_agotado"
+    assert siguiente["ok"]
+
+
+def test_flujo_ordenado_no_espera_a_la_expresion_agotada():
+    registros = list(analizar_flujo(iter([(1, "sin(x)/x"), (2, "x^2")]), procesos=1,
+                                    tiempo_s=1e-4))
+    assert [registro["id"] for registro in registros] == [1, 2]
+    assert "Presupuesto excedido" in registros[0]["error"]
+    assert registros[1]["ok"]
@@ -0,0 +1,21 @@
+"""Pruebas del muestreo adaptativo."""
+
+import numpy as np
+import pytest
+
+from muestreo import muestrear_adaptativo
+from parseador import parsear
+
+
+@pytest.mark.parametrize("expresion", ["tan(x)", "tan(20x)", "floor(x)", "1/x", "x^2"])
+@pytest.mark.parametrize("n_maximo", [11, 101, 601])
+def test_no_supera_n_maximo(expresion, n_maximo):
+    xs, ys = muestrear_adaptativo(parsear(expresion), n_maximo=n_maximo)
+    assert len(xs) == len(ys) <= n_maximo
+    assert np.all(np.diff(xs) >= 0)
+
+
+def test_corta_la_linea_en_los_polos():
+    xs, ys = muestrear_adaptativo(parsear("tan(x)"), n_maximo=101)
+    # Seis polos de tan en [-10, 10]
+    assert np.isnan(ys).sum() == 6
@@ -0,0 +1,47 @@
+"""Pruebas del parseador de expresiones."""
+
+import pytest
+import sympy as sp
+
+from parseador import ErrorSintaxis, X, parsear
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("2x^2 + 3sin(x)", 2 * X**2 + 3 * sp.sin(X)),
+    ("(x+1)(x-1)", (X + 1) * (X - 1)),
+    ("x²", X**2),
+    ("x⁻¹", 1 / X),
+    ("√x", sp.sqrt(X)),
+    ("sin x", sp.sin(X)),
+    ("ln(x)", sp.log(X)),
+    ("2^3^2", sp.Integer(512)),
+    ("-x^2", -X**2),
+    ("1.5e3", sp.Float(1500)),
+    ("e^x", sp.exp(X)),
+])
+def test_expresiones_validas(texto, esperado):
+    assert parsear(texto) == esperado
+
+
+@pytest.mark.parametrize("texto, posicion", [
+    ("3..2", 2),
+    ("1.5.5", 3),
+    ("2 3", 2),
+    ("x^2 3", 4),
+])
+def test_numeros_seguidos_son_error(texto, posicion):
+    with pytest.raises(ErrorSintaxis) as error:
+        parsear(texto)
+    assert error.value.posicion == posicion
+
+
+@pytest.mark.parametrize("texto", ["(x+1", "x+", ")", "", "y", "sin()", "log(x, 2, 3)", "9^9^9"])
+def test_expresiones_invalidas(texto):
+    with pytest.raises(ErrorSintaxis):
+        parsear(texto)
+
+
+def test_error_senala_la_posicion():
+    with pytest.raises(ErrorSintaxis) as error:
+        parsear("(x + 1")
+    assert error.value.senalar() == "(x + 1▸"
@@ -0,0 +1,46 @@
+"""Pruebas del planificador de estrategias por etapa."""
+
+import pytest
+
+from parseador import X, parsear
+from planificador import (ESTRATEGIA_EXACTA, ESTRATEGIA_NUMERICA, ESTRATEGIA_SIMBOLICA,
+                          leer_forzadas, planificar)
+
+
+@pytest.mark.parametrize("texto, dominio, recorrido, intersecciones", [
+    ("x^2 - 3x", ESTRATEGIA_EXACTA, ESTRATEGIA_EXACTA, ESTRATEGIA_EXACTA),
+    ("1/(x-1)", ESTRATEGIA_SIMBOLICA, ESTRATEGIA_EXACTA, ESTRATEGIA_SIMBOLICA),
+    ("sqrt(x) + x", ESTRATEGIA_SIMBOLICA, ESTRATEGIA_SIMBOLICA, ESTRATEGIA_SIMBOLICA),
+    ("sin(x) - 3", ESTRATEGIA_EXACTA, ESTRATEGIA_NUMERICA, ESTRATEGIA_NUMERICA),
+    ("exp(x) + x", ESTRATEGIA_EXACTA, ESTRATEGIA_SIMBOLICA, ESTRATEGIA_NUMERICA),
+    ("x^40 + 1", ESTRATEGIA_EXACTA, ESTRATEGIA_SIMBOLICA, ESTRATEGIA_SIMBOLICA),
+])
+def test_estrategia_por_etapa(texto, dominio, recorrido, intersecciones):
+    plan = planificar(parsear(texto), X)
+    assert plan.estrategia('dominio') == dominio
+    assert plan.estrategia('recorrido') == recorrido
+    assert plan.estrategia('intersecciones') == intersecciones
+
+
+def test_expresion_grande_usa_estrategia_numerica():
+    funcion = parsear(" + ".join(f"sqrt(x+{k})" for k in range(1, 25)))
+    plan = planificar(funcion, X)
+    assert plan.estrategia('dominio') == ESTRATEGIA_NUMERICA
+    assert plan.estrategia('recorrido') == ESTRATEGIA_NUMERICA
+
+
+def test_estrategias_forzadas():
+    forzadas = leer_forzadas("recorrido=numerica")
+    plan = planificar(parsear("x^2"), X, forzadas)
+    assert plan.estrategia('recorrido') == ESTRATEGIA_NUMERICA
+    assert plan.motivo('recorrido') == "forzada"
+    assert plan.estrategia('dominio') == ESTRATEGIA_EXACTA
+    assert "recorrido numérica (forzada)" in plan.resumen()
+
+
+def test_leer_forzadas(capsys):
+    assert leer_forzadas("numerica") == dict.fromkeys(
+        ('dominio', 'recorrido', 'intersecciones'), ESTRATEGIA_NUMERICA)
+    assert leer_forzadas("dominio=exacta, color=numerica") == {'dominio': ESTRATEGIA_EXACTA}
+    assert "color=numerica" in capsys.readouterr().out
+    assert leer_forzadas(None) == {}
@@ -0,0 +1,48 @@
+"""Pruebas del recorrido exacto y de las claves de la caché persistente."""
+
+import pytest
+
+import canonico
+from analizador import _recorrido_numerico
+from cache_analisis import clave_expresion
+from parseador import X, parsear
+from recorrido import describir_recorrido, recorrido_racional
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("x^4 - 2x^2", "[-1, ∞)"),
+    ("(x^2-4)/(x-2)", "ℝ \\ {4}"),
+    ("1/(x^2+1)", "(0, 1]"),
+    ("x + 1/x", "(-∞, -2] ∪ [2, ∞)"),
+    ("x^3", "ℝ"),
+    ("-(x-1)^2 + 3", "(-∞, 3]"),
+    ("1/x", "ℝ \\ {0}"),
+])
+def test_recorrido_exacto(texto, esperado):
+    assert describir_recorrido(parsear(texto), X).startswith(esperado)
+
+
+def test_recorrido_no_racional():
+    assert recorrido_racional(parsear("sin(x)"), X) is None
+    assert describir_recorrido(parsear("sqrt(x)"), X) is None
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("sin(x) - 3", "≈ [-4, -2]"),
+    ("cos(x)/2 - 7", "≈ [-7.5, -6.5]"),
+    ("exp(-x^2) - 5", "≈ [-5, -4]"),
+    ("tan(x)", "≈ (-∞, ∞)"),
+])
+def test_recorrido_numerico(texto, esperado):
+    assert _recorrido_numerico(parsear(texto), X).startswith(esperado + " (estimación numérica")
+
+
+def test_clave_depende_de_la_version_del_motor(monkeypatch):
+    funcion = parsear("x^2 + 1")
+    clave = clave_expresion(funcion)
+    canonico.limpiar_caches()
+    monkeypatch.setattr(canonico, "VERSION_MOTOR", canonico.VERSION_MOTOR + 1)
+    try:
+        assert clave_expresion(funcion) != clave
+    finally:
+        canonico.limpiar_caches()
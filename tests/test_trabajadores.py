@@ -0,0 +1,39 @@
+"""Pruebas del pool de procesos trabajadores con presupuesto."""
+
+import math
+import time
+
+import pytest
+
+import trabajadores
+from trabajadores import (ESTADO_ERROR, ESTADO_OK, ESTADO_TIEMPO_AGOTADO, PoolTrabajadores)
+
+
+@pytest.fixture
+def pool():
+    pool = PoolTrabajadores(n_procesos=1, tiempo_s=5)
+    yield pool
+    pool.cerrar()
+
+
+def test_ejecuta_y_agota_tiempo(pool):
+    assert pool.ejecutar(math.factorial, 5).valor == 120
+    agotado = pool.ejecutar(time.sleep, 5, tiempo_s=0.3)
+    assert agotado.estado == ESTADO_TIEMPO_AGOTADO
+    # El trabajador muerto se reemplaza
+    assert pool.ejecutar(math.factorial, 4).estado == ESTADO_OK
+
+
+def test_error_local_recicla_al_trabajador(pool):
+    fallido = pool.ejecutar(lambda: None)
+    assert fallido.estado == ESTADO_ERROR
+    assert pool._creados == 0
+    assert pool.ejecutar(math.factorial, 3).valor == 6
+
+
+def test_memoria_sin_medir_se_avisa_una_vez(pool, monkeypatch, capsys):
+    monkeypatch.setattr(trabajadores, "_memoria_residente_mb", lambda pid: None)
+    monkeypatch.setattr(trabajadores, "_aviso_memoria", trabajadores.threading.Event())
+    pool.ejecutar(time.sleep, 0.2)
+    pool.ejecutar(time.sleep, 0.2)
+    assert capsys.readouterr().out.count("Presupuesto de memoria no disponible") == 1
@@ -0,0 +1,265 @@
+"""
+Módulo de Procesos Trabajadores con Presupuesto
+Ejecuta etapas simbólicas costosas (solve, limit, continuous_domain) en
+procesos aparte que se pueden matar:
+- Presupuesto de tiempo real (segundos) por etapa
+- Presupuesto de memoria residente (MB) por proceso (por /proc en Linux o
+  con psutil si está instalado; si no se puede medir, se avisa una vez)
+- Si se excede un presupuesto, el proceso se mata y se reemplaza
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+ESTADO_OK = "ok"
+ESTADO_TIEMPO_AGOTADO = "tiempo_agotado"
+ESTADO_DEGRADADO = "degradado"
+ESTADO_ERROR = "error"
+
+TIEMPO_POR_DEFECTO = 10.0
+MEMORIA_POR_DEFECTO = 1024
+
+# Se avisa una sola vez que el presupuesto de memoria no se puede aplicar
+_aviso_memoria = threading.Event()
+
+
+class ResultadoEtapa:
+    """Resultado de ejecutar una etapa bajo presupuesto."""
+
+    __slots__ = ('estado', 'valor', 'detalle', 'duracion')
+
+    def __init__(self, estado, valor=None, detalle="", duracion=0.0):
+        self.estado = estado
+        self.valor = valor
+        self.detalle = detalle
+        self.duracion = duracion
+
+    @property
+    def ok(self):
+        """bool: True si la etapa terminó dentro del presupuesto."""
+        return self.estado == ESTADO_OK
+
+    def __repr__(self):
+        return f"ResultadoEtapa({self.estado!r}, {self.valor!r}, {self.detalle!r})"
+
+
+def _bucle_trabajador(conexion):
+    """Bucle de un proceso trabajador: recibe tareas y devuelve resultados."""
+    while True:
+        try:
+            tarea = conexion.recv()
+        except (EOFError, OSError):
+            return
+        if tarea is None:
+            return
+
+        funcion, args = tarea
+        try:
+            respuesta = (ESTADO_OK, funcion(*args), "")
+        except MemoryError:
+            respuesta = (ESTADO_DEGRADADO, None, "memoria insuficiente")
+        except Exception as e:
+            respuesta = (ESTADO_ERROR, None, str(e))
+
+        try:
+            conexion.send(respuesta)
+        except Exception as e:
+            # Resultado no serializable
+            conexion.send((ESTADO_ERROR, None, f"resultado no transferible: {e}"))
+
+
+def _memoria_residente_mb(pid):
+    """
+    Devuelve la memoria residente de un proceso en MB, o None si no se puede medir.
+
+    Lee /proc en Linux; en otros sistemas usa psutil si está instalado.
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as archivo:
+            paginas = int(archivo.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+def _avisar_memoria_sin_medir():
+    """Avisa (una vez por proceso) que el presupuesto de memoria no se aplica."""
+    if not _aviso_memoria.is_set():
+        _aviso_memoria.set()
+        print("Presupuesto de memoria no disponible: no se puede medir la memoria de los "
+              "trabajadores en este sistema (instale psutil); solo se aplica el de tiempo")
+
+
+class _Trabajador:
+    """Proceso trabajador con su extremo de comunicación."""
+
+    def __init__(self, contexto):
+        self.conexion, extremo_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=_bucle_trabajador, args=(extremo_hijo,), daemon=True)
+        self.proceso.start()
+        extremo_hijo.close()
+        self.tareas = 0
+
+    def matar(self):
+        """Termina el proceso sin esperar a que acabe su tarea."""
+        try:
+            self.proceso.kill()
+            self.proceso.join(timeout=1)
+        except (OSError, AttributeError, ValueError):
+            pass
+        try:
+            self.conexion.close()
+        except OSError:
+            pass
+
+    def detener(self):
+        """Pide al proceso que termine de forma ordenada."""
+        try:
+            self.conexion.send(None)
+            self.proceso.join(timeout=1)
+        except (OSError, ValueError, BrokenPipeError):
+            pass
+        if self.proceso.is_alive():
+            self.matar()
+
+
+class PoolTrabajadores:
+    """
+    Pool de procesos trabajadores reciclables con presupuesto por etapa.
+
+    Los procesos se crean bajo demanda. Cada llamada a ejecutar() toma un
+    trabajador libre, espera su respuesta vigilando tiempo y memoria, y si
+    se excede el presupuesto lo mata y lo reemplaza por uno nuevo.
+    """
+
+    def __init__(self, n_procesos=2, tiempo_s=TIEMPO_POR_DEFECTO,
+                 memoria_mb=MEMORIA_POR_DEFECTO, max_tareas=200):
+        """
+        Args:
+            n_procesos (int): cantidad máxima de procesos trabajadores
+            tiempo_s (float): presupuesto de tiempo real por etapa
+            memoria_mb (float): presupuesto de memoria residente por proceso
+            max_tareas (int): tareas tras las cuales se recicla un proceso
+        """
+        self.n_procesos = n_procesos
+        self.tiempo_s = tiempo_s
+        self.memoria_mb = memoria_mb
+        self.max_tareas = max_tareas
+        # "spawn" evita heredar hilos (Tk, ejecutor) en el proceso hijo
+        self._contexto = multiprocessing.get_context("spawn")
+        self._libres = queue.Queue()
+        self._creados = 0
+        self._lock = threading.Lock()
+        self._cerrado = False
+
+    def _tomar_trabajador(self):
+        """Devuelve un trabajador libre, creándolo si aún hay cupo."""
+        while True:
+            with self._lock:
+                if self._libres.empty() and self._creados < self.n_procesos:
+                    self._creados += 1
+                    break
+            try:
+                return self._libres.get(timeout=0.1)
+            except queue.Empty:
+                continue  # Revisar si se liberó cupo por un trabajador descartado
+        return _Trabajador(self._contexto)
+
+    def _devolver_trabajador(self, trabajador):
+        """Devuelve un trabajador al pool, reciclándolo si ya hizo muchas tareas."""
+        if self._cerrado:
+            trabajador.detener()
+            return
+        if trabajador.tareas >= self.max_tareas:
+            trabajador.detener()
+            trabajador = _Trabajador(self._contexto)
+        self._libres.put(trabajador)
+
+    def _descartar_trabajador(self, trabajador):
+        """Mata un trabajador y libera su cupo para crear un reemplazo."""
+        trabajador.matar()
+        with self._lock:
+            self._creados -= 1
+
+    def ejecutar(self, funcion, *args, tiempo_s=None, memoria_mb=None):
+        """
+        Ejecuta funcion(*args) en un proceso trabajador bajo presupuesto.
+
+        La función y sus argumentos deben poder serializarse con pickle
+        (funciones definidas a nivel de módulo).
+
+        Args:
+            funcion (callable): función a ejecutar
+            *args: argumentos de la función
+            tiempo_s (float): presupuesto de tiempo; por defecto el del pool
+            memoria_mb (float): presupuesto de memoria; por defecto el del pool
+
+        Returns:
+            ResultadoEtapa: estado, valor y duración de la etapa
+        """
+        if self._cerrado:
+            return ResultadoEtapa(ESTADO_ERROR, detalle="pool cerrado")
+
+        tiempo_s = self.tiempo_s if tiempo_s is None else tiempo_s
+        memoria_mb = self.memoria_mb if memoria_mb is None else memoria_mb
+
+        trabajador = self._tomar_trabajador()
+        inicio = time.perf_counter()
+        try:
+            trabajador.conexion.send((funcion, args))
+            trabajador.tareas += 1
+
+            while True:
+                transcurrido = time.perf_counter() - inicio
+                if trabajador.conexion.poll(min(0.05, max(tiempo_s - transcurrido, 0))):
+                    estado, valor, detalle = trabajador.conexion.recv()
+                    self._devolver_trabajador(trabajador)
+                    return ResultadoEtapa(estado, valor, detalle, time.perf_counter() - inicio)
+
+                transcurrido = time.perf_counter() - inicio
+                if transcurrido >= tiempo_s:
+                    self._descartar_trabajador(trabajador)
+                    return ResultadoEtapa(ESTADO_TIEMPO_AGOTADO,
+                                          detalle=f"excedió {tiempo_s:g} s", duracion=transcurrido)
+
+                memoria = _memoria_residente_mb(trabajador.proceso.pid)
+                if memoria is None and trabajador.proceso.is_alive():
+                    _avisar_memoria_sin_medir()
+                elif memoria is not None and memoria > memoria_mb:
+                    self._descartar_trabajador(trabajador)
+                    return ResultadoEtapa(ESTADO_DEGRADADO,
+                                          detalle=f"excedió {memoria_mb:g} MB", duracion=transcurrido)
+
+                if not trabajador.proceso.is_alive():
+                    self._descartar_trabajador(trabajador)
+                    return ResultadoEtapa(ESTADO_ERROR, detalle="el proceso trabajador terminó",
+                                          duracion=transcurrido)
+
+        except (EOFError, OSError, BrokenPipeError) as e:
+            self._descartar_trabajador(trabajador)
+            return ResultadoEtapa(ESTADO_ERROR, detalle=str(e), duracion=time.perf_counter() - inicio)
+        except Exception as e:
+            # Tarea no serializable u otro error local: la tarea pudo haberse enviado
+            # y su respuesta quedaría en el canal, así que el trabajador se reemplaza
+            self._descartar_trabajador(trabajador)
+            return ResultadoEtapa(ESTADO_ERROR, detalle=str(e), duracion=time.perf_counter() - inicio)
+
+    def cerrar(self):
+        """Detiene todos los procesos trabajadores libres."""
+        self._cerrado = True
+        while True:
+            try:
+                self._libres.get_nowait().detener()
+            except queue.Empty:
+                break
@@ -0,0 +1,182 @@
+"""
+Módulo Vigilante del Hilo Principal de Tk
+Detecta bloqueos de la interfaz gráfica:
+- Latidos periódicos con root.after miden la latencia del bucle de eventos
+- Un hilo de fondo detecta cuando el hilo principal no responde
+- Se captura la pila de Python del hilo bloqueado junto con la expresión en curso
+- Cada bloqueo se registra en un archivo JSON Lines y en las métricas
+
+Variables de entorno:
+    EID_VIGILANTE_UMBRAL_MS: duración mínima de un bloqueo (por defecto 500 ms)
+    EID_VIGILANTE_LOG: archivo del registro de bloqueos
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+
+from metricas import METRICAS
+
+UMBRAL_POR_DEFECTO = 0.5
+INTERVALO_LATIDO_MS = 100
+MAX_MUESTRAS_PILA = 5
+
+
+def ruta_registro_por_defecto():
+    """
+    Devuelve la ruta del registro de bloqueos.
+
+    Usa EID_VIGILANTE_LOG si está definida; si no, el mismo directorio de la
+    caché de análisis (EID_CACHE_DIR o ~/.cache/eid-algebra).
+
+    Returns:
+        str: ruta del archivo JSON Lines
+    """
+    ruta = os.environ.get("EID_VIGILANTE_LOG")
+    if ruta:
+        return ruta
+    directorio = os.environ.get("EID_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "eid-algebra")
+    return os.path.join(directorio, "bloqueos.jsonl")
+
+
+def _umbral_de_entorno():
+    """Lee el umbral de EID_VIGILANTE_UMBRAL_MS, en segundos."""
+    try:
+        return max(0.05, float(os.environ["EID_VIGILANTE_UMBRAL_MS"]) / 1000)
+    except (KeyError, ValueError):
+        return UMBRAL_POR_DEFECTO
+
+
+class VigilanteHilo:
+    """Vigila que el hilo de Tk siga atendiendo eventos y registra sus bloqueos."""
+
+    def __init__(self, root, umbral_s=None, contexto=None, ruta_log=None,
+                 intervalo_ms=INTERVALO_LATIDO_MS):
+        """
+        Args:
+            root: ventana raíz de Tk
+            umbral_s (float): segundos sin latidos para considerar un bloqueo;
+                None usa EID_VIGILANTE_UMBRAL_MS o 0.5 s
+            contexto (callable): devuelve la expresión en proceso; se llama
+                desde el hilo vigilante, así que no debe tocar widgets de Tk
+            ruta_log (str): archivo del registro; None usa ruta_registro_por_defecto()
+            intervalo_ms (int): cada cuánto se programa un latido
+        """
+        self.root = root
+        self.umbral_s = _umbral_de_entorno() if umbral_s is None else umbral_s
+        self.contexto = contexto
+        self.ruta_log = ruta_log or ruta_registro_por_defecto()
+        self.intervalo_ms = intervalo_ms
+        self.bloqueos = 0
+
+        self._hilo_principal = threading.main_thread().ident
+        self._ultimo_latido = time.monotonic()
+        self._after_id = None
+        self._detener = threading.Event()
+        self._hilo = None
+        self._bloqueo = None  # bloqueo en curso: datos y muestras de pila
+        self._latido_previo = None  # último latido antes del bloqueo en curso
+
+    def iniciar(self):
+        """Comienza los latidos y el hilo vigilante (debe llamarse desde el hilo de Tk)."""
+        if self._hilo is not None:
+            return
+        self._hilo_principal = threading.get_ident()
+        self._ultimo_latido = time.monotonic()
+        self._programar_latido()
+        self._hilo = threading.Thread(target=self._vigilar, name="vigilante", daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        """Detiene los latidos y el hilo vigilante."""
+        self._detener.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _programar_latido(self):
+        """Programa el próximo latido en el bucle de eventos de Tk."""
+        esperado = time.monotonic() + self.intervalo_ms / 1000
+        try:
+            self._after_id = self.root.after(self.intervalo_ms, lambda: self._latido(esperado))
+        except Exception:
+            self._after_id = None
+
+    def _latido(self, esperado):
+        """Registra la latencia del bucle de eventos (cuánto se atrasó el latido)."""
+        ahora = time.monotonic()
+        self._ultimo_latido = ahora
+        METRICAS.registrar_tiempo("ui.latencia", max(0.0, ahora - esperado))
+        if not self._detener.is_set():
+            self._programar_latido()
+
+    def _vigilar(self):
+        """Bucle del hilo vigilante: detecta bloqueos y toma muestras de la pila."""
+        paso = min(self.umbral_s / 4, 0.1)
+        while not self._detener.wait(paso):
+            sin_latido = time.monotonic() - self._ultimo_latido
+            bloqueo = self._bloqueo
+
+            if sin_latido >= self.umbral_s:
+                if bloqueo is None:
+                    self._iniciar_bloqueo(sin_latido)
+                elif (len(bloqueo["pilas"]) < MAX_MUESTRAS_PILA
+                      and sin_latido >= self.umbral_s * 2 ** len(bloqueo["pilas"])):
+                    # La pila puede cambiar durante un bloqueo largo
+                    bloqueo["pilas"].append(self._capturar_pila(sin_latido))
+            elif bloqueo is not None:
+                self._terminar_bloqueo()
+
+    def _capturar_pila(self, sin_latido):
+        """Toma la pila de Python actual del hilo de Tk."""
+        marco = sys._current_frames().get(self._hilo_principal)
+        pila = traceback.format_stack(marco) if marco is not None else []
+        return {"a_los_s": round(sin_latido, 3), "pila": [linea.rstrip() for linea in pila]}
+
+    def _iniciar_bloqueo(self, sin_latido):
+        """Registra el comienzo de un bloqueo con la primera muestra de pila."""
+        expresion = None
+        if self.contexto is not None:
+            try:
+                expresion = self.contexto()
+            except Exception:
+                pass
+        self._latido_previo = time.monotonic() - sin_latido
+        self._bloqueo = {
+            "inicio": time.time() - sin_latido,
+            "expresion": expresion,
+            "pilas": [self._capturar_pila(sin_latido)],
+        }
+        self.bloqueos += 1
+        METRICAS.contar("ui.bloqueos")
+        # Se registra enseguida por si la ventana no vuelve a responder
+        self._escribir({"evento": "bloqueo", **self._bloqueo})
+        ultima = self._bloqueo["pilas"][0]["pila"][-1:] or ["pila no disponible"]
+        print(f"Interfaz bloqueada más de {self.umbral_s * 1000:.0f} ms "
+              f"(f(x) = {expresion}): {ultima[0].strip()}", file=sys.stderr)
+
+    def _terminar_bloqueo(self):
+        """Registra la duración total del bloqueo y todas sus muestras de pila."""
+        bloqueo, self._bloqueo = self._bloqueo, None
+        # Tiempo entre el último latido antes del bloqueo y el primero después
+        duracion = max(self._ultimo_latido - self._latido_previo, self.umbral_s)
+        METRICAS.registrar_tiempo("ui.bloqueo", duracion, expresion=bloqueo["expresion"])
+        self._escribir({"evento": "fin_bloqueo", "duracion_s": round(duracion, 3), **bloqueo})
+
+    def _escribir(self, registro):
+        """Agrega un registro al archivo JSON Lines."""
+        try:
+            directorio = os.path.dirname(self.ruta_log)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            with open(self.ruta_log, "a", encoding="utf-8") as archivo:
+                archivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+        except OSError as e:
+            print(f"Error al registrar bloqueo: {e}", file=sys.stderr)